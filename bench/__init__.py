@@ -0,0 +1 @@
+# untuk init package
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+Mengukur memori AST hasil ASTBuilder.build pada korpus sintetis (bench.corpus)
+dengan sekitar --statements statement.
+
+Token disimpan sebagai TokenStream (tokenize_compact) dan parse tree sebagai
+ParseTreeArena; keduanya dibuat sebelum pengukuran dan tidak ikut dihitung.
+Yang diukur hanya memori yang masih dialokasikan setelah build selesai
+(tracemalloc), yaitu node AST beserta list dan string yang dipegangnya.
+
+Penggunaan:
+    python -m bench.ast_memory [--statements N] [--seed N]
+"""
+import argparse
+import gc
+import logging
+import time
+import tracemalloc
+
+from bench.corpus import generate
+from src.common.parse_tree_arena import ParseTreeArena
+from src.lexer.dfa_cache import load_compiled_dfa
+from src.lexer.lexer import Lexer
+from src.parser.parser import Parser
+from src.semantic.ast import ASTNode, Statement
+from src.semantic.ast_builder import ASTBuilder
+from src.semantic.traversal import walk_preorder
+
+# Perkiraan rata-rata karakter per statement pada korpus sintetis.
+CHARS_PER_STATEMENT = 37
+
+
+def count_nodes(root: ASTNode) -> tuple[int, int]:
+    """(jumlah node, jumlah statement) di AST `root`."""
+    nodes = statements = 0
+    for node in walk_preorder(root):
+        nodes += 1
+        statements += isinstance(node, Statement)
+    return nodes, statements
+
+
+def measure(tree) -> tuple[int, float, ASTNode]:
+    """Membangun AST dari parse tree `tree`; mengembalikan (byte yang tertahan, detik, AST)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    ast = ASTBuilder().build(tree)
+    seconds = time.perf_counter() - start
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return retained, seconds, ast
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--statements", type=int, default=1_000_000)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    source = generate(args.statements * CHARS_PER_STATEMENT, args.seed)
+    tokens = Lexer(source, load_compiled_dfa()).tokenize_compact()
+    del source
+    tree = Parser(tokens, arena=ParseTreeArena(tokens)).parse_program()
+    print(f"corpus   : {len(tokens):,} tokens")
+
+    retained, seconds, ast = measure(tree)
+    nodes, statements = count_nodes(ast)
+    print(f"AST      : {statements:,} statements, {nodes:,} nodes")
+    print(f"memori   : {retained / 2**20:.1f} MiB  {retained / nodes:.1f} byte/node  "
+          f"(build {seconds:.2f} s, dengan tracemalloc)")
+
+
+if __name__ == "__main__":
+    main()
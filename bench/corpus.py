@@ -0,0 +1,241 @@
+"""
+Generator korpus Pascal-S sintetis (keyword bahasa Indonesia) untuk benchmark.
+
+Korpus berupa satu program valid: header, konstanta, tipe larik, variabel
+global, lalu prosedur/fungsi berulang sampai ukuran yang diminta tercapai,
+dan blok utama mulai ... selesai. Isinya mencampur komentar { } dan (* *),
+string dengan kutip ganda (''), bilangan real dengan eksponen, operator kata
+(bagi, mod, dan, atau, tidak), serta jika/selama/untuk.
+
+Generator deterministik untuk seed yang sama dan menulis korpus per potongan,
+sehingga korpus ratusan MB bisa dibuat tanpa menampung seluruh teks di memori.
+
+Penggunaan:
+    python -m bench.corpus SIZE [-o file.pas] [--seed N]
+
+SIZE berupa jumlah karakter dengan sufiks opsional K/M/G (mis. 1K, 64M, 500M).
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+from typing import Iterator, TextIO
+
+SIZE_UNITS = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+INT_VARS = [f"i{n}" for n in range(8)]
+REAL_VARS = [f"r{n}" for n in range(4)]
+BOOL_VARS = [f"b{n}" for n in range(4)]
+WORDS = ["nilai", "jumlah", "data", "hasil", "baris", "kolom", "indeks", "total"]
+
+
+def parse_size(text: str) -> int:
+    """
+    Mengubah ukuran seperti '1K', '64M' atau '1500' menjadi jumlah karakter.
+
+    Args:
+        text (str): Angka dengan sufiks opsional K/M/G (kelipatan 1024).
+
+    Returns:
+        int: Ukuran dalam karakter.
+    """
+    text = text.strip().upper()
+    unit = SIZE_UNITS.get(text[-1:], 1)
+    if unit != 1:
+        text = text[:-1]
+    return int(float(text) * unit)
+
+
+class CorpusGenerator:
+    """Pembuat teks program Pascal-S acak yang deterministik untuk satu seed."""
+
+    def __init__(self, seed: int = 0):
+        self.rnd = random.Random(seed)
+
+    def real(self) -> str:
+        rnd = self.rnd
+        mantissa = f"{rnd.randint(0, 999)}.{rnd.randint(0, 999)}"
+        form = rnd.randrange(4)
+        if form == 0:
+            return mantissa
+        if form == 1:
+            return f"{mantissa}E{rnd.choice(('+', '-', ''))}{rnd.randint(0, 12)}"
+        if form == 2:
+            return f"{rnd.randint(1, 9)}e{rnd.randint(1, 5)}"
+        return f"{rnd.randint(1, 9)}E-{rnd.randint(1, 5)}"
+
+    def string(self) -> str:
+        words = self.rnd.sample(WORDS, self.rnd.randint(1, 4))
+        if self.rnd.random() < 0.3:
+            words.append("''kutip''")
+        return "'" + " ".join(words) + "'"
+
+    def comment(self) -> str:
+        text = " ".join(self.rnd.sample(WORDS, 3))
+        if self.rnd.random() < 0.5:
+            return "{ " + text + " }"
+        return "(* " + text + " *)"
+
+    def int_expr(self, names: list[str]) -> str:
+        rnd = self.rnd
+        a, b = rnd.choice(names), rnd.choice(names)
+        op = rnd.choice(("+", "-", "*", "bagi", "mod"))
+        right = str(rnd.randint(1, 9)) if op in ("bagi", "mod") else b
+        return f"({a} {op} {right}) + {rnd.randint(0, 1000)}"
+
+    def bool_expr(self, names: list[str]) -> str:
+        rnd = self.rnd
+        a, b = rnd.choice(names), rnd.choice(names)
+        rel = rnd.choice(("<", "<=", ">", ">=", "=", "<>"))
+        logic = rnd.choice(("dan", "atau"))
+        return f"({a} {rel} {b}) {logic} tidak {rnd.choice(BOOL_VARS)}"
+
+    def statement(self, ints: list[str], indent: str, depth: int = 0) -> str:
+        rnd = self.rnd
+        kind = rnd.randrange(9 if depth < 2 else 5)
+        if kind == 0:
+            return f"{indent}{rnd.choice(ints)} := {self.int_expr(ints)}"
+        if kind == 1:
+            r = rnd.choice(REAL_VARS)
+            return f"{indent}{r} := {r} * {self.real()} + {self.real()}"
+        if kind == 2:
+            return f"{indent}{rnd.choice(BOOL_VARS)} := {self.bool_expr(ints)}"
+        if kind == 3:
+            return f"{indent}writeln({self.string()}, {rnd.choice(ints)})"
+        if kind == 4:
+            return f"{indent}vektor[{rnd.randint(1, 100)}] := {rnd.choice(REAL_VARS)} / {self.real()}"
+        inner = indent + "  "
+        if kind == 5:
+            return (f"{indent}jika {self.bool_expr(ints)} maka\n"
+                    f"{self.statement(ints, inner, depth + 1)}\n"
+                    f"{indent}selain_itu\n"
+                    f"{self.statement(ints, inner, depth + 1)}")
+        if kind == 6:
+            return (f"{indent}selama {rnd.choice(ints)} < {rnd.randint(10, 99)} lakukan\n"
+                    f"{self.statement(ints, inner, depth + 1)}")
+        body = self.block(ints, inner, rnd.randint(2, 4), depth + 1)
+        if kind == 7:
+            return (f"{indent}untuk {rnd.choice(ints)} := 1 {rnd.choice(('ke', 'turun_ke'))} "
+                    f"{rnd.randint(2, 50)} lakukan\n{body}")
+        return f"{indent}{self.comment()}\n{body}"
+
+    def block(self, ints: list[str], indent: str, count: int, depth: int = 0) -> str:
+        lines = [f"{indent}mulai"]
+        for _ in range(count):
+            lines.append(self.statement(ints, indent + "  ", depth) + ";")
+        lines.append(f"{indent}selesai")
+        return "\n".join(lines)
+
+    def header(self) -> str:
+        return ("program Korpus;\n"
+                "{ korpus benchmark sintetis }\n"
+                "konstanta\n"
+                f"  BATAS = {self.rnd.randint(10, 100)};\n"
+                f"  SKALA = {self.real()};\n"
+                "tipe\n"
+                "  Tabel = larik [1..100] dari real;\n"
+                "variabel\n"
+                f"  {', '.join(INT_VARS)}: integer;\n"
+                f"  {', '.join(REAL_VARS)}: real;\n"
+                f"  {', '.join(BOOL_VARS)}: boolean;\n"
+                "  huruf: char;\n"
+                "  vektor: larik [1..100] dari real;\n\n")
+
+    def subprogram(self, number: int) -> str:
+        rnd = self.rnd
+        locals_ = ["k", "m"]
+        ints = INT_VARS + locals_
+        body = self.block(ints, "", rnd.randint(4, 12))
+        decls = f"variabel\n  {', '.join(locals_)}: integer;\n"
+        if rnd.random() < 0.5:
+            return f"prosedur proses{number}(a, b: integer; x: real);\n{decls}{body};\n\n"
+        return (f"fungsi hitung{number}(a: integer): integer;\n{decls}"
+                f"{body[:-len('selesai')]}  hitung{number} := a * {rnd.randint(2, 9)}\nselesai;\n\n")
+
+    def main_block(self) -> str:
+        return self.block(INT_VARS, "", 6) + ".\n"
+
+    def chunks(self, size: int) -> Iterator[str]:
+        """
+        Menghasilkan potongan teks program berurutan dengan total sekitar `size` karakter.
+
+        Args:
+            size (int): Ukuran target; hasil bisa melebihi sedikit (satu subprogram).
+        """
+        header, main = self.header(), self.main_block()
+        yield header
+        written = len(header) + len(main)
+        number = 0
+        while written < size:
+            part = self.subprogram(number)
+            number += 1
+            written += len(part)
+            yield part
+        yield main
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Korpus dengan ukuran sekitar `size` karakter sebagai satu string."""
+    return "".join(CorpusGenerator(seed).chunks(size))
+
+
+def program_source(subprograms: int) -> str:
+    """Program dengan banyak prosedur kecil (9 baris per prosedur)."""
+    parts = ["program besar;\nvariabel total: integer;\n"]
+    for i in range(subprograms):
+        parts.append(f"prosedur proses_{i}(a: integer);\nvariabel k: integer;\nmulai\n"
+                     f"  k := a * {i % 7} + total;\n  jika k > {i} maka\n    total := total - k\n"
+                     f"  selain_itu\n    writeln('proses', k)\nselesai;\n")
+    parts.append("mulai\n  proses_0(1)\nselesai.\n")
+    return "".join(parts)
+
+
+def write_corpus(out: TextIO, size: int, seed: int = 0) -> int:
+    """
+    Menulis korpus ke stream `out` per potongan.
+
+    Returns:
+        int: Jumlah karakter yang ditulis.
+    """
+    written = 0
+    for part in CorpusGenerator(seed).chunks(size):
+        out.write(part)
+        written += len(part)
+    return written
+
+
+def corpus_path(size: int, seed: int = 0, cache_dir: str | None = None) -> str:
+    """
+    Path file korpus untuk (size, seed), dibuat sekali lalu dipakai ulang.
+
+    Args:
+        cache_dir (str | None): Direktori cache; default direktori temp sistem.
+    """
+    cache_dir = cache_dir or os.path.join(tempfile.gettempdir(), "pascal-s-bench")
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"korpus-{size}-{seed}.pas")
+    if not os.path.exists(path):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            write_corpus(f, size, seed)
+        os.replace(tmp_path, path)
+    return path
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("size", type=parse_size)
+    arg_parser.add_argument("-o", "--output", help="file tujuan (default stdout)")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    if args.output is None:
+        write_corpus(sys.stdout, args.size, args.seed)
+        return
+    with open(args.output, "w", encoding="utf-8", newline="") as f:
+        written = write_corpus(f, args.size, args.seed)
+    print(f"{args.output}: {written} chars", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
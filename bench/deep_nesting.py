@@ -0,0 +1,102 @@
+"""
+Benchmark program dengan nesting sangat dalam (default sampai 100.000 level):
+Parser, ASTBuilder, ASTParser dan SemanticAnalyzer berjalan dengan stack
+eksplisit (src.common.trampoline), jadi kedalaman tidak dibatasi recursion
+limit dan waktunya harus linear terhadap kedalaman.
+
+Setiap bentuk nesting dibangkitkan pada beberapa kedalaman dan yang dicetak
+adalah waktu per level (us/level) tiap tahap; untuk waktu linear angka ini
+kurang lebih konstan saat kedalaman naik. Lexing tidak diukur. Pencetakan
+pohon (print_tree / print_ast_tree) juga tidak diukur: indentasi tiap baris
+sebanding dengan kedalaman, jadi ukuran output-nya sendiri sudah kuadratik.
+
+Seperti bench.parser, GC dimatikan selama pengukuran (pakai --gc untuk
+mengukur dengan GC aktif).
+
+Penggunaan:
+    python -m bench.deep_nesting [--depths N,N,...] [--shapes bentuk,...] [--repeat N] [--gc]
+"""
+import argparse
+import gc
+import logging
+import time
+
+from src.lexer.dfa_cache import load_compiled_dfa
+from src.lexer.lexer import Lexer
+from src.parser.ast_parser import ASTParser
+from src.parser.parser import Parser
+from src.semantic.ast_builder import ASTBuilder
+from src.semantic.semantic_analyzer import SemanticAnalyzer
+
+HEADER = "program dalam;\nvariabel x: integer; b: boolean;\n"
+
+# bentuk nesting -> pembangkit source untuk kedalaman d
+SHAPES = {
+    "kurung": lambda d: HEADER + "mulai x := " + "(1 + " * d + "1" + ")" * d + " selesai.",
+    "tidak": lambda d: HEADER + "mulai b := " + "tidak " * d + "b selesai.",
+    "mulai": lambda d: HEADER + "mulai " + "mulai " * d + "x := 1" + " selesai" * d + " selesai.",
+    "jika": lambda d: HEADER + "mulai " + "jika b maka " * d + "x := 1 selesai.",
+    "larik": lambda d: "program dalam;\nvariabel a: " + "larik [1..1] dari " * d + "integer;\nmulai selesai.",
+    "prosedur": lambda d: "program dalam;\n" + "prosedur p;\n" * d + "mulai selesai;\n" * d + "mulai selesai.",
+}
+
+
+def best_of(repeat: int, use_gc: bool, fn, *args) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        result = None
+        gc.collect()
+        if not use_gc:
+            gc.disable()
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+        gc.enable()
+    return best, result
+
+
+def parse_tree(tokens):
+    parser = Parser(tokens)
+    tree = parser.parse_program()
+    assert not parser.errors, parser.errors[:3]
+    return tree
+
+
+def analyze(tokens):
+    # anotasi masuk ke SemanticAnalyzer.annotations; yang diukur hanya analisisnya
+    ast = ASTParser(tokens).parse_program()
+    start = time.perf_counter()
+    SemanticAnalyzer().visit(ast)
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--depths", default="12500,25000,50000,100000",
+                            help="kedalaman nesting, dipisah koma")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--shapes", default=",".join(SHAPES),
+                            help="bentuk nesting yang diukur, dipisah koma")
+    arg_parser.add_argument("--gc", action="store_true", help="biarkan GC aktif selama pengukuran")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    dfa = load_compiled_dfa()
+    depths = [int(d) for d in args.depths.split(",")]
+
+    print(f"{'bentuk':<9} {'level':>8} | {'Parser':>7} {'+Builder':>8} {'ASTParser':>9} {'Semantic':>8}   (us/level)")
+    for shape in args.shapes.split(","):
+        for depth in depths:
+            tokens = Lexer(SHAPES[shape](depth), dfa).tokenize()
+            t_tree, tree = best_of(args.repeat, args.gc, parse_tree, tokens)
+            t_build, _ = best_of(args.repeat, args.gc, ASTBuilder().build, tree)
+            t_direct, _ = best_of(args.repeat, args.gc, lambda: ASTParser(tokens).parse_program())
+            tree = None
+            t_semantic = min(best_of(1, args.gc, analyze, tokens)[1] for _ in range(args.repeat))
+            per_level = [t * 1e6 / depth for t in (t_tree, t_build, t_direct, t_semantic)]
+            print(f"{shape:<9} {depth:>8,} | {per_level[0]:>7.2f} {per_level[1]:>8.2f} "
+                  f"{per_level[2]:>9.2f} {per_level[3]:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
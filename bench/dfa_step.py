@@ -0,0 +1,120 @@
+"""
+Benchmark langkah DFA lexer: tabel dict berbasis string (DFA.simulate_dfa_step)
+dibandingkan dengan tabel terkompilasi berindeks integer (CompiledDFA).
+
+Kedua varian menjalankan loop longest-match yang sama di atas korpus yang sama,
+tanpa membangun Token, sehingga yang diukur murni biaya transisi per karakter.
+Di akhir, Lexer.tokenize() juga diukur secara utuh.
+
+Penggunaan:
+    python -m bench.dfa_step [file.pas ...] [--size BYTES] [--repeat N]
+"""
+import argparse
+import glob
+import os
+import logging
+import time
+
+from src.common.errors import LexicalError
+from src.common.utils import load_dfa_rules
+from src.lexer.dfa import DFA, CompiledDFA
+from src.lexer.lexer import Lexer
+
+
+def build_corpus(paths: list[str], size: int, dfa_rules: dict) -> str:
+    """
+    Menggabungkan file sumber yang bebas error leksikal lalu mengulanginya
+    sampai minimal `size` karakter.
+    """
+    chunks = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        try:
+            Lexer(source, dfa_rules, raise_on_error=True).tokenize()
+        except LexicalError:
+            continue
+        chunks.append(source)
+    unit = "\n".join(chunks) + "\n"
+    return unit * max(1, size // len(unit) + 1)
+
+
+def scan_dict(source: str, dfa_rules: dict) -> int:
+    """Longest-match scan dengan DFA.simulate_dfa_step (implementasi lama)."""
+    final_states = dfa_rules["final_states"]
+    initial = dfa_rules["initial_state"]
+    pos, n, count = 0, len(source), 0
+    while pos < n:
+        state, i, last_pos = initial, pos, -1
+        while i < n:
+            state = DFA.simulate_dfa_step(state, source[i], dfa_rules)
+            if state is None:
+                break
+            i += 1
+            if state in final_states:
+                last_pos = i
+        pos = last_pos if last_pos > pos else pos + 1
+        count += 1
+    return count
+
+
+def scan_compiled(source: str, dfa: CompiledDFA) -> int:
+    """Longest-match scan dengan tabel CompiledDFA."""
+    ascii_class = dfa.ascii_class
+    transitions = dfa.transitions
+    is_final = dfa.is_final
+    initial = dfa.initial
+    pos, n, count = 0, len(source), 0
+    while pos < n:
+        state, i, last_pos = initial, pos, -1
+        while i < n:
+            code = ord(source[i])
+            state = transitions[state][ascii_class[code] if code < 128 else dfa.char_class(source[i])]
+            if state < 0:
+                break
+            i += 1
+            if is_final[state]:
+                last_pos = i
+        pos = last_pos if last_pos > pos else pos + 1
+        count += 1
+    return count
+
+
+def best_of(repeat: int, fn, *args) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    default_inputs = sorted(glob.glob(os.path.join(root, "test", "milestone-*", "input", "*.pas")))
+
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("inputs", nargs="*", default=default_inputs)
+    arg_parser.add_argument("--size", type=int, default=1_000_000, help="ukuran korpus (karakter)")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    dfa_rules = load_dfa_rules()
+    source = build_corpus(args.inputs, args.size, dfa_rules)
+    compiled = CompiledDFA(dfa_rules)
+
+    t_dict, n_dict = best_of(args.repeat, scan_dict, source, dfa_rules)
+    t_comp, n_comp = best_of(args.repeat, scan_compiled, source, compiled)
+    assert n_dict == n_comp, "kedua scan harus menghasilkan jumlah lexeme yang sama"
+    t_lex, tokens = best_of(args.repeat, lambda: Lexer(source, dfa_rules).tokenize())
+
+    chars = len(source)
+    print(f"corpus          : {chars} chars, {n_comp} lexemes, {len(tokens)} tokens")
+    print(f"scan (dict)     : {chars / t_dict:>14,.0f} chars/sec")
+    print(f"scan (compiled) : {chars / t_comp:>14,.0f} chars/sec  ({t_dict / t_comp:.2f}x)")
+    print(f"Lexer.tokenize  : {chars / t_lex:>14,.0f} chars/sec")
+
+
+if __name__ == "__main__":
+    main()
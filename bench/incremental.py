@@ -0,0 +1,62 @@
+"""
+Benchmark IncrementalParser.edit per ketikan dibandingkan dengan parse penuh
+(lex + parse) pada program berisi banyak prosedur kecil sekitar --lines baris.
+Kesamaan hasil edit() dengan parse penuh diuji di test/test_incremental.py.
+
+Setiap sesi memilih satu identifier acak lalu mengetik dua huruf di
+belakangnya satu per satu dan menghapusnya kembali, seperti mengganti nama
+variabel di editor: setiap ketikan mengubah token, jadi unit yang memuatnya
+benar-benar di-parse ulang.
+
+Penggunaan:
+    python -m bench.incremental [--lines N] [--sessions N] [--seed N]
+"""
+import argparse
+import logging
+import random
+import time
+
+from bench.corpus import program_source
+from src.common.token_kinds import TokenKind
+from src.lexer.dfa_cache import load_compiled_dfa
+from src.lexer.lexer import Lexer
+from src.parser.incremental import IncrementalParser
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--lines", type=int, default=100_000)
+    arg_parser.add_argument("--sessions", type=int, default=50)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    dfa = load_compiled_dfa()
+    rnd = random.Random(args.seed)
+    source = program_source(args.lines // 9)
+    start = time.perf_counter()
+    parser = IncrementalParser(Lexer(source, dfa))
+    parser.parse_program()
+    full_time = time.perf_counter() - start
+
+    index = parser.lexer.line_index
+    names = [tok for tok in parser.tokens if tok.kind == TokenKind.IDENTIFIER]
+    offsets = sorted({index.offset(tok.line, tok.column) + len(tok.value)
+                      for tok in rnd.sample(names, args.sessions)}, reverse=True)
+    keystrokes = 0
+    start = time.perf_counter()
+    for offset in offsets:
+        for i, char in enumerate("ab"):
+            parser.edit(offset + i, 0, char)
+        for i in reversed(range(2)):
+            parser.edit(offset + i, 1, "")
+        keystrokes += 4
+    edit_time = (time.perf_counter() - start) / keystrokes
+
+    print(f"corpus                         : {source.count(chr(10))} baris")
+    print(f"edit + parse ulang per ketikan : {edit_time * 1e3:10.2f} ms  ({parser.full_parses - 1} parse penuh)")
+    print(f"lex + parse penuh              : {full_time * 1e3:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Microbenchmark klasifikasi keyword pada kode yang didominasi identifier:
+.lower() + tiga set (cara lama) dibandingkan dengan KeywordTable.classify,
+serta Lexer.tokenize utuh pada korpus yang sama.
+
+Penggunaan:
+    python -m bench.keywords [--statements N] [--repeat N] [--seed N]
+"""
+import argparse
+import random
+import time
+
+from src.common.utils import load_dfa_rules
+from src.lexer.keywords import KeywordTable
+from src.lexer.lexer import Lexer
+
+
+def build_source(statements: int, seed: int, dfa_rules: dict) -> str:
+    """Program dengan banyak assignment antar-identifier dan keyword campur huruf besar/kecil."""
+    rnd = random.Random(seed)
+    names = [f"nilai_{i}" for i in range(64)] + ["x", "y", "total", "Indeks", "JUMLAH"]
+    keywords = dfa_rules["KEYWORDS"]
+    lines = ["program bench;", "mulai"]
+    for _ in range(statements):
+        a, b, c = rnd.choice(names), rnd.choice(names), rnd.choice(names)
+        kw = rnd.choice(keywords)
+        if rnd.random() < 0.3:
+            kw = kw.upper()
+        lines.append(f"  {a} := {b} + {c} mod {b} dan {kw};")
+    lines.append("selesai.")
+    return "\n".join(lines) + "\n"
+
+
+def classify_sets(lexemes: list[str], dfa_rules: dict) -> int:
+    keywords = set(dfa_rules["KEYWORDS"])
+    word_arithmetic = set(dfa_rules["WORD_ARITHMETIC"])
+    word_logical = set(dfa_rules["WORD_LOGICAL"])
+    count = 0
+    for lexeme in lexemes:
+        lower = lexeme.lower()
+        if lower in keywords or lower in word_arithmetic or lower in word_logical:
+            count += 1
+    return count
+
+
+def classify_table(lexemes: list[str], table: KeywordTable) -> int:
+    classify = table.classify
+    count = 0
+    for lexeme in lexemes:
+        if classify(lexeme)[1] is not None:
+            count += 1
+    return count
+
+
+def best_of(repeat: int, fn, *args) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--statements", type=int, default=20_000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    dfa_rules = load_dfa_rules()
+    source = build_source(args.statements, args.seed, dfa_rules)
+    tokens = Lexer(source, dfa_rules).tokenize()
+    lexemes = [t.value for t in tokens if t.token_type == "IDENTIFIER" or t.keyword is not None]
+    table = KeywordTable({key: dfa_rules.get(key, []) for key in ("KEYWORDS", "WORD_ARITHMETIC", "WORD_LOGICAL")})
+
+    t_sets, n_sets = best_of(args.repeat, classify_sets, lexemes, dfa_rules)
+    t_table, n_table = best_of(args.repeat, classify_table, lexemes, table)
+    assert n_sets == n_table, "kedua klasifikasi harus menemukan jumlah kata yang sama"
+    t_lex, _ = best_of(args.repeat, lambda: Lexer(source, dfa_rules).tokenize())
+
+    print(f"corpus            : {len(source)} chars, {len(tokens)} tokens, {len(lexemes)} words")
+    print(f"lower + 3 sets    : {len(lexemes) / t_sets:>14,.0f} words/sec")
+    print(f"KeywordTable      : {len(lexemes) / t_table:>14,.0f} words/sec  ({t_sets / t_table:.2f}x)")
+    print(f"Lexer.tokenize    : {len(tokens) / t_lex:>14,.0f} tokens/sec")
+
+
+if __name__ == "__main__":
+    main()
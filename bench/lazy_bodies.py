@@ -0,0 +1,89 @@
+"""
+Benchmark Parser(lazy_bodies=True) pada korpus sintetis (bench.corpus) sekitar
+--tokens token. Lexing tidak ikut diukur.
+
+Yang diukur:
+    outline eager     parse penuh lalu ambil header subprogram top-level
+    outline lazy      parse dengan blok subprogram lazy, header saja (blok tidak dibaca)
+    lazy + semua blok parse lazy lalu seluruh pohon dijalani (semua blok di-parse)
+    AST lazy          ASTBuilder atas pohon lazy (blok di-parse saat dibangun)
+
+Outline lazy harus beberapa kali lebih cepat dari eager karena isi korpus
+didominasi badan prosedur / fungsi; dua baris terakhir menunjukkan biaya
+tambahan mode lazy kalau ternyata semua blok dibutuhkan.
+
+Seperti bench.parser, GC dimatikan selama pengukuran (pakai --gc untuk
+mengukur dengan GC aktif).
+
+Penggunaan:
+    python -m bench.lazy_bodies [--tokens N] [--repeat N] [--seed N] [--gc]
+"""
+import argparse
+import logging
+
+from bench.corpus import generate
+from bench.parser import CHARS_PER_TOKEN, best_of
+from src.lexer.dfa_cache import load_compiled_dfa
+from src.lexer.lexer import Lexer
+from src.parser.parser import Parser
+from src.semantic.ast_builder import ASTBuilder
+
+
+def outline(tree) -> list[tuple[str, str]]:
+    """(jenis, nama) setiap subprogram top-level, tanpa membaca isi <block>-nya."""
+    entries = []
+    for part in tree.children:
+        if part.label != "<declaration-part>":
+            continue
+        for decl in part.children:
+            if decl.label in ("<procedure-declaration>", "<function-declaration>"):
+                entries.append((decl.children[0].token.value, decl.children[1].token.value))
+    return entries
+
+
+def outline_with(tokens, lazy: bool):
+    return outline(Parser(tokens, lazy_bodies=lazy).parse_program())
+
+
+def walk_lazy(tokens) -> int:
+    stack = [Parser(tokens, lazy_bodies=True).parse_program()]
+    count = 0
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children)
+    return count
+
+
+def build_lazy(tokens):
+    return ASTBuilder().build(Parser(tokens, lazy_bodies=True).parse_program())
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--tokens", type=int, default=1_000_000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--gc", action="store_true", help="biarkan GC aktif selama pengukuran")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    dfa = load_compiled_dfa()
+    source = generate(int(args.tokens * CHARS_PER_TOKEN), args.seed)
+    tokens = Lexer(source, dfa).tokenize()
+
+    t_eager, eager = best_of(args.repeat, args.gc, outline_with, tokens, False)
+    t_lazy, lazy = best_of(args.repeat, args.gc, outline_with, tokens, True)
+    assert eager == lazy, "outline lazy berbeda"
+    t_walk, _ = best_of(args.repeat, args.gc, walk_lazy, tokens)
+    t_ast, _ = best_of(args.repeat, args.gc, build_lazy, tokens)
+
+    print(f"corpus           : {len(source)} chars, {len(tokens)} tokens, {len(eager)} subprogram")
+    print(f"outline eager    : {t_eager:8.3f} s")
+    print(f"outline lazy     : {t_lazy:8.3f} s  ({t_eager / t_lazy:.1f}x)")
+    print(f"lazy + semua blok: {t_walk:8.3f} s")
+    print(f"AST lazy         : {t_ast:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Benchmark throughput lexer pada korpus sintetis (bench.corpus) dengan hasil JSON.
+
+Setiap ukuran korpus diukur di proses anak tersendiri agar peak RSS yang
+dilaporkan (ru_maxrss) milik pengukuran itu saja. Per ukuran dilaporkan
+tokens/sec, chars/sec (waktu terbaik dari --repeat kali) dan peak RSS.
+Korpus disimpan di cache (lihat bench.corpus.corpus_path) sehingga waktu
+pembuatan korpus tidak ikut diukur.
+
+Mode:
+    tokenize  Lexer(str).tokenize()          (default)
+    compact   Lexer(str).tokenize_compact()
+    stream    Lexer(file).iter_tokens() tanpa menyimpan token; cocok untuk
+              korpus sangat besar (ratusan MB) karena memori tidak sebanding
+              dengan ukuran file.
+
+Penggunaan:
+    python -m bench.lexer_throughput [--sizes 1K,1M,16M] [--mode MODE] [--repeat N]
+        [--seed N] [--output hasil.json] [--baseline hasil_lama.json]
+
+Dengan --baseline, rasio chars/sec terhadap hasil lama dicetak ke stderr.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from bench.corpus import corpus_path, parse_size
+from src.common.utils import read_source_code
+from src.lexer.dfa_cache import load_compiled_dfa
+from src.lexer.lexer import Lexer
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MODES = ("tokenize", "compact", "stream")
+
+
+def peak_rss_bytes() -> int | None:
+    """Peak RSS proses ini dalam byte, atau None jika tidak tersedia."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KiB, macOS byte.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def lex_once(path: str, mode: str, dfa) -> tuple[int, int]:
+    """Melex file `path` sekali; mengembalikan (jumlah karakter, jumlah token)."""
+    if mode == "stream":
+        tokens = 0
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            for _ in Lexer(f, dfa).iter_tokens():
+                tokens += 1
+        # Korpus sintetis hanya berisi ASCII: jumlah byte = jumlah karakter.
+        return os.path.getsize(path), tokens
+    source = read_source_code(path)
+    lexer = Lexer(source, dfa)
+    result = lexer.tokenize_compact() if mode == "compact" else lexer.tokenize()
+    return len(source), len(result)
+
+
+def measure(path: str, mode: str, repeat: int) -> dict:
+    """Mengukur satu korpus di proses ini (dipanggil di proses anak)."""
+    logging.disable(logging.ERROR)
+    dfa = load_compiled_dfa()
+    best = float("inf")
+    chars = tokens = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chars, tokens = lex_once(path, mode, dfa)
+        best = min(best, time.perf_counter() - start)
+    return {
+        "chars": chars,
+        "tokens": tokens,
+        "seconds": best,
+        "tokens_per_sec": tokens / best,
+        "chars_per_sec": chars / best,
+        "peak_rss_bytes": peak_rss_bytes(),
+    }
+
+
+def run_case(size: int, seed: int, mode: str, repeat: int) -> dict:
+    """Membuat (atau memakai ulang) korpus lalu mengukurnya di proses anak."""
+    path = corpus_path(size, seed)
+    child = subprocess.run(
+        [sys.executable, "-m", "bench.lexer_throughput", "--measure", path, "--mode", mode,
+         "--repeat", str(repeat)],
+        check=True, capture_output=True, text=True,
+    )
+    return {"size": size, **json.loads(child.stdout)}
+
+
+def compare(results: list[dict], baseline: dict):
+    """Mencetak rasio chars/sec terhadap hasil baseline dengan ukuran yang sama."""
+    old = {case["size"]: case for case in baseline.get("results", [])}
+    for case in results:
+        prev = old.get(case["size"])
+        if prev is None:
+            continue
+        ratio = case["chars_per_sec"] / prev["chars_per_sec"]
+        print(f"{case['size']:>12} chars: {ratio:6.2f}x chars/sec dibanding baseline", file=sys.stderr)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", default="1K,64K,1M,8M",
+                            help="daftar ukuran korpus dipisah koma (sufiks K/M/G)")
+    arg_parser.add_argument("--mode", choices=MODES, default="tokenize")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--output", help="file JSON tujuan (default stdout)")
+    arg_parser.add_argument("--baseline", help="file JSON hasil sebelumnya untuk dibandingkan")
+    arg_parser.add_argument("--measure", help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.mode, args.repeat)))
+        return
+
+    results = [run_case(parse_size(size), args.seed, args.mode, args.repeat) for size in args.sizes.split(",")]
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mode": args.mode,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
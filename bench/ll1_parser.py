@@ -0,0 +1,45 @@
+"""
+Benchmark LL1Parser terhadap Parser pada program berisi banyak prosedur kecil
+sekitar --lines baris. Lexing tidak ikut diukur. Kesamaan hasil keduanya diuji
+di test/test_ll1_parser.py.
+
+Seperti bench.parser, GC dimatikan selama pengukuran (pakai --gc untuk
+mengukur dengan GC aktif).
+
+Penggunaan:
+    python -m bench.ll1_parser [--lines N] [--repeat N] [--gc]
+"""
+import argparse
+import logging
+
+from bench.corpus import program_source
+from bench.parser import best_of
+from src.lexer.dfa_cache import load_compiled_dfa
+from src.lexer.lexer import Lexer
+from src.parser.ll1_parser import LL1Parser
+from src.parser.parser import Parser
+
+
+def parse(cls, tokens):
+    return cls(tokens).parse_program()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--lines", type=int, default=100_000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--gc", action="store_true", help="biarkan GC aktif selama pengukuran")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    tokens = Lexer(program_source(args.lines // 9), load_compiled_dfa()).tokenize()
+    t_parser, _ = best_of(args.repeat, args.gc, parse, Parser, tokens)
+    t_ll1, _ = best_of(args.repeat, args.gc, parse, LL1Parser, tokens)
+
+    print(f"corpus    : {len(tokens)} tokens")
+    print(f"Parser    : {len(tokens) / t_parser:>12,.0f} tokens/sec  ({t_parser:.3f} s)")
+    print(f"LL1Parser : {len(tokens) / t_ll1:>12,.0f} tokens/sec  ({t_ll1:.3f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Membandingkan memori parse tree objek Node dengan ParseTreeArena pada korpus
+sintetis (bench.corpus) berukuran sekitar --tokens token.
+
+Token disimpan sebagai TokenStream (tokenize_compact) dan tidak ikut dihitung:
+yang diukur hanya memori yang masih dialokasikan setelah parse_program selesai
+(tracemalloc), yaitu parse tree itu sendiri.
+
+Penggunaan:
+    python -m bench.parse_tree_memory [--tokens N] [--seed N]
+"""
+import argparse
+import gc
+import logging
+import time
+import tracemalloc
+
+from bench.corpus import generate
+from src.common.parse_tree_arena import ParseTreeArena
+from src.lexer.dfa_cache import load_compiled_dfa
+from src.lexer.lexer import Lexer
+from src.parser.parser import Parser
+
+# Perkiraan rata-rata karakter per token pada korpus sintetis.
+CHARS_PER_TOKEN = 4.5
+
+
+def count_nodes(root) -> int:
+    count, stack = 0, [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children)
+    return count
+
+
+def measure(tokens, use_arena: bool) -> tuple[int, float, int]:
+    """Mem-parse `tokens`; mengembalikan (byte yang tertahan, detik, jumlah node)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    arena = ParseTreeArena(tokens) if use_arena else None
+    root = Parser(tokens, arena=arena).parse_program()
+    seconds = time.perf_counter() - start
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    nodes = len(arena) if use_arena else count_nodes(root)
+    return retained, seconds, nodes
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--tokens", type=int, default=500_000)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    source = generate(int(args.tokens * CHARS_PER_TOKEN), args.seed)
+    tokens = Lexer(source, load_compiled_dfa()).tokenize_compact()
+    print(f"corpus   : {len(source)} chars, {len(tokens)} tokens")
+
+    for name, use_arena in (("Node", False), ("arena", True)):
+        retained, seconds, nodes = measure(tokens, use_arena)
+        print(f"{name:<8} : {nodes:>10,} nodes  {retained / 2**20:>9.1f} MiB  "
+              f"{retained / nodes:>6.1f} byte/node  (parse {seconds:.2f} s, dengan tracemalloc)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark Parser.parse_program pada korpus sintetis (bench.corpus) berukuran
+sekitar --tokens token, baik dari list[Token] (tokenize) maupun TokenStream
+(tokenize_compact). Lexing tidak ikut diukur. Juga membandingkan pembuatan AST
+lewat parse tree + ASTBuilder dengan ASTParser (langsung ke AST).
+
+Secara default garbage collector dimatikan selama pengukuran: dengan jutaan
+Node yang hidup, waktu koleksi generasi tua mendominasi dan sangat bervariasi
+antar run, sehingga menutupi biaya parser itu sendiri. Pakai --gc untuk
+mengukur dengan GC aktif.
+
+Penggunaan:
+    python -m bench.parser [--tokens N] [--repeat N] [--seed N] [--gc]
+"""
+import argparse
+import gc
+import logging
+import time
+
+from bench.corpus import generate
+from src.lexer.dfa_cache import load_compiled_dfa
+from src.lexer.lexer import Lexer
+from src.parser.ast_parser import ASTParser
+from src.parser.parser import Parser
+from src.semantic.ast_builder import ASTBuilder
+
+# Perkiraan rata-rata karakter per token pada korpus sintetis.
+CHARS_PER_TOKEN = 4.5
+
+
+def best_of(repeat: int, use_gc: bool, fn, *args) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        result = None
+        gc.collect()
+        if not use_gc:
+            gc.disable()
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+        gc.enable()
+    return best, result
+
+
+def parse(tokens) -> Parser:
+    parser = Parser(tokens)
+    parser.parse_program()
+    return parser
+
+
+def build_via_tree(tokens):
+    return ASTBuilder().build(Parser(tokens).parse_program())
+
+
+def build_direct(tokens):
+    return ASTParser(tokens).parse_program()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--tokens", type=int, default=1_000_000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--gc", action="store_true", help="biarkan GC aktif selama pengukuran")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    dfa = load_compiled_dfa()
+    source = generate(int(args.tokens * CHARS_PER_TOKEN), args.seed)
+    tokens = Lexer(source, dfa).tokenize()
+    stream = Lexer(source, dfa).tokenize_compact()
+
+    t_list, parser = best_of(args.repeat, args.gc, parse, tokens)
+    assert not parser.errors, parser.errors[:3]
+    t_stream, _ = best_of(args.repeat, args.gc, parse, stream)
+    t_tree_ast, _ = best_of(args.repeat, args.gc, build_via_tree, tokens)
+    t_direct_ast, _ = best_of(args.repeat, args.gc, build_direct, tokens)
+
+    print(f"corpus                 : {len(source)} chars, {len(tokens)} tokens")
+    print(f"parse_program (list)   : {len(tokens) / t_list:>12,.0f} tokens/sec  ({t_list:.3f} s)")
+    print(f"parse_program (stream) : {len(tokens) / t_stream:>12,.0f} tokens/sec  ({t_stream:.3f} s)")
+    print(f"AST via parse tree     : {len(tokens) / t_tree_ast:>12,.0f} tokens/sec  ({t_tree_ast:.3f} s)")
+    print(f"AST langsung           : {len(tokens) / t_direct_ast:>12,.0f} tokens/sec  ({t_direct_ast:.3f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark Lexer.relex per ketikan dibandingkan dengan lex ulang penuh pada file
+sekitar --lines baris. Kesamaan hasil relex dengan tokenize() diuji di
+test/test_relex.py.
+
+Setiap sesi memilih posisi acak lalu mengetik 10 spasi satu per satu dan
+menghapusnya kembali, seperti pengetikan di editor. Spasi dipakai karena
+huruf bisa membuat fatal error (angka diikuti huruf) yang memang
+mengharuskan lex sampai akhir file.
+
+Penggunaan:
+    python -m bench.relex [--lines N] [--sessions N] [--seed N]
+"""
+import argparse
+import logging
+import random
+import time
+
+from src.lexer.dfa_cache import load_compiled_dfa
+from src.lexer.lexer import Lexer
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--lines", type=int, default=50_000)
+    arg_parser.add_argument("--sessions", type=int, default=50)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    dfa = load_compiled_dfa()
+    rnd = random.Random(args.seed)
+    body = "".join(f"  nilai_{i % 97} := nilai_{i % 89} + {i}; {{ baris {i} }}\n" for i in range(args.lines))
+    source = f"program besar;\nmulai\n{body}selesai.\n"
+    start = time.perf_counter()
+    lexer = Lexer(source, dfa)
+    tokens = lexer.tokenize()
+    full_time = time.perf_counter() - start
+
+    positions = [rnd.randint(0, len(source) - 1) for _ in range(args.sessions)]
+    keystrokes = 0
+    start = time.perf_counter()
+    for offset in positions:
+        for i in range(10):
+            tokens = lexer.relex(tokens, offset + i, 0, " ")
+        for i in reversed(range(10)):
+            tokens = lexer.relex(tokens, offset + i, 1, "")
+        keystrokes += 20
+    relex_time = (time.perf_counter() - start) / keystrokes
+
+    print(f"corpus            : {args.lines} baris, {len(tokens)} tokens")
+    print(f"relex per ketikan : {relex_time * 1e6:10.1f} us")
+    print(f"lex ulang penuh   : {full_time * 1e6:10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
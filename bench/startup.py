@@ -0,0 +1,44 @@
+"""
+Benchmark cold start lexer: parsing dfa_rules.json + kompilasi tabel
+dibandingkan dengan memuat DFA minimal dari cache biner (dfa_cache).
+
+Penggunaan:
+    python -m bench.startup [--repeat N]
+"""
+import argparse
+import tempfile
+import time
+
+from src.common.utils import load_dfa_rules
+from src.lexer.dfa import CompiledDFA
+from src.lexer.dfa_cache import load_compiled_dfa
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=200)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        t_json = best_of(args.repeat, lambda: CompiledDFA(load_dfa_rules()))
+        load_compiled_dfa(cache_dir=cache_dir)
+        t_cache = best_of(args.repeat, lambda: load_compiled_dfa(cache_dir=cache_dir))
+
+    full = CompiledDFA(load_dfa_rules())
+    minimal = load_compiled_dfa()
+    print(f"states          : {len(full.state_names)} -> {len(minimal.state_names)} (minimized)")
+    print(f"json + compile  : {t_json * 1e3:8.3f} ms")
+    print(f"binary cache    : {t_cache * 1e3:8.3f} ms  ({t_json / t_cache:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
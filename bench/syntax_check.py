@@ -0,0 +1,85 @@
+"""
+Membandingkan cek sintaks streaming dengan parsing biasa pada korpus sintetis
+(bench.corpus) beberapa ukuran.
+
+Mode:
+    list      read_source_code + Lexer(str).tokenize() + Parser(list[Token])
+    stream    SyntaxChecker(Lexer(file).iter_tokens()): lexing dan parsing satu
+              pass, source / token / parse tree tidak disimpan (python -m src.main --check)
+
+Setiap (mode, ukuran) diukur di proses anak tersendiri supaya peak RSS
+(ru_maxrss) milik pengukuran itu saja. Untuk mode stream peak RSS harus kurang
+lebih tetap saat ukuran korpus naik.
+
+Penggunaan:
+    python -m bench.syntax_check [--sizes 256K,1M,4M] [--modes list,stream] [--seed N]
+"""
+import argparse
+import json
+import logging
+import subprocess
+import sys
+import time
+
+from bench.corpus import corpus_path, parse_size
+from bench.lexer_throughput import peak_rss_bytes
+from src.common.utils import open_source_code, read_source_code
+from src.lexer.dfa_cache import load_compiled_dfa
+from src.lexer.lexer import Lexer
+from src.parser.parser import Parser
+from src.parser.syntax_checker import SyntaxChecker
+
+MODES = ("list", "stream")
+
+
+def check_once(path: str, mode: str) -> int:
+    """Mengecek file `path` sekali; mengembalikan jumlah syntax error."""
+    dfa = load_compiled_dfa()
+    if mode == "stream":
+        with open_source_code(path) as source:
+            return len(SyntaxChecker(Lexer(source, dfa).iter_tokens()).check())
+    parser = Parser(Lexer(read_source_code(path), dfa).tokenize())
+    parser.parse_program()
+    return len(parser.errors)
+
+
+def measure(path: str, mode: str) -> dict:
+    """Mengukur satu korpus di proses ini (dipanggil di proses anak)."""
+    logging.disable(logging.ERROR)
+    start = time.perf_counter()
+    errors = check_once(path, mode)
+    return {"seconds": time.perf_counter() - start, "errors": errors, "peak_rss_bytes": peak_rss_bytes()}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", default="256K,1M,4M",
+                            help="daftar ukuran korpus dipisah koma (sufiks K/M/G)")
+    arg_parser.add_argument("--modes", default=",".join(MODES))
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--measure", help=argparse.SUPPRESS)
+    arg_parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.mode)))
+        return
+
+    print(f"{'mode':<7} {'ukuran':>12} | {'detik':>7} {'MB/s':>6} {'peak RSS':>10}  error")
+    for size_text in args.sizes.split(","):
+        size = parse_size(size_text)
+        path = corpus_path(size, args.seed)
+        for mode in args.modes.split(","):
+            child = subprocess.run(
+                [sys.executable, "-m", "bench.syntax_check", "--measure", path, "--mode", mode],
+                check=True, capture_output=True, text=True,
+            )
+            result = json.loads(child.stdout)
+            rss = result["peak_rss_bytes"]
+            rss_text = "-" if rss is None else f"{rss / 2**20:.1f} MiB"
+            print(f"{mode:<7} {size:>12,} | {result['seconds']:>7.2f} {size / result['seconds'] / 1e6:>6.2f} "
+                  f"{rss_text:>10}  {result['errors']}")
+
+
+if __name__ == "__main__":
+    main()
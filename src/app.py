@@ -1,36 +1,81 @@
+import logging
 import sys
 from src.common.errors import SemanticError, TokenUnexpectedError
 from src.lexer.lexer import Lexer
-from src.common.utils import load_dfa_rules, read_source_code, print_symbol_tables, print_ast_tree
+from src.common.utils import read_source_code, open_source_code, print_symbol_tables, print_ast_tree
+from src.lexer.dfa_cache import load_compiled_dfa
+from src.common.parse_tree_arena import ParseTreeArena
 from src.parser.parser import Parser
+from src.parser.ast_parser import ASTParser
+from src.parser.syntax_checker import SyntaxChecker
 from src.semantic.ast_builder import ASTBuilder
 from src.semantic.semantic_analyzer import SemanticAnalyzer
 
 def app():
-    if len(sys.argv) != 2:
-        print("Usage: python -m src.main <source_file.pas>")
+    args = sys.argv[1:]
+    # --parse-tree: cetak juga parse tree (Node) selain AST
+    show_parse_tree = "--parse-tree" in args
+    if show_parse_tree:
+        args.remove("--parse-tree")
+    # --check: cek sintaks saja, file di-lex dan di-parse sambil dibaca (memori konstan)
+    check_only = "--check" in args
+    if check_only:
+        args.remove("--check")
+
+    if len(args) != 1:
+        print("Usage: python -m src.main [--parse-tree | --check] <source_file.pas>")
         sys.exit(1)
 
-    source_path = sys.argv[1]
+    source_path = args[0]
 
     if not source_path.endswith(".pas"):
         print("Error: Input file harus berekstensi .pas")
         sys.exit(1)
 
+    if check_only:
+        check_syntax(source_path)
+        return
+
     try:
         source = read_source_code(source_path)
-        dfa_rules = load_dfa_rules()
-        lexer = Lexer(source, dfa_rules)
+        dfa = load_compiled_dfa()
+        lexer = Lexer(source, dfa)
         tokens = lexer.tokenize()
 
-        parser = Parser(tokens)
-        parse_tree_root = parser.parse_program()
-        
-        if not parse_tree_root:
-            return
+        ast_root = None
+        if not show_parse_tree:
+            # jalur cepat: langsung ke AST tanpa parse tree
+            try:
+                ast_root = ASTParser(tokens).parse_program()
+            except TokenUnexpectedError:
+                # input ga valid: ulang pakai parse tree biar semua error dilaporkan seperti biasa
+                ast_root = None
+
+        if ast_root is None:
+            # semua syntax error dikumpulkan di parser.errors dan dicetak sekaligus di bawah,
+            # jadi logging per error dimatikan selama parsing
+            logging.disable(logging.ERROR)
+            try:
+                parser = Parser(tokens, arena=ParseTreeArena(tokens))
+                parse_tree_root = parser.parse_program()
+            finally:
+                logging.disable(logging.NOTSET)
 
-        builder = ASTBuilder()
-        ast_root = builder.build(parse_tree_root)
+            if not parse_tree_root:
+                return
+
+            if show_parse_tree:
+                print("\n===== PARSE TREE =====")
+                parse_tree_root.print_tree()
+
+            # parse tree hasil pemulihan error berisi node <error> di sembarang tempat:
+            # cukup laporkan semua syntax error, AST dan analisis semantik tidak dijalankan
+            if parser.errors:
+                print_failure("COMPILATION FAILED: SYNTAX ERROR", parser.errors)
+                sys.exit(1)
+
+            builder = ASTBuilder()
+            ast_root = builder.build(parse_tree_root)
 
         analyzer = SemanticAnalyzer()
         analyzer.visit(ast_root)
@@ -41,7 +86,7 @@ def app():
         print_symbol_tables(analyzer.symtab)
 
         print("\n===== DECORATED AST =====")
-        print_ast_tree(ast_root)
+        print_ast_tree(ast_root, annotations=analyzer.annotations)
 
     except (SemanticError, TokenUnexpectedError) as e:
         print("\n" + "="*60)
@@ -64,4 +109,37 @@ def app():
 
     except Exception as e:
         print(f"\nFATAL ERROR: {e}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+
+
+def check_syntax(source_path: str):
+    """
+    Mode --check: lexer membaca file per chunk dan parser mengambil token langsung
+    dari Lexer.iter_tokens(), jadi seluruh file dicek dalam satu pass tanpa menyimpan
+    source, daftar token, maupun parse tree. Semua error leksikal dan sintaks dicetak.
+    """
+    # semua error dicetak sekaligus di blok di bawah, jadi logging per error dimatikan
+    logging.disable(logging.ERROR)
+    try:
+        with open_source_code(source_path) as source:
+            lexer = Lexer(source, load_compiled_dfa(), recover=True)
+            syntax_errors = SyntaxChecker(lexer.iter_tokens()).check()
+    finally:
+        logging.disable(logging.NOTSET)
+
+    if not lexer.errors and not syntax_errors:
+        print("\nSyntax Check Successful.")
+        return
+
+    print_failure("SYNTAX CHECK FAILED", [str(err) for err in lexer.errors] + syntax_errors)
+    sys.exit(1)
+
+
+def print_failure(title: str, messages: list[str]):
+    """Mencetak blok kegagalan berisi judul dan satu pesan error per baris."""
+    print("\n" + "="*60)
+    print(f" {title}")
+    print("="*60)
+    for msg in messages:
+        print(f" {msg}")
+    print("="*60 + "\n")
@@ -4,6 +4,9 @@ class CompilerError(Exception):
 
 class LexicalError(CompilerError):
     def __init__(self, message: str, line: int | None = None, column: int | None = None):
+        self.message = message
+        self.line = line
+        self.column = column
         if line is not None and column is not None:
             super().__init__(f"[LexicalError] {message} @ {line}:{column}")
         else:
@@ -24,6 +27,11 @@ class TokenUnexpectedError(SyntaxParseError):
         super().__init__(msg, line, column)
 
 
+class GrammarError(CompilerError):
+    def __init__(self, message: str):
+        super().__init__(f"[GrammarError] {message}")
+
+
 class SemanticError(CompilerError):
     def __init__(self, message: str):
         super().__init__(f"[SemanticError] {message}")
@@ -0,0 +1,119 @@
+import re
+from bisect import bisect_left, bisect_right
+
+class LineIndex:
+    """
+    Tabel offset awal baris untuk menurunkan (line, column) dari offset karakter.
+
+    Tabel dibangun sekali dalam satu pass. Aturan baris baru sama dengan yang
+    dipakai lexer sejak awal: '\\n', '\\r', dan pasangan '\\r\\n' dihitung
+    sebagai satu pergantian baris. Kolom dihitung per karakter, mulai dari 1.
+    """
+    _NEWLINE = re.compile(r'\r\n?|\n')
+
+    def __init__(self, text: str):
+        self.line_starts: list[int] = [0]
+        self.line_starts.extend(m.end() for m in self._NEWLINE.finditer(text))
+        # Pergeseran yang belum diterapkan: line_starts[i] untuk i >= _shift_from
+        # bernilai line_starts[i] + _shift. Dipakai edited() agar edit tidak perlu
+        # menggeser seluruh tabel.
+        self._shift_from = len(self.line_starts)
+        self._shift = 0
+
+    @property
+    def line_count(self) -> int:
+        return len(self.line_starts)
+
+    def _start(self, index: int) -> int:
+        start = self.line_starts[index]
+        return start + self._shift if index >= self._shift_from else start
+
+    def _bisect(self, offset: int, right: bool) -> int:
+        bisect = bisect_right if right else bisect_left
+        starts, shift_from = self.line_starts, self._shift_from
+        if shift_from < len(starts) and (offset >= starts[shift_from] + self._shift if right
+                                         else offset > starts[shift_from] + self._shift):
+            return bisect(starts, offset - self._shift, shift_from)
+        return bisect(starts, offset, 0, shift_from)
+
+    def line_col(self, offset: int) -> tuple[int, int]:
+        """Mengembalikan (line, column) 1-based untuk offset karakter."""
+        line = self._bisect(offset, right=True)
+        return line, offset - self._start(line - 1) + 1
+
+    def offset(self, line: int, column: int) -> int:
+        """Kebalikan line_col: offset karakter untuk (line, column) 1-based."""
+        return self._start(line - 1) + column - 1
+
+    def apply_edit(self, text: str, offset: int, removed_len: int, inserted_len: int):
+        """
+        Memperbarui tabel di tempat untuk satu edit tanpa memindai ulang seluruh teks.
+
+        Status "awal baris" sebuah posisi s hanya bergantung pada text[s-1] dan
+        text[s], sehingga cukup posisi di sekitar edit yang dihitung ulang. Offset
+        awal baris setelah edit tidak digeser satu per satu: pergeseran dicatat
+        sebagai _shift yang berlaku mulai _shift_from, dan hanya baris di antara
+        edit sebelumnya dan edit ini yang perlu dinormalkan.
+
+        Args:
+            text (str): Teks lengkap setelah edit.
+            offset (int): Offset awal edit.
+            removed_len (int): Jumlah karakter lama yang dihapus.
+            inserted_len (int): Jumlah karakter baru yang disisipkan.
+        """
+        starts, shift_from, shift = self.line_starts, self._shift_from, self._shift
+        lo = max(self._bisect(offset, right=False), 1)
+        hi = max(self._bisect(offset + removed_len + 1, right=True), lo)
+        window_end = offset + inserted_len + 1
+        window = [m.end() for m in self._NEWLINE.finditer(text, max(offset - 1, 0), window_end + 1)
+                  if offset <= m.end() <= window_end]
+
+        # Baris sebelum edit harus bernilai final; baris setelah edit disamakan ke
+        # pergeseran baru (shift + delta) yang berlaku untuk seluruh ekor.
+        for i in range(shift_from, lo):
+            starts[i] += shift
+        for i in range(hi, min(shift_from, len(starts))):
+            starts[i] -= shift
+        starts[lo:hi] = window
+        self._shift_from = lo + len(window)
+        self._shift = shift + inserted_len - removed_len
+
+
+class LineCounter:
+    """
+    Penghitung (line, column) inkremental untuk teks yang dibaca bertahap.
+
+    Dipakai saat sumber dibaca sebagai stream sehingga tabel LineIndex untuk
+    seluruh file tidak bisa (dan tidak perlu) disimpan. Offset yang ditanyakan
+    harus tidak menurun; pergantian baris dihitung dengan str.count pada
+    potongan buffer yang belum dihitung, dengan aturan yang sama seperti LineIndex.
+    """
+    def __init__(self):
+        self.line = 1
+        self.line_start = 0
+        self.offset = 0
+        self._pending_cr = False
+
+    def line_col(self, buffer: str, base: int, offset: int) -> tuple[int, int]:
+        """
+        Mengembalikan (line, column) untuk offset absolut `offset`.
+
+        Args:
+            buffer (str): Buffer yang sedang dipegang lexer.
+            base (int): Offset absolut dari karakter pertama buffer.
+            offset (int): Offset absolut yang ditanyakan (>= offset sebelumnya).
+        """
+        start, end = self.offset - base, offset - base
+        if start < end:
+            breaks = buffer.count('\n', start, end) + buffer.count('\r', start, end) \
+                - buffer.count('\r\n', start, end)
+            if self._pending_cr and buffer[start] == '\n':
+                breaks -= 1
+            if breaks:
+                self.line += breaks
+            last = max(buffer.rfind('\n', start, end), buffer.rfind('\r', start, end))
+            if last >= 0:
+                self.line_start = base + last + 1
+            self._pending_cr = buffer[end - 1] == '\r'
+            self.offset = offset
+        return self.line, offset - self.line_start + 1
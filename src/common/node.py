@@ -12,14 +12,58 @@ class Node:
         return node
 
     def print_tree(self, prefix: str = "", is_last: bool = True):
-        connector = "└── " if is_last else "├── "
-        if self.token:
-            print(prefix + connector + f"{self.label}({self.token.value})")
-        else:
-            print(prefix + connector + f"{self.label}")
-
-        # Prefix untuk anak-anak (indentasi)
-        child_prefix = prefix + ("    " if is_last else "│   ")
-        for i, child in enumerate(self.children):
-            is_last_child = (i == len(self.children) - 1)
-            child.print_tree(child_prefix, is_last_child)
+        # iteratif (stack eksplisit) supaya pohon yang sangat dalam tidak kena recursion limit
+        stack = [(self, prefix, is_last)]
+        while stack:
+            node, prefix, is_last = stack.pop()
+            connector = "└── " if is_last else "├── "
+            if node.token:
+                print(prefix + connector + f"{node.label}({node.token.value})")
+            else:
+                print(prefix + connector + f"{node.label}")
+
+            # Prefix untuk anak-anak (indentasi); di-push terbalik supaya anak pertama dicetak duluan
+            child_prefix = prefix + ("    " if is_last else "│   ")
+            children = node.children
+            for i in range(len(children) - 1, -1, -1):
+                stack.append((children[i], child_prefix, i == len(children) - 1))
+
+
+class LazyNode(Node):
+    """
+    Node yang anak-anaknya baru dibangun saat `children` pertama kali dibaca
+    (mis. <block> subprogram pada Parser(lazy_bodies=True)).
+    """
+    def __init__(self, label, build):
+        # build: fungsi tanpa argumen yang mengembalikan list anak node ini
+        self.label: str = label
+        self.token: Token | None = None
+        self._build = build
+        self._children: list[Node] | None = None
+        self._error: Exception | None = None
+
+    @property
+    def parsed(self) -> bool:
+        # True kalau anak-anaknya sudah dibangun
+        return self._build is None
+
+    @property
+    def children(self) -> list[Node]:
+        if self._build is not None:
+            # exception build() disimpan dan di-raise lagi di setiap pembacaan berikutnya:
+            # build() tidak diulang (error parse-nya sudah tercatat) dan tidak mengembalikan None
+            if self._error is not None:
+                raise self._error
+            try:
+                self._children = self._build()
+            except Exception as exc:
+                self._error = exc
+                raise
+            self._build = None
+        return self._children
+
+    @children.setter
+    def children(self, children: list[Node]):
+        self._build = None
+        self._error = None
+        self._children = children
@@ -0,0 +1,176 @@
+from array import array
+from typing import Iterator
+
+from src.common.pascal_token import Token
+from src.common.token_stream import TokenStream, TokenView
+
+
+class ParseTreeArena:
+    """
+    Parse tree berbentuk struct-of-arrays, pengganti pohon objek Node.
+
+    Setiap node hanya berupa satu index ke kolom-kolom berikut:
+    id label (ke `label_names`), index token di urutan token parser (-1 jika
+    node tidak punya token), serta link anak pertama, saudara berikutnya dan
+    anak terakhir (-1 jika tidak ada). Anak terakhir hanya dipakai agar
+    penambahan anak O(1). Token tidak disalin; `tokens` adalah list[Token]
+    atau TokenStream yang sama dengan yang diparse.
+
+    Navigasi lewat ArenaNode, handle ringan yang atributnya sama seperti Node
+    (label, token, children, add_children, print_tree), sehingga Parser dan
+    ASTBuilder bisa memakai arena tanpa membedakan keduanya.
+    """
+    def __init__(self, tokens: list[Token] | TokenStream):
+        self.tokens = tokens
+        self.label_names: list[str] = []
+        self._label_ids: dict[str, int] = {}
+        self.labels = array('H')
+        self.token_indices = array('i')
+        self.first_child = array('i')
+        self.next_sibling = array('i')
+        self.last_child = array('i')
+
+    def label_id(self, label: str) -> int:
+        """Mengembalikan id integer untuk label (didaftarkan jika belum ada)."""
+        label_id = self._label_ids.get(label)
+        if label_id is None:
+            label_id = len(self.label_names)
+            self.label_names.append(label)
+            self._label_ids[label] = label_id
+        return label_id
+
+    def add(self, label: str, token_index: int = -1) -> "ArenaNode":
+        """
+        Menambahkan node baru tanpa parent.
+
+        Args:
+            label (str): Label node, mis. "<term>" atau "IDENTIFIER".
+            token_index (int): Index token di `tokens`, atau -1 jika tidak ada.
+
+        Returns:
+            ArenaNode: Handle ke node baru.
+        """
+        index = len(self.labels)
+        label_id = self._label_ids.get(label)
+        self.labels.append(self.label_id(label) if label_id is None else label_id)
+        self.token_indices.append(token_index)
+        self.first_child.append(-1)
+        self.next_sibling.append(-1)
+        self.last_child.append(-1)
+        return ArenaNode(self, index)
+
+    def append_child(self, parent: int, child: int):
+        """Menjadikan node `child` anak terakhir dari node `parent`."""
+        last = self.last_child[parent]
+        if last == -1:
+            self.first_child[parent] = child
+        else:
+            self.next_sibling[last] = child
+        self.last_child[parent] = child
+
+    def label(self, index: int) -> str:
+        return self.label_names[self.labels[index]]
+
+    def token(self, index: int) -> Token | TokenView | None:
+        token_index = self.token_indices[index]
+        return None if token_index == -1 else self.tokens[token_index]
+
+    def child_indices(self, index: int) -> Iterator[int]:
+        """Index anak-anak node ke-`index`, berurutan."""
+        child = self.first_child[index]
+        next_sibling = self.next_sibling
+        while child != -1:
+            yield child
+            child = next_sibling[child]
+
+    def nbytes(self) -> int:
+        """Perkiraan memori kolom-kolom arena (tidak termasuk token)."""
+        columns = (self.labels, self.token_indices, self.first_child, self.next_sibling, self.last_child)
+        return sum(col.itemsize * len(col) for col in columns)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __getitem__(self, index: int) -> "ArenaNode":
+        if not 0 <= index < len(self.labels):
+            raise IndexError("ParseTreeArena index out of range")
+        return ArenaNode(self, index)
+
+
+class ArenaNode:
+    """
+    Handle (cursor) ke satu node di ParseTreeArena dengan atribut yang sama
+    seperti Node. `children` dibuat baru setiap kali diakses; untuk menelusuri
+    tanpa membuat list pakai first_child / next_sibling.
+    """
+    __slots__ = ("arena", "index")
+
+    def __init__(self, arena: ParseTreeArena, index: int):
+        self.arena = arena
+        self.index = index
+
+    @property
+    def label(self) -> str:
+        return self.arena.label_names[self.arena.labels[self.index]]
+
+    @property
+    def token(self) -> Token | TokenView | None:
+        return self.arena.token(self.index)
+
+    @property
+    def children(self) -> list["ArenaNode"]:
+        arena = self.arena
+        return [ArenaNode(arena, child) for child in arena.child_indices(self.index)]
+
+    @property
+    def first_child(self) -> "ArenaNode | None":
+        child = self.arena.first_child[self.index]
+        return None if child == -1 else ArenaNode(self.arena, child)
+
+    @property
+    def next_sibling(self) -> "ArenaNode | None":
+        sibling = self.arena.next_sibling[self.index]
+        return None if sibling == -1 else ArenaNode(self.arena, sibling)
+
+    def add_children(self, node: "ArenaNode | None"):
+        if node:
+            self.arena.append_child(self.index, node.index)
+        return node
+
+    def print_tree(self, prefix: str = "", is_last: bool = True):
+        """Sama dengan Node.print_tree, tapi iteratif sehingga aman untuk pohon yang sangat dalam."""
+        arena = self.arena
+        label_names, labels = arena.label_names, arena.labels
+        token_indices, tokens = arena.token_indices, arena.tokens
+        first_child, next_sibling = arena.first_child, arena.next_sibling
+
+        stack = [(self.index, prefix, is_last)]
+        while stack:
+            index, prefix, is_last = stack.pop()
+            connector = "└── " if is_last else "├── "
+            token_index = token_indices[index]
+            if token_index != -1:
+                print(prefix + connector + f"{label_names[labels[index]]}({tokens[token_index].value})")
+            else:
+                print(prefix + connector + f"{label_names[labels[index]]}")
+
+            # Prefix untuk anak-anak (indentasi); di-push terbalik supaya anak pertama dicetak duluan
+            child_prefix = prefix + ("    " if is_last else "│   ")
+            children = []
+            child = first_child[index]
+            while child != -1:
+                children.append(child)
+                child = next_sibling[child]
+            for i in range(len(children) - 1, -1, -1):
+                stack.append((children[i], child_prefix, i == len(children) - 1))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ArenaNode):
+            return self.arena is other.arena and self.index == other.index
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self.arena), self.index))
+
+    def __repr__(self) -> str:
+        return f"ArenaNode({self.label}#{self.index})"
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from src.common.token_kinds import TokenKind, Word
+
 @dataclass
 class Token:
     """
@@ -8,11 +10,24 @@ class Token:
     Setiap token memiliki jenis (misalnya, 'IDENTIFIER'), nilai (misalnya, 'x'),
     dan nomor baris tempat token itu ditemukan dalam kode sumber.
     Ini membantu untuk pelacakan dan pelaporan kesalahan (error reporting) nanti.
+
+    Untuk KEYWORD dan operator kata (mis. 'dan', 'mod'), `keyword` berisi ejaan
+    kanonik (huruf kecil) yang sudah dihitung lexer; untuk token lain None.
+    Untuk NUMBER, `number` berisi nilainya (int, atau float untuk bilangan real)
+    yang juga dihitung sekali oleh lexer.
+
+    `kind` dan `word` adalah id integer untuk token_type dan keyword (lihat
+    token_kinds.TokenKind dan token_kinds.Word), diisi lexer agar parser bisa
+    dispatch lewat tabel tanpa membandingkan string.
     """
     token_type: str
     value: str
     line: int
     column: int
+    keyword: str | None = None
+    number: int | float | None = None
+    kind: int = TokenKind.UNKNOWN
+    word: int = Word.NONE
 
     def __repr__(self) -> str:
         """
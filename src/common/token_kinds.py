@@ -0,0 +1,109 @@
+class TokenKind:
+    """
+    Jenis token sebagai integer kecil (Token.kind), diberikan lexer untuk
+    setiap token. Nama konstanta sama persis dengan string Token.token_type,
+    sehingga parser bisa membandingkan/mengindeks tabel dengan integer dan
+    tetap mencetak pesan error dengan nama yang sama (TokenKind.NAMES[kind]).
+    Jenis token yang tidak terdaftar di sini mendapat UNKNOWN.
+
+    Sengaja berupa konstanta int biasa, bukan IntEnum: membaca member IntEnum
+    di Python 3.11 beberapa kali lebih lambat dan parser melakukannya per token.
+    """
+    UNKNOWN = 0
+    KEYWORD = 1
+    IDENTIFIER = 2
+    NUMBER = 3
+    CHAR_LITERAL = 4
+    STRING_LITERAL = 5
+    ARITHMETIC_OPERATOR = 6
+    RELATIONAL_OPERATOR = 7
+    LOGICAL_OPERATOR = 8
+    ASSIGN_OPERATOR = 9
+    SEMICOLON = 10
+    COLON = 11
+    COMMA = 12
+    DOT = 13
+    RANGE_OPERATOR = 14
+    LPARENTHESIS = 15
+    RPARENTHESIS = 16
+    LBRACKET = 17
+    RBRACKET = 18
+
+    NAMES: tuple[str, ...] = ()
+
+
+class Word:
+    """
+    Identitas keyword dan operator kata sebagai integer kecil (Token.word).
+    Ejaan kanoniknya adalah nama konstanta dalam huruf kecil
+    (Word.SPELLINGS[word]); token yang bukan keyword/operator kata mendapat NONE.
+    """
+    NONE = 0
+    PROGRAM = 1
+    VARIABEL = 2
+    MULAI = 3
+    SELESAI = 4
+    JIKA = 5
+    MAKA = 6
+    SELAIN_ITU = 7
+    SELAMA = 8
+    LAKUKAN = 9
+    UNTUK = 10
+    KE = 11
+    TURUN_KE = 12
+    INTEGER = 13
+    REAL = 14
+    BOOLEAN = 15
+    CHAR = 16
+    LARIK = 17
+    DARI = 18
+    PROSEDUR = 19
+    FUNGSI = 20
+    KONSTANTA = 21
+    TIPE = 22
+    TRUE = 23
+    FALSE = 24
+    KASUS = 25
+    REKAMAN = 26
+    ULANGI = 27
+    SAMPAI = 28
+    BAGI = 29
+    MOD = 30
+    DAN = 31
+    ATAU = 32
+    TIDAK = 33
+
+    SPELLINGS: tuple[str | None, ...] = ()
+
+
+def _names(cls) -> list[str]:
+    """Nama konstanta int di `cls`, terurut menurut nilainya."""
+    members = {value: name for name, value in vars(cls).items() if name.isupper() and isinstance(value, int)}
+    assert sorted(members) == list(range(len(members))), f"id {cls.__name__} harus berurutan dari 0"
+    return [members[value] for value in range(len(members))]
+
+
+TokenKind.NAMES = tuple(_names(TokenKind))
+Word.SPELLINGS = (None,) + tuple(name.lower() for name in _names(Word)[1:])
+
+# Lookup dari string ke id, dipakai lexer saat membuat token.
+KIND_IDS: dict[str, int] = {name: kind for kind, name in enumerate(TokenKind.NAMES)}
+WORD_IDS: dict[str | None, int] = {spelling: word for word, spelling in enumerate(Word.SPELLINGS)}
+
+
+def kind_table(entries: dict[int, object], size: int = len(TokenKind.NAMES)) -> list:
+    """
+    Membuat tabel dispatch berindeks id (TokenKind atau Word), mis. FIRST set
+    sebuah aturan grammar. Indeks yang tidak ada di `entries` bernilai None.
+
+    Args:
+        entries (dict[int, object]): Pemetaan id -> nilai (mis. method parser).
+        size (int): Panjang tabel; untuk Word pakai len(Word.SPELLINGS).
+
+    Returns:
+        list: Tabel dengan panjang `size`.
+    """
+    table = [None] * size
+    for key, value in entries.items():
+        table[key] = value
+    return table
@@ -0,0 +1,42 @@
+from typing import Iterable
+
+from src.common.pascal_token import Token
+
+
+class TokenLookahead:
+    """
+    Lookahead terbatas di atas iterator token (mis. Lexer.iter_tokens()).
+
+    Token diambil dari iterator hanya saat diminta dan disimpan di ring buffer
+    berukuran k, jadi token yang sudah lewat tidak ditahan di memori. Indexing
+    memakai index absolut seperti list[Token], sehingga Parser bisa memakainya
+    sebagai pengganti list selama yang dibaca hanya k token terakhir
+    (Parser butuh k=2: token saat ini dan satu token sesudahnya).
+    """
+    def __init__(self, tokens: Iterable[Token], k: int = 2):
+        """
+        Args:
+            tokens (Iterable[Token]): Sumber token, dibaca sekali dari depan.
+            k (int): Jumlah token terakhir yang masih bisa dibaca lagi.
+        """
+        self.k = k
+        self._next = iter(tokens).__next__
+        self._ring: list[Token | None] = [None] * k
+        self._filled = 0        # jumlah token yang sudah diambil dari iterator
+        self._exhausted = False
+
+    def __getitem__(self, index: int) -> Token:
+        # index >= _filled: tarik token dari iterator sampai index tersebut
+        while index >= self._filled:
+            if self._exhausted:
+                raise IndexError("TokenLookahead index out of range")
+            try:
+                token = self._next()
+            except StopIteration:
+                self._exhausted = True
+                raise IndexError("TokenLookahead index out of range") from None
+            self._ring[self._filled % self.k] = token
+            self._filled += 1
+        if index < self._filled - self.k:
+            raise IndexError(f"token ke-{index} sudah keluar dari lookahead (k={self.k})")
+        return self._ring[index % self.k]
@@ -0,0 +1,204 @@
+from array import array
+from typing import Iterator
+
+from src.common.pascal_token import Token
+from src.common.token_kinds import KIND_IDS, WORD_IDS, TokenKind, Word
+
+_KIND_COUNT = len(TokenKind.NAMES)
+_WORD_COUNT = len(Word.SPELLINGS)
+
+def lexeme_value(token_type: str, source: str, start: int, end: int) -> str:
+    """
+    Menghasilkan nilai token (Token.value) dari potongan source[start:end].
+
+    Untuk literal string/char, tanda kutip ganda ('') di dalam literal
+    dinormalisasi menjadi satu kutip, sama seperti yang dilakukan lexer.
+    """
+    if token_type == "STRING_LITERAL" or token_type == "CHAR_LITERAL":
+        return "'" + source[start + 1:end - 1].replace("''", "'") + "'"
+    return source[start:end]
+
+
+def number_value(lexeme: str) -> int | float | None:
+    """
+    Menghasilkan nilai numerik (Token.number) dari lexeme NUMBER.
+
+    Lexeme dengan '.' atau eksponen (mis. 1.5, 1e5) menjadi float, selain itu int.
+    Jenis angka (integer/real) cukup dibaca dari tipe hasilnya. Mengembalikan None
+    jika lexeme tidak bisa dikonversi (mis. digit Unicode seperti '²').
+    """
+    try:
+        if "." in lexeme or "e" in lexeme or "E" in lexeme:
+            return float(lexeme)
+        return int(lexeme)
+    except ValueError:
+        return None
+
+
+class TokenStream:
+    """
+    Kontainer token berbentuk struct-of-arrays.
+
+    Alih-alih satu objek Token per token, setiap kolom disimpan di array
+    tersendiri: jenis token sebagai integer kecil, offset awal/akhir lexeme di
+    source, serta line dan column. Teks lexeme baru dibuat saat diminta.
+    Keyword kanonik disimpan sebagai id kecil ke `word_names` (0 = bukan keyword).
+    Untuk jenis token dan keyword yang dikenal, id di `kinds`/`words` sama dengan
+    TokenKind/Word sehingga langsung menjadi Token.kind/Token.word.
+    Nilai numerik token NUMBER disimpan jarang di `numbers` (index token -> nilai).
+    Indexing menghasilkan TokenView yang kompatibel dengan Token, sehingga
+    TokenStream bisa langsung dipakai Parser sebagai pengganti list[Token].
+    """
+    def __init__(self, source: str):
+        self.source = source
+        # Id jenis token dan keyword yang dikenal sama dengan TokenKind / Word;
+        # nama lain didaftarkan setelahnya.
+        self.kind_names: list[str] = list(TokenKind.NAMES)
+        self._kind_ids: dict[str, int] = dict(KIND_IDS)
+        self.kinds = array('B')
+        self.starts = array('i')
+        self.ends = array('i')
+        self.lines = array('i')
+        self.columns = array('i')
+        self.word_names: list[str | None] = list(Word.SPELLINGS)
+        self._word_ids: dict[str | None, int] = dict(WORD_IDS)
+        self.words = array('B')
+        self.numbers: dict[int, int | float | None] = {}
+
+    def kind_id(self, token_type: str) -> int:
+        """Mengembalikan id integer untuk jenis token (didaftarkan jika belum ada)."""
+        kind = self._kind_ids.get(token_type)
+        if kind is None:
+            kind = len(self.kind_names)
+            self.kind_names.append(token_type)
+            self._kind_ids[token_type] = kind
+        return kind
+
+    def append(self, token_type: str, start: int, end: int, line: int, column: int,
+               keyword: str | None = None, number: int | float | None = None):
+        if number is not None:
+            self.numbers[len(self.kinds)] = number
+        word = self._word_ids.get(keyword)
+        if word is None:
+            word = len(self.word_names)
+            self.word_names.append(keyword)
+            self._word_ids[keyword] = word
+        self.words.append(word)
+        self.kinds.append(self.kind_id(token_type))
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def token_type(self, index: int) -> str:
+        return self.kind_names[self.kinds[index]]
+
+    def kind(self, index: int) -> int:
+        """TokenKind token ke-`index` (UNKNOWN untuk jenis token yang tidak terdaftar)."""
+        kind = self.kinds[index]
+        return kind if kind < _KIND_COUNT else TokenKind.UNKNOWN
+
+    def lexeme(self, index: int) -> str:
+        """Teks mentah token ke-`index`, diambil langsung dari source."""
+        return self.source[self.starts[index]:self.ends[index]]
+
+    def value(self, index: int) -> str:
+        """Nilai token ke-`index` dengan format yang sama seperti Token.value."""
+        return lexeme_value(self.token_type(index), self.source, self.starts[index], self.ends[index])
+
+    def keyword(self, index: int) -> str | None:
+        """Keyword kanonik token ke-`index`, atau None."""
+        return self.word_names[self.words[index]]
+
+    def word(self, index: int) -> int:
+        """Word token ke-`index` (NONE untuk kata yang tidak terdaftar)."""
+        word = self.words[index]
+        return word if word < _WORD_COUNT else Word.NONE
+
+    def number(self, index: int) -> int | float | None:
+        """Nilai numerik token NUMBER ke-`index`, atau None."""
+        return self.numbers.get(index)
+
+    def to_token(self, index: int) -> Token:
+        """Membuat objek Token penuh untuk token ke-`index`."""
+        return Token(token_type=self.token_type(index), value=self.value(index),
+                     line=self.lines[index], column=self.columns[index], keyword=self.keyword(index),
+                     number=self.number(index), kind=self.kind(index), word=self.word(index))
+
+    def nbytes(self) -> int:
+        """Perkiraan memori kolom-kolom token (tidak termasuk source)."""
+        columns = (self.kinds, self.starts, self.ends, self.lines, self.columns, self.words)
+        return sum(col.itemsize * len(col) for col in columns)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index: int) -> "TokenView":
+        if index < 0:
+            index += len(self.kinds)
+        if not 0 <= index < len(self.kinds):
+            raise IndexError("TokenStream index out of range")
+        return TokenView(self, index)
+
+    def __iter__(self) -> Iterator["TokenView"]:
+        for index in range(len(self.kinds)):
+            yield TokenView(self, index)
+
+
+class TokenView:
+    """
+    Tampilan ringan atas satu token di TokenStream dengan atribut yang sama
+    seperti Token (token_type, value, line, column, keyword, number, kind, word).
+    """
+    __slots__ = ("stream", "index")
+
+    def __init__(self, stream: TokenStream, index: int):
+        self.stream = stream
+        self.index = index
+
+    @property
+    def token_type(self) -> str:
+        return self.stream.kind_names[self.stream.kinds[self.index]]
+
+    @property
+    def value(self) -> str:
+        return self.stream.value(self.index)
+
+    @property
+    def keyword(self) -> str | None:
+        return self.stream.word_names[self.stream.words[self.index]]
+
+    # kind/word dibaca per token oleh parser, jadi sengaja tidak lewat method stream
+    @property
+    def kind(self) -> int:
+        kind = self.stream.kinds[self.index]
+        return kind if kind < _KIND_COUNT else TokenKind.UNKNOWN
+
+    @property
+    def word(self) -> int:
+        word = self.stream.words[self.index]
+        return word if word < _WORD_COUNT else Word.NONE
+
+    @property
+    def number(self) -> int | float | None:
+        return self.stream.numbers.get(self.index)
+
+    @property
+    def line(self) -> int:
+        return self.stream.lines[self.index]
+
+    @property
+    def column(self) -> int:
+        return self.stream.columns[self.index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Token, TokenView)):
+            return (self.token_type, self.value, self.line, self.column) == \
+                (other.token_type, other.value, other.line, other.column)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.token_type, self.line, self.column))
+
+    def __repr__(self) -> str:
+        return f"{self.token_type}({self.value})"
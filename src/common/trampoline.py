@@ -0,0 +1,53 @@
+from types import GeneratorType
+
+
+def drive(step):
+    """
+    Menjalankan rekursi berbentuk generator dengan stack eksplisit.
+
+    Fungsi yang bisa bersarang tanpa batas (aturan parser, builder AST, visitor
+    semantic) ditulis sebagai generator: setiap butuh hasil sub-langkah,
+    generator `yield` sub-langkah itu (generator lain, atau nilai yang sudah
+    jadi) lalu menerima hasilnya sebagai nilai ekspresi yield. Kedalaman
+    nesting jadi hanya dibatasi memori, bukan recursion limit Python.
+
+    Exception dari sub-langkah dilempar ke generator pemanggilnya di titik
+    yield, sehingga try/except di sekitar yield berlaku seperti pada
+    pemanggilan rekursif biasa.
+
+    Args:
+        step: Generator langkah, atau nilai biasa (dikembalikan apa adanya).
+
+    Returns:
+        Nilai return generator terluar.
+    """
+    if type(step) is not GeneratorType:
+        return step
+    stack = [step]
+    value = None
+    error = None
+    while True:
+        try:
+            if error is None:
+                request = stack[-1].send(value)
+            else:
+                exc, error = error, None
+                request = stack[-1].throw(exc)
+        except StopIteration as stop:
+            stack.pop()
+            if not stack:
+                return stop.value
+            value = stop.value
+            continue
+        except Exception as exc:
+            stack.pop()
+            if not stack:
+                raise
+            error = exc
+            continue
+        if type(request) is GeneratorType:
+            stack.append(request)
+            value = None
+        else:
+            # sub-langkah yang langsung selesai (node / None), kirim balik hasilnya
+            value = request
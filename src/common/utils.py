@@ -1,7 +1,8 @@
 import os
 import json
 import sys
-from src.semantic.ast import ASTNode
+from src.semantic.ast import ASTAnnotations
+from src.semantic.traversal import child_fields
 from src.semantic.symbol_table import SymbolTables
 
 def load_dfa_rules(filepath: str | None = None) -> dict:
@@ -34,6 +35,17 @@ def read_source_code(path):
         print(f"Terjadi kesalahan saat membaca file source code '{path}': {e}")
         sys.exit(1)
 
+def open_source_code(path):
+    """Membuka file source code sebagai text stream (untuk Lexer mode streaming)."""
+    try:
+        return open(path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        print(f"Error: File source code '{path}' tidak ditemukan.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Terjadi kesalahan saat membuka file source code '{path}': {e}")
+        sys.exit(1)
+
 def print_symbol_tables(symtab: SymbolTables):
     def clean_enum(v):
         if hasattr(v, "name"):
@@ -91,49 +103,54 @@ def print_symbol_tables(symtab: SymbolTables):
             f"{e.eref:<4} | {e.low:<4} | {e.high:<4} | {e.elsz:<4} | {e.size:<4}"
         )
 
-def print_ast_tree(node, prefix="", is_last=True):
-    """Pretty-print AST tree using unicode branches."""
-    if node is None:
-        return
-
-    connector = "└── " if is_last else "├── "
-    node_name = node.__class__.__name__
-
-    # Extra annotations if available
-    extras = []
-    if getattr(node, "name", None):
-        extras.append(f"name={node.name}")
-    if getattr(node, "type", None):
-        extras.append(f"type={node.type}")
-    if getattr(node, "symbol", None):
-        extras.append(f"symbol={node.symbol}")
-    if getattr(node, "scope_level", None):
-        extras.append(f"lev={node.scope_level}")
-
-    extra_str = (" [" + ", ".join(extras) + "]") if extras else ""
-
-    print(prefix + connector + node_name + extra_str)
-
-    # Prepare prefix padding
-    child_prefix = prefix + ("    " if is_last else "│   ")
-
-    # Iterate through fields that contain AST children
-    children = []
-    for field_name, value in node.__dict__.items():
-        # Skip primitive fields
-        if field_name in ("token", "name", "type", "symbol", "scope_level", "value", "evaluated_value"):
+def print_ast_tree(node, prefix="", is_last=True, annotations: ASTAnnotations | None = None):
+    """Pretty-print AST tree using unicode branches.
+
+    type / symbol / lev are read from `annotations` (SemanticAnalyzer.annotations),
+    if given.
+    """
+    # iteratif (stack eksplisit) supaya AST yang sangat dalam tidak kena recursion limit
+    stack = [(node, prefix, is_last)]
+    while stack:
+        node, prefix, is_last = stack.pop()
+        if node is None:
             continue
 
-        # Single child
-        if isinstance(value, ASTNode):
-            children.append(value)
-
-        # List of children
-        if isinstance(value, list):
-            for item in value:
-                if isinstance(item, ASTNode):
-                    children.append(item)
-
-    # Print children
-    for i, child in enumerate(children):
-        print_ast_tree(child, child_prefix, i == len(children) - 1)
+        connector = "└── " if is_last else "├── "
+        node_name = node.__class__.__name__
+
+        # Extra annotations if available
+        extras = []
+        if getattr(node, "name", None):
+            extras.append(f"name={node.name}")
+        if annotations is not None:
+            key = id(node)
+            if annotations.type.get(key):
+                extras.append(f"type={annotations.type[key]}")
+            if annotations.symbol.get(key):
+                extras.append(f"symbol={annotations.symbol[key]}")
+            if annotations.scope_level.get(key):
+                extras.append(f"lev={annotations.scope_level[key]}")
+
+        extra_str = (" [" + ", ".join(extras) + "]") if extras else ""
+
+        print(prefix + connector + node_name + extra_str)
+
+        # Prepare prefix padding
+        child_prefix = prefix + ("    " if is_last else "│   ")
+
+        # Children from the class's child-field schema; `value` (ConstDecl / AssignStmt
+        # expression) is not printed
+        children = []
+        for field_name, is_list in child_fields(node.__class__):
+            if field_name == "value":
+                continue
+            value = getattr(node, field_name)
+            if is_list:
+                children.extend(value)
+            elif value is not None:
+                children.append(value)
+
+        # Push children in reverse so the first child is printed first
+        for i in range(len(children) - 1, -1, -1):
+            stack.append((children[i], child_prefix, i == len(children) - 1))
@@ -1,3 +1,10 @@
+import marshal
+import re
+from array import array
+
+from src.lexer.keywords import KeywordTable
+
+
 class DFA:
     @staticmethod
     def get_char_category(char: str) -> str:
@@ -54,3 +61,290 @@ class DFA:
             return current_transitions["ANY"]
         else: 
             return None
+
+
+class CompiledDFA:
+    """
+    Bentuk terkompilasi dari dfa_rules.json untuk dipakai di inner loop lexer.
+
+    Setiap state diberi id integer, setiap karakter dipetakan ke sebuah kelas
+    karakter (char class), dan transisi disimpan sebagai array next-state per
+    state yang diindeks dengan id kelas. Dengan begitu satu langkah DFA cukup
+    berupa dua kali indexing: `transitions[state][ascii_class[ord(char)]]`.
+
+    Semantik transisi identik dengan DFA.simulate_dfa_step: karakter literal
+    didahulukan, lalu kategori karakter, lalu fallback "ANY".
+    """
+    DEAD = -1
+    CATEGORIES = ("LETTER", "DIGIT", "NEWLINE", "WHITESPACE", "UNDERSCORE", "UNKNOWN")
+    WORD_LISTS = ("KEYWORDS", "WORD_ARITHMETIC", "WORD_LOGICAL")
+    # State non-final yang identitasnya diperiksa lexer (string tidak tertutup di
+    # akhir file), sehingga tidak boleh digabung saat minimisasi.
+    DISTINGUISHED_STATES = ("STRING",)
+    # Kategori yang himpunan karakternya hingga, sehingga bisa ditulis sebagai regex.
+    FINITE_CATEGORIES = {"NEWLINE": "\n\r", "UNDERSCORE": "_"}
+
+    def __init__(self, dfa_rules: dict):
+        """
+        Mengompilasi aturan DFA menjadi tabel berindeks integer.
+
+        Args:
+            dfa_rules (dict): Aturan DFA yang sudah di-load dari file JSON.
+        """
+        transitions = dfa_rules.get("transitions", {})
+        final_states = dfa_rules.get("final_states", {})
+
+        # --- State ids ---
+        names = [dfa_rules["initial_state"]]
+        for state, trans in transitions.items():
+            names.append(state)
+            names.extend(trans.values())
+        names.extend(final_states.keys())
+        self.state_names: list[str] = list(dict.fromkeys(names))
+        self.state_ids: dict[str, int] = {name: i for i, name in enumerate(self.state_names)}
+        self.initial: int = self.state_ids[dfa_rules["initial_state"]]
+
+        # --- Char classes: satu kelas per karakter literal, satu per kategori ---
+        literals = sorted({key for trans in transitions.values() for key in trans
+                           if len(key) == 1})
+        self.literal_class: dict[str, int] = {ch: i for i, ch in enumerate(literals)}
+        self.category_class: dict[str, int] = {
+            cat: len(literals) + i for i, cat in enumerate(self.CATEGORIES)
+        }
+        class_keys = [(ch, DFA.get_char_category(ch)) for ch in literals]
+        class_keys += [(None, cat) for cat in self.CATEGORIES]
+        self.num_classes: int = len(class_keys)
+
+        self.ascii_class: list[int] = [self._classify(chr(code)) for code in range(128)]
+        self._extra_class: dict[str, int] = {}
+
+        # --- Tabel next-state per state ---
+        self.transitions: list[list[int]] = []
+        for name in self.state_names:
+            trans = transitions.get(name, {})
+            row = []
+            for literal, category in class_keys:
+                if literal is not None and literal in trans:
+                    target = trans[literal]
+                elif category in trans:
+                    target = trans[category]
+                elif "ANY" in trans:
+                    target = trans["ANY"]
+                else:
+                    target = None
+                row.append(self.DEAD if target is None else self.state_ids[target])
+            self.transitions.append(row)
+
+        # --- Informasi final state per state ---
+        self.final_info: list[dict | None] = [final_states.get(name) for name in self.state_names]
+        self.is_final: list[bool] = [info is not None for info in self.final_info]
+
+        self.words: dict[str, list[str]] = {key: list(dfa_rules.get(key, [])) for key in self.WORD_LISTS}
+        self._build_fast_paths()
+
+    def _build_fast_paths(self):
+        """
+        Menyiapkan jalan pintas scan yang diturunkan dari tabel transisi.
+
+        skip_search[state]: untuk state "sink" yang berputar di dirinya sendiri
+        pada semua karakter kecuali sekumpulan karakter literal (misalnya badan
+        komentar dan string), fungsi search regex yang menemukan karakter keluar
+        berikutnya. Lexer melompat langsung ke karakter itu, bukan per karakter.
+
+        ignore_run: pattern run karakter ASCII yang dari initial state masing-masing
+        menjadi token ignore satu karakter (whitespace), sehingga satu run bisa
+        dilewati sekaligus.
+
+        keyword_table: KeywordTable untuk klasifikasi IDENTIFIER menjadi keyword
+        atau operator kata.
+        """
+        self.keyword_table = KeywordTable(self.words)
+        self.skip_search: list = [None] * len(self.transitions)
+        for state, row in enumerate(self.transitions):
+            if any(row[cls] != state for cat, cls in self.category_class.items()
+                   if cat not in self.FINITE_CATEGORIES):
+                continue
+            exits = {ch for ch, cls in self.literal_class.items() if row[cls] != state}
+            for cat, chars in self.FINITE_CATEGORIES.items():
+                if row[self.category_class[cat]] != state:
+                    exits.update(ch for ch in chars if ch not in self.literal_class)
+            if exits:
+                pattern = "[" + "".join(re.escape(ch) for ch in sorted(exits)) + "]"
+            else:
+                pattern = "(?!)"
+            self.skip_search[state] = re.compile(pattern).search
+
+        run_chars = []
+        for code in range(128):
+            target = self.transitions[self.initial][self.ascii_class[code]]
+            info = self.final_info[target] if target >= 0 else None
+            if info and info.get("ignore") and all(t == self.DEAD for t in self.transitions[target]):
+                run_chars.append(chr(code))
+        self.ignore_chars: str = "".join(run_chars)
+        self.ignore_run = re.compile("[" + "".join(map(re.escape, run_chars)) + "]+").match if run_chars else None
+
+    def minimized(self) -> "CompiledDFA":
+        """
+        Meminimalkan DFA dengan algoritma Hopcroft.
+
+        Partisi awal memisahkan final state menurut informasi token-nya (token,
+        ignore, is_error, ...), state pada DISTINGUISHED_STATES, dan state
+        non-final lainnya. State mati (DEAD) diperlakukan sebagai sink tersendiri
+        sehingga posisi berhentinya scan tidak berubah. State yang ekuivalen
+        (misalnya PLUS/MINUS/STAR/SLASH) digabung menjadi satu id.
+
+        Returns:
+            CompiledDFA: DFA baru dengan jumlah state minimal; state_ids tetap
+                memetakan semua nama state lama ke id barunya.
+        """
+        n = len(self.state_names)
+        sink = n
+        rows = [[sink if t == self.DEAD else t for t in row] for row in self.transitions]
+        rows.append([sink] * self.num_classes)
+
+        # --- Partisi awal ---
+        groups: dict[object, set[int]] = {}
+        for state in range(n):
+            name = self.state_names[state]
+            if name in self.DISTINGUISHED_STATES:
+                key = ("state", name)
+            elif self.final_info[state] is not None:
+                key = ("final", tuple(sorted(self.final_info[state].items())))
+            else:
+                key = ("nonfinal",)
+            groups.setdefault(key, set()).add(state)
+        partition = [frozenset(block) for block in groups.values()] + [frozenset([sink])]
+
+        inverse = [[[] for _ in range(n + 1)] for _ in range(self.num_classes)]
+        for state, row in enumerate(rows):
+            for cls, target in enumerate(row):
+                inverse[cls][target].append(state)
+
+        # --- Refinement ---
+        worklist = list(partition)
+        while worklist:
+            splitter = worklist.pop()
+            for cls in range(self.num_classes):
+                preimage = {s for t in splitter for s in inverse[cls][t]}
+                if not preimage:
+                    continue
+                refined = []
+                for block in partition:
+                    inside = block & preimage
+                    outside = block - preimage
+                    if not inside or not outside:
+                        refined.append(block)
+                        continue
+                    refined.extend((inside, outside))
+                    if block in worklist:
+                        worklist.remove(block)
+                        worklist.extend((inside, outside))
+                    else:
+                        worklist.append(min(inside, outside, key=len))
+                partition = refined
+
+        # --- Bangun DFA baru; urutan id mengikuti id state lama terkecil ---
+        blocks = sorted((block for block in partition if sink not in block), key=min)
+        block_of = {sink: self.DEAD}
+        for new_id, block in enumerate(blocks):
+            for state in block:
+                block_of[state] = new_id
+
+        result = CompiledDFA.__new__(CompiledDFA)
+        result.state_names = ["|".join(self.state_names[s] for s in sorted(block)) for block in blocks]
+        result.state_ids = {name: block_of[old] for name, old in self.state_ids.items()}
+        result.initial = block_of[self.initial]
+        result.literal_class = dict(self.literal_class)
+        result.category_class = dict(self.category_class)
+        result.num_classes = self.num_classes
+        result.ascii_class = list(self.ascii_class)
+        result._extra_class = {}
+        result.transitions = [[block_of[t] for t in rows[min(block)]] for block in blocks]
+        result.final_info = [self.final_info[min(block)] for block in blocks]
+        result.is_final = [info is not None for info in result.final_info]
+        result.words = {key: list(words) for key, words in self.words.items()}
+        result._build_fast_paths()
+        return result
+
+    def to_bytes(self) -> bytes:
+        """
+        Menyerialisasi tabel terkompilasi (marshal + array) untuk disimpan di cache.
+
+        Returns:
+            bytes: Representasi biner yang bisa dibaca kembali dengan from_bytes.
+        """
+        flat = array("i")
+        for row in self.transitions:
+            flat.extend(row)
+        return marshal.dumps({
+            "state_names": self.state_names,
+            "state_ids": self.state_ids,
+            "initial": self.initial,
+            "literal_class": self.literal_class,
+            "category_class": self.category_class,
+            "num_classes": self.num_classes,
+            "ascii_class": array("B", self.ascii_class).tobytes(),
+            "transitions": flat.tobytes(),
+            "final_info": self.final_info,
+            "words": self.words,
+        })
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CompiledDFA":
+        """
+        Membangun CompiledDFA dari hasil to_bytes tanpa mem-parsing dfa_rules.json.
+
+        Args:
+            data (bytes): Hasil CompiledDFA.to_bytes.
+
+        Returns:
+            CompiledDFA: DFA dengan tabel yang identik.
+        """
+        tables = marshal.loads(data)
+        dfa = cls.__new__(cls)
+        dfa.state_names = tables["state_names"]
+        dfa.state_ids = tables["state_ids"]
+        dfa.initial = tables["initial"]
+        dfa.literal_class = tables["literal_class"]
+        dfa.category_class = tables["category_class"]
+        dfa.num_classes = width = tables["num_classes"]
+        ascii_class = array("B")
+        ascii_class.frombytes(tables["ascii_class"])
+        dfa.ascii_class = ascii_class.tolist()
+        dfa._extra_class = {}
+        flat = array("i")
+        flat.frombytes(tables["transitions"])
+        dfa.transitions = [flat[i:i + width].tolist() for i in range(0, len(flat), width)]
+        dfa.final_info = tables["final_info"]
+        dfa.is_final = [info is not None for info in dfa.final_info]
+        dfa.words = tables["words"]
+        dfa._build_fast_paths()
+        return dfa
+
+    def _classify(self, char: str) -> int:
+        if char in self.literal_class:
+            return self.literal_class[char]
+        return self.category_class[DFA.get_char_category(char)]
+
+    def char_class(self, char: str) -> int:
+        """
+        Mengembalikan id kelas karakter. Karakter ASCII dilayani dari tabel dense,
+        karakter lain diklasifikasikan sekali lalu di-cache.
+        """
+        code = ord(char)
+        if code < 128:
+            return self.ascii_class[code]
+        cls = self._extra_class.get(char)
+        if cls is None:
+            cls = self._classify(char)
+            self._extra_class[char] = cls
+        return cls
+
+    def step(self, state: int, char: str) -> int:
+        """
+        Melakukan satu langkah transisi pada tabel terkompilasi.
+
+        Returns:
+            int: Id state berikutnya, atau CompiledDFA.DEAD jika tidak ada transisi.
+        """
+        return self.transitions[state][self.char_class(char)]
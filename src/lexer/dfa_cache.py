@@ -0,0 +1,79 @@
+import hashlib
+import os
+
+from src.common.utils import load_dfa_rules
+from src.lexer.dfa import CompiledDFA
+
+# Dinaikkan setiap kali format CompiledDFA.to_bytes atau algoritma minimisasi berubah.
+CACHE_VERSION = 1
+
+
+def default_rules_path() -> str:
+    return os.path.join(os.path.dirname(__file__), "dfa_rules.json")
+
+
+def cache_path(rules_bytes: bytes, cache_dir: str) -> str:
+    """
+    Nama file cache untuk isi dfa_rules.json tertentu.
+
+    Args:
+        rules_bytes (bytes): Isi mentah dfa_rules.json.
+        cache_dir (str): Direktori cache.
+
+    Returns:
+        str: Path file cache yang di-key dengan SHA-256 isi file dan CACHE_VERSION.
+    """
+    digest = hashlib.sha256(rules_bytes).hexdigest()
+    return os.path.join(cache_dir, f"dfa_rules.v{CACHE_VERSION}.{digest}.bin")
+
+
+def build_compiled_dfa(filepath: str | None = None) -> CompiledDFA:
+    """Mem-parsing dfa_rules.json, mengompilasi, lalu meminimalkan DFA-nya."""
+    return CompiledDFA(load_dfa_rules(filepath)).minimized()
+
+
+def load_compiled_dfa(filepath: str | None = None, cache_dir: str | None = None) -> CompiledDFA:
+    """
+    Memuat DFA terkompilasi dan minimal dari cache biner, membangunnya bila belum ada.
+
+    Cache di-key dengan SHA-256 isi dfa_rules.json, sehingga perubahan aturan
+    otomatis membuat cache baru. Jika cache tidak bisa ditulis (misalnya direktori
+    read-only), DFA tetap dikembalikan tanpa cache.
+
+    Args:
+        filepath (str | None): Path dfa_rules.json; default file bawaan lexer.
+        cache_dir (str | None): Direktori cache; default __pycache__ di samping
+            file aturan.
+
+    Returns:
+        CompiledDFA: DFA yang siap diberikan ke Lexer.
+    """
+    if filepath is None:
+        filepath = default_rules_path()
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(filepath)), "__pycache__")
+
+    try:
+        with open(filepath, 'rb') as file:
+            rules_bytes = file.read()
+    except OSError:
+        # Biarkan load_dfa_rules yang melaporkan error-nya.
+        return build_compiled_dfa(filepath)
+
+    path = cache_path(rules_bytes, cache_dir)
+    try:
+        with open(path, 'rb') as file:
+            return CompiledDFA.from_bytes(file.read())
+    except (OSError, ValueError, EOFError, TypeError, KeyError):
+        pass
+
+    dfa = build_compiled_dfa(filepath)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as file:
+            file.write(dfa.to_bytes())
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    return dfa
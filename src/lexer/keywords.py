@@ -0,0 +1,53 @@
+import sys
+
+
+class KeywordTable:
+    """
+    Tabel klasifikasi keyword dan operator kata (div/mod/dan/...) dari dfa_rules.json.
+
+    Setiap kata dipetakan ke (token_type, keyword) dengan `keyword` berupa ejaan
+    kanonik (huruf kecil, di-intern) yang dipasang di Token.keyword, sehingga
+    parser dan AST builder tidak perlu memanggil .lower() lagi.
+
+    Lookup dilakukan per ejaan persis: ejaan yang sudah pernah dilihat (termasuk
+    identifier biasa) dijawab dengan satu lookup dict tanpa .lower(). Ejaan baru
+    di-fold sekali lalu disimpan. Memo dibatasi MAX_SPELLINGS agar tidak tumbuh
+    tanpa batas ketika tabel dipakai ulang untuk banyak file.
+    """
+    MAX_SPELLINGS = 1 << 14
+    # Urutan prioritas sama dengan lexer lama: KEYWORDS > WORD_ARITHMETIC > WORD_LOGICAL.
+    WORD_LISTS = (("WORD_LOGICAL", "LOGICAL_OPERATOR"),
+                  ("WORD_ARITHMETIC", "ARITHMETIC_OPERATOR"),
+                  ("KEYWORDS", "KEYWORD"))
+    NOT_A_WORD = ("IDENTIFIER", None)
+
+    def __init__(self, words: dict[str, list[str]]):
+        """
+        Args:
+            words (dict[str, list[str]]): Daftar kata per kunci (KEYWORDS,
+                WORD_ARITHMETIC, WORD_LOGICAL), seperti di dfa_rules.json.
+        """
+        self.canonical: dict[str, tuple[str, str]] = {}
+        for key, token_type in self.WORD_LISTS:
+            for word in words.get(key, []):
+                folded = sys.intern(word.lower())
+                self.canonical[folded] = (token_type, folded)
+        self._spellings: dict[str, tuple[str, str | None]] = dict(self.canonical)
+
+    def classify(self, lexeme: str) -> tuple[str, str | None]:
+        """
+        Mengklasifikasikan lexeme IDENTIFIER.
+
+        Args:
+            lexeme (str): Teks lexeme apa adanya dari source.
+
+        Returns:
+            tuple[str, str | None]: (token_type, keyword kanonik atau None).
+        """
+        result = self._spellings.get(lexeme)
+        if result is None:
+            result = self.canonical.get(lexeme.lower(), self.NOT_A_WORD)
+            if len(self._spellings) >= self.MAX_SPELLINGS:
+                self._spellings = dict(self.canonical)
+            self._spellings[lexeme] = result
+        return result
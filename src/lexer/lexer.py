@@ -1,177 +1,451 @@
 import logging
+from bisect import bisect_left
+from typing import Iterator, TextIO
 from src.common.pascal_token import Token
+from src.common.token_kinds import KIND_IDS, WORD_IDS, TokenKind, Word
 from src.common.errors import LexicalError
-from src.lexer.dfa import DFA
+from src.common.line_index import LineCounter, LineIndex
+from src.common.token_stream import TokenStream, lexeme_value, number_value
+from src.lexer.dfa import DFA, CompiledDFA
+from src.lexer.regex_engine import get_regex_engine
 
 class Lexer:
     """
     Lexer: mengubah string kode sumber mentah menjadi daftar objek Token
     berdasarkan aturan yang didefinisikan dalam file DFA.
+
+    Sumber bisa berupa satu string utuh atau text stream (file-like). Untuk
+    stream, lexer hanya memegang sliding buffer: teks sebelum token yang sedang
+    di-scan dibuang, sehingga memori sebanding dengan ukuran chunk dan token
+    terpanjang, bukan ukuran file.
     """
-    def __init__(self, source_code: str, dfa_rules: dict, raise_on_error: bool = False):
+    DEFAULT_CHUNK_SIZE = 1 << 16
+    ENGINES = ("dfa", "regex")
+
+    def __init__(self, source_code: str | TextIO, dfa_rules: dict | CompiledDFA, raise_on_error: bool = False,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, engine: str = "dfa", recover: bool = False):
         """
         Inisialisasi lexer.
         
         Args:
-            source_code (str): Seluruh kode sumber PASCAL-S sebagai satu string.
-            dfa_rules (dict): Aturan DFA yang sudah di-load dari file JSON.
+            source_code (str | TextIO): Seluruh kode sumber PASCAL-S sebagai satu string,
+                atau text stream yang akan dibaca per chunk.
+            dfa_rules (dict | CompiledDFA): Aturan DFA yang sudah di-load dari file JSON,
+                atau DFA yang sudah dikompilasi (lihat dfa_cache.load_compiled_dfa).
+            chunk_size (int): Jumlah karakter per pembacaan stream.
+            engine (str): "dfa" (simulasi tabel DFA) atau "regex" (RegexEngine,
+                hanya untuk source_code berupa string).
+            recover (bool): Jika True, error leksikal tidak menghentikan lexing;
+                semua error dicatat di `errors` (raise_on_error diabaikan).
         """
-        self.source_code = source_code
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown lexer engine '{engine}'")
+        if isinstance(source_code, str):
+            self.source_code = source_code
+            self._stream = None
+            self.line_index = LineIndex(source_code)
+        else:
+            self.source_code = ""
+            self._stream = source_code
+            self._line_counter = LineCounter()
+        self._base = 0
+        self._eof = self._stream is None
+        # Posisi terjauh yang pernah dibaca scan DFA, dan per token yang dihasilkan
+        # iter_tokens: seberapa jauh (relatif terhadap awal token) scan-scan sebelum
+        # token itu membaca. Dipakai relex untuk memilih titik restart yang aman.
+        self._reach = -1
+        self._token_reach: list[int] | None = [] if self._stream is None else None
+        # Rentang token yang diganti relex terakhir: token lama [start, old_end)
+        # menjadi token baru [start, new_end); token lain objeknya tetap sama.
+        self.relexed_range: tuple[int, int, int] | None = None
+        self.chunk_size = chunk_size
         self.dfa_rules = dfa_rules
         self.current_pos = 0
-        self.current_line = 1
-        self.current_col = 1
         self.fatal_error = False
         self.raise_on_error = raise_on_error
+        self.recover = recover
+        self.errors: list[LexicalError] = []
         
-        self.keywords = set(dfa_rules.get("KEYWORDS", []))
-        self.word_arithmetic = set(dfa_rules.get("WORD_ARITHMETIC", []))
-        self.word_logical = set(dfa_rules.get("WORD_LOGICAL", []))
+        self.dfa = dfa_rules if isinstance(dfa_rules, CompiledDFA) else CompiledDFA(dfa_rules)
+        # Memo scan (hanya sumber string) agar longest match tetap linear:
+        # - _sink_exhausted[state]: posisi terkecil yang diketahui tidak punya karakter
+        #   keluar dari state sink tersebut sampai akhir source;
+        # - _dead_scans[(state, pos)]: akhir scan (state, pos, dead_end) untuk masuknya
+        #   sebuah state sink yang sudah terbukti tidak mencapai final state lagi,
+        #   misalnya '(*' yang tidak pernah ditutup.
+        self._sink_exhausted: list[float] | None = None
+        self._dead_scans: dict[tuple[int, int], tuple[int, int, bool]] | None = None
+        if self._stream is None:
+            self._reset_scan_memo()
+        self.keyword_table = self.dfa.keyword_table
+        self._string_state = self.dfa.state_ids.get("STRING", CompiledDFA.DEAD)
+
+        self._regex = None
+        # True setelah engine regex menemukan scan tanpa final state sampai akhir
+        # source (lihat _scan_next_regex): sisa source di-lex dengan loop DFA
+        self._regex_fallback = False
+        if engine == "regex":
+            if self._stream is not None:
+                raise ValueError("Regex engine membutuhkan source_code berupa string")
+            self._regex = get_regex_engine(self.dfa, dfa_rules)
+            self._classes = self._regex.translate(self.source_code)
+
+    def _reset_scan_memo(self):
+        self._sink_exhausted = [float("inf")] * len(self.dfa.transitions)
+        self._dead_scans = {}
+
+    @property
+    def current_line(self) -> int:
+        return self._line_col(self.current_pos)[0]
+
+    @property
+    def current_col(self) -> int:
+        return self._line_col(self.current_pos)[1]
+
+    def _line_col(self, pos: int) -> tuple[int, int]:
+        """Menghitung (line, column) untuk posisi `pos` di dalam buffer."""
+        if self._stream is None:
+            return self.line_index.line_col(pos)
+        return self._line_counter.line_col(self.source_code, self._base, self._base + pos)
+
+    def _fill_buffer(self) -> bool:
+        """
+        Membaca chunk berikutnya dari stream dan menambahkannya ke buffer.
+        Ukuran baca ikut membesar dengan buffer agar token yang sangat panjang
+        tetap dibaca dalam waktu linear.
+
+        Returns:
+            bool: False jika stream sudah habis.
+        """
+        if self._eof:
+            return False
+        chunk = self._stream.read(max(self.chunk_size, len(self.source_code)))
+        if not chunk:
+            self._eof = True
+            return False
+        self.source_code += chunk
+        return True
+
+    def _compact_buffer(self):
+        """Membuang teks yang sudah selesai diproses dari awal buffer."""
+        if self.current_pos < self.chunk_size:
+            return
+        self._line_col(self.current_pos)
+        self.source_code = self.source_code[self.current_pos:]
+        self._base += self.current_pos
+        self.current_pos = 0
 
     def _get_next_token(self) -> Token | None:
         """
         Menganalisis kode sumber dari posisi saat ini untuk menemukan satu token berikutnya
         menggunakan aturan 'longest match'.
         """
+        reach = self._reach
+        span = self._scan_next()
+        if span is None:
+            return None
+        token_type, start, end, keyword = span
+        if self._token_reach is not None:
+            self._token_reach.append(reach - start)
+        line, col = self._line_col(start)
+        value = lexeme_value(token_type, self.source_code, start, end)
+        number = number_value(value) if token_type == "NUMBER" else None
+        return Token(token_type=token_type, value=value, line=line, column=col, keyword=keyword, number=number,
+                     kind=KIND_IDS.get(token_type, TokenKind.UNKNOWN),
+                     word=WORD_IDS.get(keyword, Word.NONE) if keyword is not None else Word.NONE)
+
+    def _scan_next(self) -> tuple[str, int, int, str | None] | None:
+        """
+        Menjalankan DFA dari posisi saat ini dan mengembalikan (token_type, start, end,
+        keyword) untuk token berikutnya, atau None jika token diabaikan / terjadi error.
+        """
+        if self._regex is not None and not self._regex_fallback:
+            return self._scan_next_regex()
+
+        if self._stream is not None:
+            self._compact_buffer()
+            if self.current_pos >= len(self.source_code):
+                self._fill_buffer()
+
         if self.current_pos >= len(self.source_code):
             return None  
 
         start_pos = self.current_pos
-        start_line = self.current_line
-        start_col = self.current_col
 
-        last_final_state = None
+        source = self.source_code
+        source_len = len(source)
+        dfa = self.dfa
+
+        if source[start_pos] in dfa.ignore_chars:
+            # Jalan pintas: satu run whitespace = rangkaian token ignore satu karakter.
+            self.current_pos = dfa.ignore_run(source, start_pos).end()
+            if self.current_pos > self._reach:
+                self._reach = self.current_pos
+            return None
+
+        ascii_class = dfa.ascii_class
+        transitions = dfa.transitions
+        is_final = dfa.is_final
+        skip_search = dfa.skip_search
+        sink_exhausted = self._sink_exhausted
+        dead_scans = self._dead_scans
+        sink_entries = []
+
+        last_final_state = CompiledDFA.DEAD
         last_final_pos = -1
-        
-        current_state = self.dfa_rules["initial_state"]
+
+        current_state = dfa.initial
         pos_tracker = self.current_pos
-        next_state = None
+        dead_end = False
 
-        while pos_tracker < len(self.source_code):
-            char = self.source_code[pos_tracker]
-            
-            next_state = DFA.simulate_dfa_step(current_state, char, self.dfa_rules)
+        while True:
+            if pos_tracker >= source_len:
+                # Longest match boleh melewati batas buffer: baca chunk berikutnya
+                # lalu lanjutkan scan dari state yang sama.
+                if not self._fill_buffer():
+                    break
+                source = self.source_code
+                source_len = len(source)
+
+            code = ord(source[pos_tracker])
+            char_class = ascii_class[code] if code < 128 else dfa.char_class(source[pos_tracker])
+            next_state = transitions[current_state][char_class]
 
-            if next_state is None:
+            if next_state < 0:
+                dead_end = True
                 break
-            
+
             current_state = next_state
             pos_tracker += 1
 
-            if current_state in self.dfa_rules["final_states"]:
+            skip = skip_search[current_state]
+            if skip is not None:
+                if dead_scans is not None:
+                    outcome = dead_scans.get((current_state, pos_tracker))
+                    if outcome is not None:
+                        current_state, pos_tracker, dead_end = outcome
+                        break
+                    sink_entries.append((current_state, pos_tracker))
+                # State sink (badan komentar/string): lompat ke karakter keluar berikutnya.
+                if sink_exhausted is not None and pos_tracker >= sink_exhausted[current_state]:
+                    pos_tracker = source_len
+                else:
+                    found = skip(source, pos_tracker)
+                    if found:
+                        pos_tracker = found.start()
+                    else:
+                        if sink_exhausted is not None:
+                            sink_exhausted[current_state] = pos_tracker
+                        pos_tracker = source_len
+
+            if is_final[current_state]:
                 last_final_state = current_state
                 last_final_pos = pos_tracker
 
-        if last_final_state and self.dfa_rules["final_states"][last_final_state].get("is_error", False):
-            error_type = self.dfa_rules["final_states"][last_final_state].get("error_type", "UNKNOWN")
-            if error_type == "UNTERMINATED_STRING":
-                msg = f"Unterminated string literal"
-                logging.error(f"{msg} at Line {start_line}:{start_col}")
-                if self.raise_on_error:
-                    raise LexicalError(msg, start_line, start_col)
-            self.fatal_error = True
-            self._advance_pos()
+        if pos_tracker > self._reach:
+            self._reach = pos_tracker
+        if sink_entries:
+            outcome = (current_state, pos_tracker, dead_end)
+            for entry in sink_entries:
+                if entry[1] > last_final_pos:
+                    dead_scans[entry] = outcome
+
+        token_info = dfa.final_info[last_final_state] if last_final_state >= 0 else None
+
+        if token_info and token_info.get("is_error", False):
+            self._handle_error_state(token_info, start_pos, last_final_pos)
             return None
 
-        if pos_tracker >= len(self.source_code) and current_state == "STRING":
-            msg = "Unterminated string literal"
-            logging.error(f"{msg} at Line {start_line}:{start_col}")
-            if self.raise_on_error:
-                raise LexicalError(msg, start_line, start_col)
-            self.fatal_error = True
+        if pos_tracker >= source_len and current_state == self._string_state:
+            self._handle_unterminated_string(start_pos)
             return None
 
-        if last_final_state is None:
-            if start_pos < len(self.source_code) and not self.source_code[start_pos].isspace():
-                self._handle_error(self.source_code[start_pos], start_line, start_col)
+        if token_info is None:
+            if start_pos < source_len and not source[start_pos].isspace():
+                self._handle_error(source[start_pos], start_pos)
             
             self._advance_pos() 
             return None
 
-        lexeme = self.source_code[start_pos:last_final_pos]
-        
-        if pos_tracker < len(self.source_code) and last_final_pos < len(self.source_code):
-            next_char = self.source_code[last_final_pos]
-            token_info = self.dfa_rules["final_states"][last_final_state]
+        if pos_tracker < source_len and last_final_pos < source_len:
+            next_char = source[last_final_pos]
             
             if token_info["token"] == "NUMBER" and (next_char.isalpha() or next_char == '_'):
-                if next_state is None: 
-                    self._handle_error(next_char, start_line, start_col + (last_final_pos - start_pos))
-                    self.fatal_error = True
+                if dead_end: 
+                    self._handle_number_suffix(next_char, last_final_pos)
                     return None
         
-        self._set_pos_to(last_final_pos)
+        self.current_pos = last_final_pos
         
-        return self._finalize_token(lexeme, last_final_state, start_line, start_col)
+        classified = self._classify_token(token_info, start_pos, last_final_pos)
+        if classified is None:
+            return None
+        return classified[0], start_pos, last_final_pos, classified[1]
 
-    def _finalize_token(self, lexeme: str, final_state: str, line: int, col: int) -> Token | None:
+    def _scan_next_regex(self) -> tuple[str, int, int, str | None] | None:
         """
-        Membuat objek Token, melakukan lookup keyword, dan mengecek flag 'ignore'.
+        Padanan _scan_next untuk RegexEngine. Posisi/state akhir scan DFA hanya
+        dihitung (lewat scan_pattern) pada kasus yang membutuhkannya.
         """
-        token_info = self.dfa_rules["final_states"][final_state]
+        source = self.source_code
+        source_len = len(source)
+        start_pos = self.current_pos
+        if start_pos >= source_len:
+            return None
+
+        engine = self._regex
+        scan = None
+        if self._classes[start_pos] in engine.sink_starts:
+            # Scan dari sini bisa masuk badan komentar / string. Kalau scan itu baru
+            # berhenti di akhir source tanpa final state (komentar tidak ditutup),
+            # master_pattern mundur dari akhir source untuk setiap token sesudahnya
+            # (kuadratik): sisa source di-lex dengan loop DFA yang punya memo scan.
+            scan = engine.scan_pattern.match(self._classes, start_pos)
+            if scan.end() >= source_len and not self.dfa.is_final[engine.group_states[scan.lastgroup]]:
+                self._regex_fallback = True
+                return self._scan_next()
+
+        match = engine.master_pattern.match(self._classes, start_pos)
+        if match:
+            final_state = engine.group_states[match.lastgroup]
+            end_pos = match.end()
+            token_info = self.dfa.final_info[final_state]
+        else:
+            final_state = CompiledDFA.DEAD
+            end_pos = -1
+            token_info = None
+
+        if token_info and token_info.get("is_error", False):
+            self._handle_error_state(token_info, start_pos, end_pos)
+            return None
+
+        if final_state < 0 or engine.may_reach_string[final_state]:
+            if scan is None:
+                scan = engine.scan_pattern.match(self._classes, start_pos)
+            if scan and scan.end() >= source_len and engine.group_states[scan.lastgroup] == self._string_state:
+                self._handle_unterminated_string(start_pos)
+                return None
+
+        if token_info is None:
+            if not source[start_pos].isspace():
+                self._handle_error(source[start_pos], start_pos)
+
+            self._advance_pos()
+            return None
+
+        if end_pos < source_len and token_info["token"] == "NUMBER":
+            next_char = source[end_pos]
+            if next_char.isalpha() or next_char == '_':
+                scan = engine.scan_pattern.match(self._classes, start_pos)
+                if scan.end() < source_len:
+                    self._handle_number_suffix(next_char, end_pos)
+                    return None
+
+        self.current_pos = end_pos
+
+        classified = self._classify_token(token_info, start_pos, end_pos)
+        if classified is None:
+            return None
+        return classified[0], start_pos, end_pos, classified[1]
+
+    def _classify_token(self, token_info: dict, start: int, end: int) -> tuple[str, str | None] | None:
+        """
+        Menentukan jenis token akhir: lookup keyword, pemisahan CHAR/STRING literal,
+        dan pengecekan flag 'ignore' (mengembalikan None).
+
+        Returns:
+            tuple[str, str | None] | None: (token_type, keyword kanonik atau None).
+        """
+        if token_info.get("ignore", False):
+            return None
+
         token_type = token_info["token"]
 
         if token_type == "IDENTIFIER":
-            lexeme_lower = lexeme.lower()
-            if lexeme_lower in self.keywords:
-                token_type = "KEYWORD"
-            elif lexeme_lower in self.word_arithmetic:
-                token_type = "ARITHMETIC_OPERATOR"
-            elif lexeme_lower in self.word_logical:
-                token_type = "LOGICAL_OPERATOR"
+            return self.keyword_table.classify(self.source_code[start:end])
         
         if token_type == "STRING_LITERAL":
-            string_content = lexeme[1:-1]
-            string_content = string_content.replace("\'\'", "\'")
-            if len(string_content) <= 1:
+            # Panjang isi setelah '' dinormalisasi menjadi ': setiap pasangan '' terhitung satu
+            content_len = end - start - 2 - self.source_code.count("\'\'", start + 1, end - 1)
+            if content_len <= 1:
                 token_type = "CHAR_LITERAL"
-            lexeme = f"\'{string_content}\'"
         
-        if token_info.get("ignore", False):
-            return None  
+        return token_type, None
+
+    def _handle_error_state(self, token_info: dict, start_pos: int, end_pos: int):
+        """Menangani final state bertanda is_error (mis. newline di dalam string)."""
+        if token_info.get("error_type", "UNKNOWN") == "UNTERMINATED_STRING":
+            self._report_unterminated_string(start_pos)
+        if self.recover:
+            # Lanjut setelah lexeme error (untuk string: setelah newline-nya).
+            self.current_pos = end_pos
+            return
+        self.fatal_error = True
+        self._advance_pos()
+
+    def _handle_unterminated_string(self, start_pos: int):
+        """Menangani string yang belum ditutup saat source habis."""
+        self._report_unterminated_string(start_pos)
+        if self.recover:
+            self.current_pos = len(self.source_code)
+            return
+        self.fatal_error = True
+
+    def _report_unterminated_string(self, start_pos: int):
+        self._report("Unterminated string literal", start_pos)
 
-        return Token(token_type=token_type, value=lexeme, line=line, column=col)
+    def _handle_number_suffix(self, char: str, pos: int):
+        """
+        Menangani NUMBER yang langsung diikuti huruf atau '_' (mis. 12abc).
+        Dalam mode recover, sisa kata (huruf/digit/'_') dilewati tanpa menghasilkan token.
+        """
+        self._handle_error(char, pos)
+        if not self.recover:
+            self.fatal_error = True
+            return
+        source = self.source_code
+        while True:
+            if pos >= len(source):
+                if not self._fill_buffer():
+                    break
+                source = self.source_code
+            if DFA.get_char_category(source[pos]) not in ("LETTER", "DIGIT", "UNDERSCORE"):
+                break
+            pos += 1
+        self.current_pos = pos
 
-    def _handle_error(self, char: str, line: int, col: int):
+    def _handle_error(self, char: str, pos: int):
         """
         Menangani error karakter tidak dikenal.
         """
-        msg = f"Invalid character '{char}'"
+        self._report(f"Invalid character '{char}'", pos)
+
+    def _report(self, msg: str, pos: int):
+        """Mencatat LexicalError di `errors`, menulis log, dan melemparnya jika raise_on_error."""
+        line, col = self._line_col(pos)
         logging.error(f"{msg} at Line {line}:{col}")
-        if self.raise_on_error:
-            raise LexicalError(msg, line, col)
+        error = LexicalError(msg, line, col)
+        self.errors.append(error)
+        if self.raise_on_error and not self.recover:
+            raise error
 
     def _advance_pos(self):
-        """Helper untuk memajukan lexer 1 karakter dan update line/col."""
+        """Helper untuk memajukan lexer 1 karakter (pasangan CRLF dilewati sebagai satu kesatuan)."""
         if self.current_pos >= len(self.source_code):
             return
 
         char = self.source_code[self.current_pos]
-        
-        if char == '\r':
-            self.current_line += 1
-            self.current_col = 1
-            self.current_pos += 1
-            if self.current_pos < len(self.source_code) and self.source_code[self.current_pos] == '\n':
-                self.current_pos += 1
-        elif char == '\n':
-            self.current_line += 1
-            self.current_col = 1
-            self.current_pos += 1
-        else:
-            self.current_col += 1
+        self.current_pos += 1
+        if char == '\r' and self.current_pos >= len(self.source_code):
+            self._fill_buffer()
+        if char == '\r' and self.current_pos < len(self.source_code) and self.source_code[self.current_pos] == '\n':
             self.current_pos += 1
 
-    def _set_pos_to(self, new_pos: int):
-        """Helper untuk menggerakkan lexer ke posisi baru (setelah token) dan update line/col."""
-        while self.current_pos < new_pos:
-            self._advance_pos()
-
-    def tokenize(self) -> list[Token]:
+    def iter_tokens(self) -> Iterator[Token]:
         """
-        Fungsi publik utama untuk menjalankan keseluruhan proses tokenisasi. 
+        Generator token: menghasilkan Token satu per satu sambil membaca sumber.
+        Berhenti pada akhir sumber atau setelah fatal error.
         """
-        tokens = []
         while True:
             token = self._get_next_token()
             
@@ -179,10 +453,182 @@ class Lexer:
                 break
                 
             if token is None:
-                if self.current_pos >= len(self.source_code):
+                if self.current_pos >= len(self.source_code) and self._eof:
                     break
                 continue  
             
-            tokens.append(token)
-            
-        return tokens
\ No newline at end of file
+            yield token
+
+    def tokenize_compact(self) -> TokenStream:
+        """
+        Tokenisasi ke TokenStream (struct-of-arrays) tanpa membuat objek Token
+        maupun string lexeme per token. Hanya untuk sumber berupa string.
+        """
+        if self._stream is not None:
+            raise ValueError("tokenize_compact membutuhkan source_code berupa string")
+
+        source = self.source_code
+        tokens = TokenStream(source)
+        append = tokens.append
+        while True:
+            span = self._scan_next()
+
+            if self.fatal_error:
+                break
+
+            if span is None:
+                if self.current_pos >= len(self.source_code):
+                    break
+                continue
+
+            token_type, start, end, keyword = span
+            line, col = self.line_index.line_col(start)
+            if token_type == "NUMBER":
+                append(token_type, start, end, line, col, keyword, number_value(source[start:end]))
+            else:
+                append(token_type, start, end, line, col, keyword)
+
+        return tokens
+
+    def tokenize(self) -> list[Token]:
+        """
+        Fungsi publik utama untuk menjalankan keseluruhan proses tokenisasi. 
+        """
+        return list(self.iter_tokens())
+
+    def tokenize_with_diagnostics(self) -> tuple[list[Token], list[LexicalError]]:
+        """
+        Tokenisasi dalam mode recover: seluruh file diproses dalam satu pass dan
+        setiap error leksikal dikembalikan bersama token, bukan menghentikan lexing.
+
+        Returns:
+            tuple[list[Token], list[LexicalError]]: Token dan daftar error (berurutan
+                menurut posisi, dengan line/column di atribut error).
+        """
+        self.recover = True
+        tokens = self.tokenize()
+        return tokens, self.errors
+
+    def relex(self, tokens: list[Token], edit_offset: int, removed_len: int, inserted_text: str) -> list[Token]:
+        """
+        Memperbarui hasil tokenize() setelah satu edit teks, tanpa me-lex ulang seluruh sumber.
+
+        Lexing dimulai ulang dari awal token terakhir sebelum edit yang scan-scan
+        sebelumnya tidak membaca sampai ke daerah edit, lalu berhenti begitu token
+        baru dimulai tepat di offset (yang sudah digeser) sebuah token lama setelah
+        edit: dari titik itu DFA berada di state awal pada teks yang sama sehingga
+        sisa token pasti identik. Token lama setelah titik itu dipakai ulang; hanya
+        line/column-nya yang digeser.
+
+        Args:
+            tokens (list[Token]): Hasil tokenize() lexer ini (atau relex sebelumnya).
+                List ini diubah di tempat.
+            edit_offset (int): Offset awal edit pada source_code saat ini.
+            removed_len (int): Jumlah karakter yang dihapus mulai edit_offset.
+            inserted_text (str): Teks yang disisipkan di edit_offset.
+
+        Returns:
+            list[Token]: `tokens` yang sudah diperbarui; source_code lexer ikut diperbarui.
+                Daftar `errors` tidak disesuaikan oleh relex. Rentang token yang
+                diganti dicatat di `relexed_range`.
+        """
+        if self._stream is not None or self._regex is not None:
+            raise ValueError("relex membutuhkan source_code berupa string dan engine 'dfa'")
+        token_reach = self._token_reach
+        if len(token_reach) != len(tokens) or (self.current_pos < len(self.source_code) and not self.fatal_error):
+            raise ValueError("relex membutuhkan hasil tokenize() yang lengkap dari lexer ini")
+
+        index = self.line_index
+        edit_end = edit_offset + removed_len
+        delta = len(inserted_text) - removed_len
+        old_fatal, old_reach, old_pos = self.fatal_error, self._reach, self.current_pos
+        old_line_count = index.line_count
+        edit_end_line, edit_end_col = index.line_col(edit_end)
+        edit_end_line_start = edit_end - edit_end_col + 1
+
+        def position(token: Token) -> tuple[int, int]:
+            return token.line, token.column
+
+        # --- Titik restart: token terakhir yang aman sebelum edit ---
+        # Offset token sebelum edit tidak berubah oleh edit, jadi boleh dihitung
+        # dengan tabel baris sebelum maupun sesudah edit.
+        def start_before_edit(i: int) -> int:
+            return index.offset(tokens[i].line, tokens[i].column)
+
+        restart = bisect_left(tokens, index.line_col(edit_offset), key=position)
+        while restart > 0 and (restart == len(tokens) or start_before_edit(restart) + token_reach[restart] >= edit_offset):
+            restart -= 1
+        if restart < len(tokens) and start_before_edit(restart) + token_reach[restart] < edit_offset:
+            restart_pos = start_before_edit(restart)
+            self._reach = restart_pos + token_reach[restart]
+        else:
+            restart_pos = 0
+            self._reach = -1
+        old_next = bisect_left(tokens, (edit_end_line, edit_end_col), lo=restart, key=position)
+
+        self.source_code = self.source_code[:edit_offset] + inserted_text + self.source_code[edit_end:]
+        index.apply_edit(self.source_code, edit_offset, removed_len, len(inserted_text))
+        self._reset_scan_memo()
+        line_delta = index.line_count - old_line_count
+        self.current_pos = restart_pos
+        self.fatal_error = False
+
+        # Offset baru token lama yang terletak setelah edit (line/column-nya masih lama).
+        def shifted_start(i: int) -> int:
+            token = tokens[i]
+            if token.line == edit_end_line:
+                return edit_end_line_start + token.column - 1 + delta
+            return index.offset(token.line + line_delta, token.column)
+
+        # --- Lex ulang sampai sinkron dengan token lama ---
+        new_tokens: list[Token] = []
+        self._token_reach = new_reach = []
+        resync = None
+        while True:
+            reach = self._reach
+            token = self._get_next_token()
+            if self.fatal_error:
+                break
+            if token is None:
+                if self.current_pos >= len(self.source_code):
+                    break
+                continue
+            start = index.offset(token.line, token.column)
+            while old_next < len(tokens) and shifted_start(old_next) < start:
+                old_next += 1
+            if old_next < len(tokens) and shifted_start(old_next) == start:
+                new_reach.pop()
+                resync = old_next
+                break
+            new_tokens.append(token)
+
+        if resync is None:
+            self.relexed_range = (restart, len(tokens), restart + len(new_tokens))
+            tokens[restart:] = new_tokens
+            token_reach[restart:] = new_reach
+            self._token_reach = token_reach
+            return tokens
+
+        # --- Sambung token lama: geser posisi, perbarui jangkauan scan ---
+        # Token lama mulai dari `resync` hanya perlu disentuh selama masih di baris
+        # edit (column berubah), line-nya bergeser, atau jangkauan scan baru
+        # (`reach`) melewati awal token tersebut.
+        self.relexed_range = (restart, resync, restart + len(new_tokens))
+        tokens[restart:resync] = new_tokens
+        token_reach[restart:resync] = new_reach
+        for i in range(restart + len(new_tokens), len(tokens)):
+            token = tokens[i]
+            start = shifted_start(i)
+            if token.line != edit_end_line and not line_delta and start >= reach:
+                break
+            token_reach[i] = max(token_reach[i], reach - start)
+            if token.line == edit_end_line:
+                token.line, token.column = index.line_col(start)
+            else:
+                token.line += line_delta
+
+        self._token_reach = token_reach
+        self.fatal_error = old_fatal
+        self._reach = old_reach + delta
+        self.current_pos = old_pos + delta
+        return tokens
@@ -0,0 +1,229 @@
+import itertools
+import re
+
+from src.lexer.dfa import CompiledDFA
+
+
+# Cache RegexEngine per objek dfa_rules; membangun dan meng-compile pattern
+# jauh lebih mahal daripada CompiledDFA.
+_ENGINE_CACHE: dict[int, tuple[dict, "RegexEngine"]] = {}
+
+
+def get_regex_engine(dfa: CompiledDFA, dfa_rules: dict | CompiledDFA) -> "RegexEngine":
+    """
+    Mengambil RegexEngine untuk dfa_rules dari cache, atau membangunnya.
+
+    Args:
+        dfa (CompiledDFA): DFA hasil kompilasi dari dfa_rules yang sama.
+        dfa_rules (dict | CompiledDFA): Aturan DFA; objek yang sama memakai engine yang sama.
+
+    Returns:
+        RegexEngine: engine yang siap dipakai.
+    """
+    cached = _ENGINE_CACHE.get(id(dfa_rules))
+    if cached is not None and cached[0] is dfa_rules:
+        return cached[1]
+    engine = RegexEngine(dfa)
+    _ENGINE_CACHE[id(dfa_rules)] = (dfa_rules, engine)
+    return engine
+
+
+class _ClassTable(dict):
+    """Tabel str.translate: code point -> karakter wakil kelas karakter DFA."""
+    def __init__(self, dfa: CompiledDFA, class_chars: list[str]):
+        super().__init__((code, class_chars[cls]) for code, cls in enumerate(dfa.ascii_class))
+        self._dfa = dfa
+        self._class_chars = class_chars
+
+    def __missing__(self, code: int) -> str:
+        char = self._class_chars[self._dfa.char_class(chr(code))]
+        self[code] = char
+        return char
+
+
+class RegexEngine:
+    """
+    Backend lexer berbasis `re` yang dibangkitkan dari dfa_rules.json.
+
+    Setiap kelas karakter DFA diwakili satu karakter: karakter literal mewakili
+    dirinya sendiri, sedangkan kategori (LETTER, DIGIT, ...) diwakili karakter
+    ASCII yang tidak dipakai sebagai literal. Source diterjemahkan sekali dengan
+    str.translate, lalu automaton diubah menjadi satu master pattern dengan
+    eliminasi state (Brzozowski/Arden). Di setiap titik pilihan, alternatif yang
+    melanjutkan scan diletakkan sebelum alternatif yang berhenti, sehingga
+    backtracking `re` menghasilkan longest match yang sama dengan DFA. Final
+    state yang dicapai dibaca dari nama group penanda (`m.lastgroup`).
+
+    Pattern kedua (`scan_pattern`) menganggap semua state menerima; hasilnya
+    adalah posisi dan state tempat scan DFA berhenti, yang dibutuhkan untuk
+    pengecekan string tidak tertutup di akhir file dan sufiks NUMBER.
+
+    `sink_starts` berisi karakter wakil kelas yang dari initial state bisa
+    berlanjut ke state sink (badan komentar / string). Scan yang dimulai dari
+    karakter itu dan baru berhenti di akhir source tanpa final state (mis. '(*'
+    yang tidak ditutup) membuat backtracking `re` mengulang scan sampai akhir
+    source untuk setiap token sesudahnya; Lexer lalu memakai loop DFA.
+    """
+    def __init__(self, dfa: CompiledDFA):
+        self.dfa = dfa
+
+        free = (chr(code) for code in range(1, 128) if chr(code) not in dfa.literal_class)
+        class_chars = [""] * dfa.num_classes
+        for char, cls in dfa.literal_class.items():
+            class_chars[cls] = char
+        for cls in dfa.category_class.values():
+            class_chars[cls] = next(free)
+        self.class_chars = class_chars
+        self.class_table = _ClassTable(dfa, class_chars)
+
+        self.group_states: dict[str, int] = {}
+        self.master_pattern = re.compile(self._build_pattern("F", accept_all=False), re.DOTALL)
+        self.scan_pattern = re.compile(self._build_pattern("S", accept_all=True), re.DOTALL)
+
+        # Final state yang scan-nya masih bisa berlanjut ke state STRING.
+        string_state = dfa.state_ids.get("STRING", CompiledDFA.DEAD)
+        self.string_state = string_state
+        self.may_reach_string = [string_state in self._reachable(s) for s in range(len(dfa.state_names))]
+
+        sinks = {state for state, skip in enumerate(dfa.skip_search) if skip is not None}
+        self.sink_starts = frozenset(
+            class_chars[cls] for cls, target in enumerate(dfa.transitions[dfa.initial])
+            if target != CompiledDFA.DEAD and sinks & self._reachable(target))
+
+    def translate(self, source: str) -> str:
+        """Menerjemahkan source menjadi string karakter wakil kelas."""
+        return source.translate(self.class_table)
+
+    def _edges(self, state: int) -> list[tuple[str, int]]:
+        """Transisi keluar sebuah state, dikelompokkan per state tujuan sebagai char set."""
+        targets: dict[int, list[str]] = {}
+        for cls, target in enumerate(self.dfa.transitions[state]):
+            if target != CompiledDFA.DEAD:
+                targets.setdefault(target, []).append(self.class_chars[cls])
+        edges = []
+        for target, chars in targets.items():
+            escaped = "".join(re.escape(c) for c in chars)
+            edges.append((escaped if len(chars) == 1 else f"[{escaped}]", target))
+        return edges
+
+    def _reachable(self, state: int) -> set[int]:
+        seen, stack = {state}, [state]
+        while stack:
+            for _, target in self._edges(stack.pop()):
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+        return seen
+
+    def _build_pattern(self, group_prefix: str, accept_all: bool) -> str:
+        """
+        Mengubah automaton menjadi regex dengan eliminasi state.
+
+        Ekspresi disimpan sebagai pohon tuple: ("chars", regex), ("seq", [..]),
+        ("alt", [..]), ("star", body), ("var", state), ("stop", state). Variabel
+        hanya muncul di ujung kanan (right-linear). Saat Arden diterapkan pada
+        X_s = L.X_s | R, hanya cabang loop yang didistribusikan; R tetap
+        terfaktor di belakang star agar pilihan "lanjut" selalu dicoba sebelum
+        pilihan "berhenti".
+        """
+        dfa = self.dfa
+        order = [dfa.initial]
+        for state in order:
+            for _, target in self._edges(state):
+                if target not in order:
+                    order.append(target)
+        position = {state: i for i, state in enumerate(order)}
+
+        equations = {}
+        for state in order:
+            branches = []
+            for charset, target in self._edges(state):
+                info = dfa.final_info[target]
+                if (not accept_all and state == dfa.initial and info and info.get("ignore")
+                        and not self._edges(target)):
+                    # Token ignore satu karakter (whitespace) digabung menjadi satu run.
+                    charset += "+"
+                branches.append(("seq", [("chars", charset), ("var", target)]))
+            if accept_all or dfa.is_final[state]:
+                branches.append(("stop", state))
+            equations[state] = ("alt", branches) if branches else None
+
+        for state in reversed(order):
+            loops, rest = _split_loops(equations[state], state)
+            if loops and rest is not None:
+                rest = ("seq", [("star", ("alt", loops)), rest])
+            equations[state] = rest
+            for earlier in order[:position[state]]:
+                equations[earlier] = _substitute(equations[earlier], state, rest)
+
+        names = itertools.count()
+
+        def render(expr, grouped: bool = False) -> str:
+            kind = expr[0]
+            if kind == "chars":
+                return expr[1]
+            if kind == "stop":
+                name = f"{group_prefix}{expr[1]}_{next(names)}"
+                self.group_states[name] = expr[1]
+                return f"(?P<{name}>)"
+            if kind == "star":
+                body = expr[1]
+                while body[0] in ("alt", "seq") and len(body[1]) == 1:
+                    body = body[1][0]
+                if body[0] == "chars" and (body[1].startswith("[") or len(body[1]) == 1
+                                           or (len(body[1]) == 2 and body[1][0] == "\\")):
+                    return body[1] + "*"
+                return "(?:" + render(body) + ")*"
+            if kind == "seq":
+                return "".join(render(item, grouped=True) for item in expr[1])
+            # alt
+            if len(expr[1]) == 1:
+                return render(expr[1][0], grouped)
+            text = "|".join(render(branch) for branch in expr[1])
+            return "(?:" + text + ")" if grouped else text
+
+        return render(equations[dfa.initial]) if equations[dfa.initial] else "(?!)"
+
+
+def _split_loops(expr, state):
+    """
+    Memisahkan ekspresi right-linear menjadi (prefix-prefix yang berakhir di
+    X_state, sisa ekspresi tanpa cabang tersebut). Sisa None berarti kosong.
+    """
+    if expr is None:
+        return [], None
+    kind = expr[0]
+    if kind == "var":
+        return ([("seq", [])], None) if expr[1] == state else ([], expr)
+    if kind == "alt":
+        loops, rests = [], []
+        for branch in expr[1]:
+            branch_loops, branch_rest = _split_loops(branch, state)
+            loops.extend(branch_loops)
+            if branch_rest is not None:
+                rests.append(branch_rest)
+        return loops, (("alt", rests) if rests else None)
+    if kind == "seq":
+        head, tail = expr[1][:-1], expr[1][-1]
+        tail_loops, tail_rest = _split_loops(tail, state)
+        loops = [("seq", head + loop[1]) if loop[0] == "seq" else ("seq", head + [loop])
+                 for loop in tail_loops]
+        return loops, (("seq", head + [tail_rest]) if tail_rest is not None else None)
+    return [], expr
+
+
+def _substitute(expr, state, replacement):
+    """Mengganti X_state di ujung kanan ekspresi; cabang yang hilang dibuang."""
+    if expr is None:
+        return None
+    kind = expr[0]
+    if kind == "var":
+        return replacement if expr[1] == state else expr
+    if kind == "alt":
+        branches = [_substitute(branch, state, replacement) for branch in expr[1]]
+        branches = [branch for branch in branches if branch is not None]
+        return ("alt", branches) if branches else None
+    if kind == "seq":
+        tail = _substitute(expr[1][-1], state, replacement)
+        return ("seq", expr[1][:-1] + [tail]) if tail is not None else None
+    return expr
@@ -0,0 +1,524 @@
+from types import GeneratorType
+
+from src.common.errors import TokenUnexpectedError
+from src.common.pascal_token import Token
+from src.common.token_kinds import TokenKind, Word, kind_table
+from src.common.trampoline import drive
+from src.parser.parser import Parser
+from src.semantic.ast import (
+    ArrayAccess,
+    ArrayType,
+    AssignStmt,
+    BinOp,
+    Block,
+    BooleanLiteral,
+    CallExpr,
+    CharLiteral,
+    CompoundStmt,
+    ConstDecl,
+    Expression,
+    ForDirection,
+    ForStmt,
+    FunctionDecl,
+    IfStmt,
+    NamedType,
+    NumberLiteral,
+    Param,
+    PrimitiveType,
+    ProcCallStmt,
+    ProcedureDecl,
+    Program,
+    RangeExpr,
+    Statement,
+    StringLiteral,
+    TypeDecl,
+    TypeExpr,
+    UnaryOp,
+    VarDecl,
+    VarRef,
+    WhileStmt,
+)
+
+
+class ASTParser(Parser):
+    """
+    Parser mode langsung ke AST: setiap produksi grammar langsung menghasilkan
+    node semantic/ast.py (Program, Block, BinOp, ...) tanpa membangun parse tree
+    Node dan tanpa pass kedua ASTBuilder. Hasilnya sama dengan
+    ASTBuilder().build(Parser(tokens).parse_program(), tokens) untuk program yang valid.
+    Posisi node (token_index) adalah index token di `tokens`: dicatat dari
+    current_index sebelum tokennya dicocokkan.
+
+    Grammar, urutan keputusan dan pesan error sama dengan Parser. Bedanya, tidak
+    ada AST parsial untuk input yang salah: syntax error pertama langsung
+    dilempar sebagai TokenUnexpectedError (tanpa logging). Pemanggil yang butuh
+    diagnosa lengkap bisa mengulang dengan Parser biasa (lihat app).
+
+    Aturan yang bisa bersarang ditulis sebagai generator langkah untuk
+    drive(), sama seperti di Parser: method _parse_* di sini meng-override
+    versi parse tree-nya, method parse_* publik diwarisi. Anotasi return
+    _parse_* menyebut node hasil langkahnya.
+    """
+
+    def error(self, expected: str, actual_token: Token | None):
+        actual_desc = self._fmt_token(actual_token)
+        line, col = (actual_token.line, actual_token.column) if actual_token else (None, None)
+        self.errors.append(f"Syntax error: expected {expected}, but got {actual_desc}")
+        raise TokenUnexpectedError(expected, actual_desc, line, col)
+
+    def parse_program(self) -> Program:
+        # <program> ::= <program-header> <declaration-part> <compound-statement> DOT
+        self.match_keyword(Word.PROGRAM)
+        name_index = self.current_index
+        name_tok = self.match_token(TokenKind.IDENTIFIER)
+        self.match_token(TokenKind.SEMICOLON, ";")
+
+        block = self.parse_block()
+        self.match_token(TokenKind.DOT, ".")
+        return Program(name=name_tok.value, block=block, token_index=name_index)
+
+    def _parse_block(self) -> Block:
+        """<block> ::= <declaration-part> <compound-statement>"""
+        block = Block()
+        yield self._parse_declaration_part(block)
+        block.body = yield self._parse_compound_statement()
+        return block
+
+    def parse_declaration_part(self, block: Block):
+        drive(self._parse_declaration_part(block))
+
+    def _parse_declaration_part(self, block: Block):
+        """<declaration-part> ::=
+            { <const-declaration> }
+            { <type-declaration> }
+            { <var-declaration> }
+            { <subprogram-declaration> }
+        Deklarasi langsung dimasukkan ke `block`.
+        """
+        # state machine sama dengan Parser:
+        # 0 = konstanta, 1 = tipe, 2 = variabel, 3 = subprogram
+        state = 0
+
+        while True:
+            tok = self.peek()
+            if not tok:
+                break
+
+            section = self.DECLARATION_SECTIONS[tok.word]
+            if section is None:
+                break
+
+            if section == 0:
+                if state != 0:
+                    break
+                block.const_decls.extend(self.parse_const_declaration())
+                continue
+
+            if section == 1:
+                if state > 1:
+                    self.error("Type declarations must appear before variable and subprogram declarations.", tok)
+                state = 1
+                block.type_decls.extend(self.parse_type_declaration())
+                continue
+
+            if section == 2:
+                if state > 2:
+                    self.error("Variable declarations must appear before subprogram declarations.", tok)
+                state = 2
+                block.var_decls.extend(self.parse_var_declaration())
+                continue
+
+            state = 3
+            block.subprogram_decls.append((yield self._parse_subprogram_declaration()))
+
+    # ====== CONST / TYPE / VAR DECLARATION ======
+    def parse_const_declaration(self) -> list[ConstDecl]:
+        """<const-declaration> ::= 'konstanta' ( IDENTIFIER '=' <expression> ';' )+"""
+        self.match_keyword(Word.KONSTANTA)
+        decls = []
+        while True:
+            ident_index = self.current_index
+            ident = self.match_token(TokenKind.IDENTIFIER)
+            self.match_token(TokenKind.RELATIONAL_OPERATOR, "=")
+            value = self.parse_expression()
+            self.match_token(TokenKind.SEMICOLON, ";")
+            decls.append(ConstDecl(name=ident.value, value=value, token_index=ident_index))
+
+            # masih ada IDENTIFIER lagi = definisi konstanta berikutnya
+            nxt = self.peek()
+            if not (nxt and nxt.kind == TokenKind.IDENTIFIER):
+                return decls
+
+    def parse_type_declaration(self) -> list[TypeDecl]:
+        """<type-declaration> ::= 'tipe' ( IDENTIFIER '=' <type> ';' )+"""
+        self.match_keyword(Word.TIPE)
+        decls = []
+        while True:
+            ident_index = self.current_index
+            ident = self.match_token(TokenKind.IDENTIFIER)
+            self.match_token(TokenKind.RELATIONAL_OPERATOR, "=")
+            type_expr = self.parse_type()
+            self.match_token(TokenKind.SEMICOLON, ";")
+            decls.append(TypeDecl(name=ident.value, type_expr=type_expr, token_index=ident_index))
+
+            nxt = self.peek()
+            if not (nxt and nxt.kind == TokenKind.IDENTIFIER):
+                return decls
+
+    def _parse_type(self) -> TypeExpr:
+        """<type> ::= 'integer' | 'real' | 'boolean' | 'char' | <array-type> | IDENTIFIER"""
+        tok = self.peek()
+        if not tok:
+            self.error("type", None)
+
+        word = tok.word
+        if self.SIMPLE_TYPES[word]:
+            self.current_index += 1
+            return PrimitiveType(name=tok.keyword, token_index=self.current_index - 1)
+        if word == Word.LARIK:
+            return self._parse_array_type()
+        if tok.kind == TokenKind.IDENTIFIER: # custom type
+            self.current_index += 1
+            return NamedType(name=tok.value, token_index=self.current_index - 1)
+
+        self.error("type", tok)
+
+    def _parse_array_type(self) -> ArrayType:
+        """<array-type> ::= 'larik' '[' <range> ']' 'dari' <type>"""
+        larik_index = self.current_index
+        self.match_keyword(Word.LARIK)
+        self.match_token(TokenKind.LBRACKET, "[")
+        index_range = self.parse_range()
+        self.match_token(TokenKind.RBRACKET, "]")
+        self.match_keyword(Word.DARI)
+        element_type = yield self._parse_type()
+        return ArrayType(index_range=index_range, element_type=element_type, token_index=larik_index)
+
+    def parse_range(self) -> RangeExpr:
+        """<range> ::= <expression> RANGE_OPERATOR <expression>"""
+        lower = self.parse_expression()
+        self.match_token(TokenKind.RANGE_OPERATOR, "..")
+        upper = self.parse_expression()
+        return RangeExpr(lower=lower, upper=upper)
+
+    def parse_var_declaration(self) -> list[VarDecl]:
+        """<var-declaration> ::= 'variabel' ( <identifier-list> ':' <type> ';' )+"""
+        self.match_keyword(Word.VARIABEL)
+        decls = []
+        while True:
+            names = [tok.value for tok in self.parse_identifier_list()]
+            self.match_token(TokenKind.COLON, ":")
+            type_expr = self.parse_type()
+            self.match_token(TokenKind.SEMICOLON, ";")
+            decls.append(VarDecl(names=names, type_expr=type_expr))
+
+            # kalau setelah ';' masih IDENTIFIER, berarti masih dalam blok var yang sama
+            nxt = self.peek()
+            if not (nxt and nxt.kind == TokenKind.IDENTIFIER):
+                return decls
+
+    def parse_identifier_list(self) -> list[Token]:
+        """<identifier-list> ::= IDENTIFIER (',' IDENTIFIER)*"""
+        idents = [self.match_token(TokenKind.IDENTIFIER)]
+        while True:
+            tok = self.peek()
+            if not tok or tok.kind != TokenKind.COMMA:
+                return idents
+            self.current_index += 1
+            idents.append(self.match_token(TokenKind.IDENTIFIER))
+
+    # ====== SUBPROGRAM DECLARATION ======
+    def _parse_subprogram_declaration(self):
+        """<subprogram-declaration> ::= <procedure-declaration> | <function-declaration>"""
+        if self.peek().word == Word.PROSEDUR:
+            return self._parse_procedure_declaration()
+        return self._parse_function_declaration()
+
+    def _parse_procedure_declaration(self) -> ProcedureDecl:
+        """<procedure-declaration> ::
+            'prosedur' IDENTIFIER [ <formal-parameter-list> ] ';' <block> ';'
+        """
+        self.match_keyword(Word.PROSEDUR)
+        ident_index = self.current_index
+        ident = self.match_token(TokenKind.IDENTIFIER)
+        params = self._parse_optional_parameters()
+        self.match_token(TokenKind.SEMICOLON, ";")
+        block = yield self._parse_block()
+        self.match_token(TokenKind.SEMICOLON, ";")
+        return ProcedureDecl(name=ident.value, params=params, block=block, token_index=ident_index)
+
+    def _parse_function_declaration(self) -> FunctionDecl:
+        """<function-declaration> ::
+            'fungsi' IDENTIFIER [ <formal-parameter-list> ] ':' <type> ';' <block> ';'
+        """
+        self.match_keyword(Word.FUNGSI)
+        ident_index = self.current_index
+        ident = self.match_token(TokenKind.IDENTIFIER)
+        params = self._parse_optional_parameters()
+        self.match_token(TokenKind.COLON, ":")
+        return_type = self.parse_type()
+        self.match_token(TokenKind.SEMICOLON, ";")
+        block = yield self._parse_block()
+        self.match_token(TokenKind.SEMICOLON, ";")
+        return FunctionDecl(name=ident.value, params=params, return_type=return_type, block=block,
+                            token_index=ident_index)
+
+    def _parse_optional_parameters(self) -> list[Param]:
+        # [ formal-parameter-list ]
+        tok = self.peek()
+        if tok and tok.kind == TokenKind.LPARENTHESIS:
+            return self.parse_formal_parameter_list()
+        return []
+
+    def parse_formal_parameter_list(self) -> list[Param]:
+        """<formal-parameter-list> ::=
+            '(' <parameter-group> ( ';' <parameter-group> )* ')'
+        """
+        self.match_token(TokenKind.LPARENTHESIS, "(")
+        params = self.parse_parameter_group()
+        while True:
+            tok = self.peek()
+            if not tok or tok.kind != TokenKind.SEMICOLON:
+                break
+            self.current_index += 1
+            params.extend(self.parse_parameter_group())
+        self.match_token(TokenKind.RPARENTHESIS, ")")
+        return params
+
+    def parse_parameter_group(self) -> list[Param]:
+        """<parameter-group> ::= <identifier-list> ':' <type>"""
+        # identifier ke-i ada di first + 2 * i (dipisah koma)
+        first = self.current_index
+        idents = self.parse_identifier_list()
+        self.match_token(TokenKind.COLON, ":")
+        # satu objek tipe dipakai bersama oleh semua parameter di grup
+        type_expr = self.parse_type()
+        return [Param(name=tok.value, type_expr=type_expr, token_index=first + 2 * i)
+                for i, tok in enumerate(idents)]
+
+    # ====== STATEMENT ======
+    def _parse_statement(self) -> Statement:
+        tok = self.peek()
+        if not tok:
+            self.error("statement", None)
+        rule = self.STATEMENT_RULES[tok.word]
+        if rule is not None:
+            return rule(self)
+        if tok.kind == TokenKind.IDENTIFIER:
+            next_tok = self.peek_next()
+            if next_tok is not None:
+                next_kind = next_tok.kind
+                if next_kind == TokenKind.ASSIGN_OPERATOR or next_kind == TokenKind.LBRACKET:
+                    return self.parse_assignment_statement()
+            return self._parse_procedure_call_statement()
+        self.error("statement", tok)
+
+    def _parse_if_statement(self) -> IfStmt:
+        # <if-statement> ::= 'jika' <expression> 'maka' <statement> [ 'selain_itu' <statement> ]
+        if_index = self.current_index
+        self.match_keyword(Word.JIKA)
+        condition = yield self._parse_expression()
+        self.match_keyword(Word.MAKA)
+        then_branch = yield self._parse_statement()
+        else_branch = None
+        token = self.peek()
+        if token and token.word == Word.SELAIN_ITU:
+            self.current_index += 1
+            else_branch = yield self._parse_statement()
+        return IfStmt(condition=condition, then_branch=then_branch, else_branch=else_branch, token_index=if_index)
+
+    def _parse_while_statement(self) -> WhileStmt:
+        # <while-statement> ::= 'selama' <expression> 'lakukan' <statement>
+        while_index = self.current_index
+        self.match_keyword(Word.SELAMA)
+        condition = yield self._parse_expression()
+        self.match_keyword(Word.LAKUKAN)
+        body = yield self._parse_statement()
+        return WhileStmt(condition=condition, body=body, token_index=while_index)
+
+    def _parse_for_statement(self) -> ForStmt:
+        # <for-statement> ::= 'untuk' IDENTIFIER ':=' <expression> ('ke'|'turun_ke') <expression> 'lakukan' <statement>
+        for_index = self.current_index
+        self.match_keyword(Word.UNTUK)
+        var_tok = self.match_token(TokenKind.IDENTIFIER)
+        self.match_token(TokenKind.ASSIGN_OPERATOR, ":=")
+        start = yield self._parse_expression()
+        dir_tok = self.peek()
+        if not (dir_tok and (dir_tok.word == Word.KE or dir_tok.word == Word.TURUN_KE)):
+            self.error("KEYWORD(ke|turun_ke)", dir_tok)
+        self.current_index += 1
+        direction = ForDirection.DOWNTO if dir_tok.word == Word.TURUN_KE else ForDirection.TO
+        end = yield self._parse_expression()
+        self.match_keyword(Word.LAKUKAN)
+        body = yield self._parse_statement()
+        return ForStmt(var=VarRef(name=var_tok.value, token_index=for_index + 1), start=start, end=end,
+                       direction=direction, body=body, token_index=for_index)
+
+    def _parse_compound_statement(self) -> CompoundStmt:
+        """
+        <compound-statement> ::= 'mulai' <statement-list> 'selesai'
+        """
+        begin_index = self.current_index
+        self.match_keyword(Word.MULAI)
+        statements = []
+
+        # blok kosong (langsung 'selesai')
+        if not (self.peek() and self.peek().word == Word.SELESAI):
+            # { SEMICOLON <statement> }, trailing semicolon sebelum 'selesai' valid
+            while True:
+                # assignment (statement paling umum) langsung jadi node, tanpa lewat drive
+                statement = self._parse_statement()
+                if type(statement) is GeneratorType:
+                    statement = yield statement
+                statements.append(statement)
+                if not (self.peek() and self.peek().kind == TokenKind.SEMICOLON):
+                    break
+                self.current_index += 1
+                if self.peek() and self.peek().word == Word.SELESAI:
+                    break
+
+        self.match_keyword(Word.SELESAI)
+        return CompoundStmt(statements=statements, token_index=begin_index)
+
+    def parse_assignment_statement(self) -> AssignStmt:
+        # <assignment-statement> ::= IDENTIFIER [ '[' <expression> ']' ] ASSIGN_OPERATOR <expression>
+        ident_index = self.current_index
+        ident = self.match_token(TokenKind.IDENTIFIER)
+        target = VarRef(name=ident.value, token_index=ident_index)
+
+        # optional array index
+        tok = self.peek()
+        if tok and tok.kind == TokenKind.LBRACKET:
+            self.current_index += 1
+            index = self.parse_expression()
+            self.match_token(TokenKind.RBRACKET, "]")
+            target = ArrayAccess(array=target, index=index, token_index=ident_index)
+
+        op_index = self.current_index
+        self.match_token(TokenKind.ASSIGN_OPERATOR, ":=")
+        value = self.parse_expression()
+        return AssignStmt(target=target, value=value, token_index=op_index)
+
+    def _parse_procedure_call_statement(self) -> ProcCallStmt:
+        ident_index = self.current_index
+        ident, args = yield self._parse_procedure_function_call()
+        return ProcCallStmt(name=ident.value, args=args, token_index=ident_index)
+
+    def _parse_procedure_function_call(self) -> tuple[Token, list[Expression]]:
+        # <procedure/function-call> ::= IDENTIFIER LPARENTHESIS [ <parameter-list> ] RPARENTHESIS
+        # dipakai untuk statement (ProcCallStmt) maupun factor (CallExpr), hasilnya (ident, args)
+        ident = self.match_token(TokenKind.IDENTIFIER)
+        self.match_token(TokenKind.LPARENTHESIS, "(")
+        args = yield self._parse_parameter_list()
+        self.match_token(TokenKind.RPARENTHESIS, ")")
+        return ident, args
+
+    def _parse_parameter_list(self) -> list[Expression]:
+        # <parameter-list> ::= <expression> { COMMA <expression> }
+        args = [(yield self._parse_expression())]
+        while True:
+            tok = self.peek()
+            if not tok or tok.kind != TokenKind.COMMA:
+                return args
+            self.current_index += 1
+            args.append((yield self._parse_expression()))
+
+    # ====== EXPRESSION ======
+    # parse_expression (precedence climbing) diwarisi dari Parser; di sini hook-nya
+    # langsung bikin node AST, tanpa wrapper <term>/<simple-expression>/<expression>.
+    def _binary_node(self, op_index: int, op_tok: Token, level: int, left: Expression, right: Expression) -> BinOp:
+        return BinOp(op=op_tok.value, left=left, right=right, token_index=op_index)
+
+    def _signed_node(self, sign_index: int, sign_tok: Token, term: Expression) -> UnaryOp:
+        return UnaryOp(op=sign_tok.value, operand=term, token_index=sign_index)
+
+    def _expression_node(self, expr: Expression) -> Expression:
+        return expr
+
+    def _parse_factor(self) -> Expression:
+        """
+        <factor> ::= IDENTIFIER | <function-call> | IDENTIFIER '[' <expression> ']'
+                   | NUMBER | CHAR_LITERAL | STRING_LITERAL | 'true' | 'false'
+                   | LPARENTHESIS <expression> RPARENTHESIS
+                   | LOGICAL_OPERATOR(tidak) <factor>
+        """
+        tok = self.peek()
+        if tok is None:
+            self.error("factor", None)
+        rule = self.FACTOR_RULES_BY_WORD[tok.word] or self.FACTOR_RULES[tok.kind]
+        if rule is None:
+            self.error("factor", tok)
+        return rule(self)
+
+    def _parse_not_factor(self) -> UnaryOp:
+        not_index = self.current_index
+        self.current_index += 1
+        operand = yield self._parse_factor()
+        return UnaryOp(op="tidak", operand=operand, token_index=not_index)
+
+    def _parse_parenthesized_factor(self) -> Expression:
+        self.current_index += 1
+        expr = yield self._parse_expression()
+        self.match_token(TokenKind.RPARENTHESIS, ")")
+        return expr
+
+    def _parse_number_factor(self) -> NumberLiteral:
+        tok = self.consume_token()
+        return NumberLiteral(value=tok.value, evaluated_value=tok.number, token_index=self.current_index - 1)
+
+    def _parse_string_factor(self) -> StringLiteral:
+        tok = self.consume_token()
+        return StringLiteral(value=tok.value, token_index=self.current_index - 1)
+
+    def _parse_char_factor(self) -> CharLiteral:
+        tok = self.consume_token()
+        return CharLiteral(value=tok.value, token_index=self.current_index - 1)
+
+    def _parse_boolean_factor(self) -> BooleanLiteral:
+        tok = self.consume_token()
+        return BooleanLiteral(value=tok.word == Word.TRUE, token_index=self.current_index - 1)
+
+    def _parse_identifier_factor(self) -> Expression:
+        # liat token kedua untuk memutuskan ini function call, array access, atau IDENTIFIER biasa
+        next_tok = self.peek_next()
+        next_kind = next_tok.kind if next_tok is not None else TokenKind.UNKNOWN
+        if next_kind == TokenKind.LPARENTHESIS:
+            return self._parse_call_factor()
+        if next_kind == TokenKind.LBRACKET:
+            return self._parse_array_access_factor()
+        ident = self.consume_token()
+        return VarRef(name=ident.value, token_index=self.current_index - 1)
+
+    def _parse_call_factor(self) -> CallExpr:
+        ident_index = self.current_index
+        ident, args = yield self._parse_procedure_function_call()
+        return CallExpr(name=ident.value, args=args, token_index=ident_index)
+
+    def _parse_array_access_factor(self) -> ArrayAccess:
+        # array element access: IDENTIFIER '[' <expression> ']'
+        ident_index = self.current_index
+        ident = self.consume_token()
+        self.current_index += 1
+        index = yield self._parse_expression()
+        self.match_token(TokenKind.RBRACKET, "]")
+        return ArrayAccess(array=VarRef(name=ident.value, token_index=ident_index), index=index,
+                           token_index=ident_index)
+
+    # ====== TABEL DISPATCH ======
+    # Sama dengan tabel di Parser, tapi menunjuk ke method versi AST.
+    STATEMENT_RULES = kind_table({
+        Word.JIKA: _parse_if_statement, Word.SELAMA: _parse_while_statement,
+        Word.UNTUK: _parse_for_statement, Word.MULAI: _parse_compound_statement,
+    }, len(Word.SPELLINGS))
+
+    FACTOR_RULES_BY_WORD = kind_table({
+        Word.TIDAK: _parse_not_factor, Word.TRUE: _parse_boolean_factor, Word.FALSE: _parse_boolean_factor,
+    }, len(Word.SPELLINGS))
+
+    FACTOR_RULES = kind_table({
+        TokenKind.LPARENTHESIS: _parse_parenthesized_factor,
+        TokenKind.NUMBER: _parse_number_factor,
+        TokenKind.CHAR_LITERAL: _parse_char_factor,
+        TokenKind.STRING_LITERAL: _parse_string_factor,
+        TokenKind.IDENTIFIER: _parse_identifier_factor,
+    })
@@ -0,0 +1,476 @@
+"""
+Grammar deklaratif dan generator tabel LL(1) untuk LL1Parser.
+
+File grammar (default pascal_s.grammar di folder ini, formatnya dijelaskan di
+kepala file tsb) dibaca jadi aturan BNF: kelompok / opsional / pengulangan
+EBNF diubah jadi aturan bantu. Dari situ dihitung FIRST dan FOLLOW setiap
+aturan dan tabel prediksi LL(1) (aturan x token -> produksi). Dua produksi
+yang berebut satu sel tabel adalah konflik: semuanya dilaporkan sekaligus
+sebagai GrammarError, kecuali konflik opsional / pengulangan bertanda '!'
+yang diselesaikan dengan memilih masuk (lihat `resolved`).
+
+Penggunaan:
+    python -m src.parser.grammar [file.grammar] [--sets] [--table]
+
+Exit code 1 jika grammar tidak valid atau punya konflik.
+"""
+import argparse
+import os
+import re
+import sys
+
+from src.common.errors import GrammarError
+from src.common.token_kinds import KIND_IDS, WORD_IDS, TokenKind, kind_table
+from src.parser.parser import Parser
+
+# lexeme simbol -> TokenKind-nya (keyword / operator kata dicocokkan lewat Word)
+LEXEME_KINDS: dict[str, int] = {lexeme: kind for kind, lexeme in enumerate(Parser.FIXED_LEXEMES) if lexeme}
+for _kind, _lexemes in enumerate(Parser.BINARY_LEVELS_BY_LEXEME):
+    for _lexeme in _lexemes or ():
+        LEXEME_KINDS[_lexeme] = _kind
+
+_TOKEN_RE = re.compile(r"""
+      (?P<skip>\s+|\#[^\n]*)
+    | (?P<define>::=)
+    | (?P<relabel>=>)
+    | (?P<label><[^<>\s]+>\??)
+    | (?P<quoted>'[^'\s]+'(?:@[A-Z_]+)?)
+    | (?P<name>[A-Za-z_][A-Za-z0-9_-]*(?:@[A-Z_]+)?)
+    | (?P<punct>[|()\[\]{};!])
+""", re.VERBOSE)
+
+
+class Terminal:
+    """Satu jenis token di grammar: keyword (word), lexeme simbol (kind + value), atau TokenKind saja."""
+    __slots__ = ("index", "name", "word", "kind", "lexeme")
+
+    def __init__(self, index: int, name: str, word: int = 0, kind: int = -1, lexeme: str | None = None):
+        self.index = index
+        self.name = name            # nama di pesan error, mis. "KEYWORD(mulai)", "SEMICOLON(;)"
+        self.word = word
+        self.kind = kind
+        self.lexeme = lexeme
+
+
+class Rule:
+    """Satu nonterminal; aturan bantu hasil EBNF punya `owner` (aturan tempat ia ditulis)."""
+    __slots__ = ("index", "name", "label", "omit_empty", "greedy", "owner", "productions")
+
+    def __init__(self, index: int, name: str, label: str | None = None, omit_empty: bool = False,
+                 greedy: bool = False, owner: str | None = None):
+        self.index = index
+        self.name = name
+        self.label = label          # label node parse tree, None = transparan
+        self.omit_empty = omit_empty
+        self.greedy = greedy
+        self.owner = owner
+        self.productions: list[Production] = []
+
+
+class Production:
+    """
+    Satu alternatif BNF. `symbols` berisi nama aturan (str) atau pasangan
+    (index Terminal, label daun atau None).
+    """
+    __slots__ = ("index", "rule", "symbols", "relabel")
+
+    def __init__(self, index: int, rule: Rule, symbols: list, relabel: str | None):
+        self.index = index
+        self.rule = rule
+        self.symbols = symbols
+        self.relabel = relabel
+
+
+class Grammar:
+    """
+    Grammar LL(1) yang sudah dicek. Atribut utama:
+
+        terminals   list[Terminal]; index 0 adalah EOF
+        rules       list[Rule]; rules[0] simbol awal
+        first       nama aturan -> set index terminal (FIRST)
+        nullable    set nama aturan yang bisa kosong
+        follow      nama aturan -> set index terminal (FOLLOW)
+        table       per aturan: list berindeks terminal -> index produksi atau None
+        resolved    konflik yang diselesaikan tanda '!': (aturan, terminal, produksi terpilih)
+
+    Token diklasifikasikan ke index terminal lewat `terminal_of` (terminal
+    di luar grammar -> `other`, kolom tabel yang selalu kosong).
+    """
+    EOF = 0
+
+    def __init__(self, text: str, source: str = "<grammar>"):
+        """
+        Args:
+            text (str): Isi file grammar.
+            source (str): Nama file untuk pesan error.
+
+        Raises:
+            GrammarError: Grammar tidak bisa dibaca, ada aturan yang tidak
+                didefinisikan / tidak terpakai, atau ada konflik LL(1).
+        """
+        self.source = source
+        self.terminals: list[Terminal] = [Terminal(0, "EOF")]
+        self._terminal_ids: dict[tuple, int] = {}
+        self.rules: list[Rule] = []
+        self.rule_map: dict[str, Rule] = {}
+        self.productions: list[Production] = []
+        self.resolved: list[tuple[str, str, Production]] = []
+
+        self._read(text)
+        self._check_references()
+        self.other = len(self.terminals)
+        self._compute_first()
+        self._compute_follow()
+        self._build_table()
+        self._build_classifier()
+
+    # ====== MEMBACA FILE GRAMMAR ======
+
+    def _read(self, text: str):
+        self._tokens = []
+        pos = 0
+        while pos < len(text):
+            match = _TOKEN_RE.match(text, pos)
+            if match is None:
+                raise GrammarError(f"{self.source}:{text.count(chr(10), 0, pos) + 1}: "
+                                   f"karakter tidak dikenal {text[pos]!r}")
+            if match.lastgroup != "skip":
+                line = text.count("\n", 0, pos) + 1
+                self._tokens.append((match.lastgroup, match.group(), line))
+            pos = match.end()
+        self._pos = 0
+        while self._pos < len(self._tokens):
+            self._read_rule()
+        if not self.rules:
+            raise GrammarError(f"{self.source}: grammar kosong")
+
+    def _peek(self) -> tuple[str, str, int]:
+        if self._pos < len(self._tokens):
+            return self._tokens[self._pos]
+        return ("eof", "akhir file", self._tokens[-1][2] if self._tokens else 1)
+
+    def _next(self, kind: str | None = None, text: str | None = None) -> tuple[str, str, int]:
+        tok = self._peek()
+        if (kind is not None and tok[0] != kind) or (text is not None and tok[1] != text):
+            self._fail(f"diharapkan {text or kind}, tapi ada {tok[1]!r}", tok)
+        self._pos += 1
+        return tok
+
+    def _fail(self, message: str, tok: tuple[str, str, int]):
+        raise GrammarError(f"{self.source}:{tok[2]}: {message}")
+
+    def _new_rule(self, name: str, label: str | None = None, omit_empty: bool = False,
+                  greedy: bool = False, owner: str | None = None) -> Rule:
+        rule = Rule(len(self.rules), name, label, omit_empty, greedy, owner)
+        self.rules.append(rule)
+        self.rule_map[name] = rule
+        return rule
+
+    def _add_production(self, rule: Rule, symbols: list, relabel: str | None = None):
+        production = Production(len(self.productions), rule, symbols, relabel)
+        self.productions.append(production)
+        rule.productions.append(production)
+
+    def _read_rule(self):
+        tok = self._next("name")
+        name = tok[1]
+        if "@" in name:
+            self._fail(f"nama aturan tidak boleh memakai label daun: {name}", tok)
+        if name in self.rule_map:
+            self._fail(f"aturan {name} didefinisikan dua kali", tok)
+        label, omit_empty = None, False
+        if self._peek()[0] == "label":
+            label = self._next()[1]
+            omit_empty = label.endswith("?")
+            label = label.rstrip("?")
+        self._next("define")
+        rule = self._new_rule(name, label, omit_empty)
+        self._helpers = 0
+        for symbols, relabel in self._read_alternatives(name):
+            self._add_production(rule, symbols, relabel)
+        self._next("punct", ";")
+
+    def _read_alternatives(self, owner: str) -> list[tuple[list, str | None]]:
+        alternatives = [self._read_sequence(owner)]
+        while self._peek()[1] == "|":
+            self._pos += 1
+            alternatives.append(self._read_sequence(owner))
+        return alternatives
+
+    def _read_sequence(self, owner: str) -> tuple[list, str | None]:
+        symbols = []
+        while True:
+            kind, text, _ = tok = self._peek()
+            if kind == "relabel":
+                self._pos += 1
+                label = self._next("label")
+                if label[1].endswith("?"):
+                    self._fail("=> tidak bisa memakai label '?'", label)
+                return symbols, label[1]
+            if kind == "quoted" or (kind == "name" and (text.isupper() or "@" in text)):
+                self._pos += 1
+                symbols.append(self._terminal(tok))
+            elif kind == "name":
+                self._pos += 1
+                symbols.append(text)
+            elif text in ("(", "[", "{"):
+                self._pos += 1
+                symbols.append(self._read_group(owner, text))
+            else:
+                return symbols, None
+
+    def _read_group(self, owner: str, opening: str) -> str:
+        closing = {"(": ")", "[": "]", "{": "}"}[opening]
+        alternatives = self._read_alternatives(owner)
+        self._next("punct", closing)
+        greedy = False
+        if self._peek()[1] == "!":
+            if opening == "(":
+                self._fail("'!' hanya untuk [ ... ] dan { ... }", self._peek())
+            self._pos += 1
+            greedy = True
+        self._helpers += 1
+        rule = self._new_rule(f"{owner}.{self._helpers}", greedy=greedy, owner=owner)
+        for symbols, relabel in alternatives:
+            if opening == "{":
+                symbols = symbols + [rule.name]
+            self._add_production(rule, symbols, relabel)
+        if opening != "(":
+            self._add_production(rule, [])
+        return rule.name
+
+    def _terminal(self, tok: tuple[str, str, int]) -> tuple[int, str | None]:
+        text, _, leaf_label = tok[1].partition("@")
+        if tok[0] == "quoted":
+            lexeme = text[1:-1]
+            word = WORD_IDS.get(lexeme.lower())
+            if word:
+                key, name = ("word", word), f"KEYWORD({lexeme.lower()})"
+                fields = {"word": word}
+            elif lexeme in LEXEME_KINDS:
+                kind = LEXEME_KINDS[lexeme]
+                key, name = ("lexeme", kind, lexeme), f"{TokenKind.NAMES[kind]}({lexeme})"
+                fields = {"kind": kind, "lexeme": lexeme}
+            else:
+                self._fail(f"token {text} bukan keyword maupun lexeme yang dikenal", tok)
+        else:
+            if text not in KIND_IDS:
+                self._fail(f"{text} bukan nama TokenKind", tok)
+            key, name = ("kind", KIND_IDS[text]), text
+            fields = {"kind": KIND_IDS[text]}
+        index = self._terminal_ids.get(key)
+        if index is None:
+            index = self._terminal_ids[key] = len(self.terminals)
+            self.terminals.append(Terminal(index, name, **fields))
+        return index, leaf_label or None
+
+    def _check_references(self):
+        used = {self.rules[0].name}
+        for production in self.productions:
+            for sym in production.symbols:
+                if isinstance(sym, str):
+                    if sym not in self.rule_map:
+                        raise GrammarError(f"{self.source}: aturan {production.rule.name} memakai "
+                                           f"aturan {sym} yang tidak didefinisikan")
+                    used.add(sym)
+        unused = [rule.name for rule in self.rules if rule.name not in used]
+        if unused:
+            raise GrammarError(f"{self.source}: aturan tidak terpakai: {', '.join(unused)}")
+        kinds = {t.kind for t in self.terminals if t.kind >= 0 and t.lexeme is None}
+        for t in self.terminals:
+            if t.lexeme is not None and t.kind in kinds:
+                raise GrammarError(f"{self.source}: {TokenKind.NAMES[t.kind]} dipakai sebagai "
+                                   f"terminal sendiri dan sebagai lexeme {t.lexeme!r}")
+
+    # ====== FIRST / FOLLOW ======
+
+    def first_of(self, symbols: list) -> tuple[set[int], bool]:
+        """FIRST dari deret simbol, dan apakah deret itu bisa kosong."""
+        result = set()
+        for sym in symbols:
+            if not isinstance(sym, str):
+                result.add(sym[0])
+                return result, False
+            result |= self.first[sym]
+            if sym not in self.nullable:
+                return result, False
+        return result, True
+
+    def _compute_first(self):
+        self.first: dict[str, set[int]] = {rule.name: set() for rule in self.rules}
+        self.nullable: set[str] = set()
+        changed = True
+        while changed:
+            changed = False
+            for production in self.productions:
+                name = production.rule.name
+                first, nullable = self.first_of(production.symbols)
+                if not first <= self.first[name]:
+                    self.first[name] |= first
+                    changed = True
+                if nullable and name not in self.nullable:
+                    self.nullable.add(name)
+                    changed = True
+
+    def _compute_follow(self):
+        self.follow: dict[str, set[int]] = {rule.name: set() for rule in self.rules}
+        self.follow[self.rules[0].name].add(self.EOF)
+        changed = True
+        while changed:
+            changed = False
+            for production in self.productions:
+                symbols = production.symbols
+                for i, sym in enumerate(symbols):
+                    if not isinstance(sym, str):
+                        continue
+                    first, nullable = self.first_of(symbols[i + 1:])
+                    if nullable:
+                        first = first | self.follow[production.rule.name]
+                    if not first <= self.follow[sym]:
+                        self.follow[sym] |= first
+                        changed = True
+
+    # ====== TABEL PREDIKSI ======
+
+    def _build_table(self):
+        width = len(self.terminals) + 1     # + kolom `other`
+        self.table: list[list[int | None]] = [[None] * width for _ in self.rules]
+        conflicts: dict[tuple[int, int], set[int]] = {}
+        for production in self.productions:
+            rule = production.rule
+            first, nullable = self.first_of(production.symbols)
+            if nullable:
+                first = first | self.follow[rule.name]
+            row = self.table[rule.index]
+            for terminal in first:
+                current = row[terminal]
+                if current is None or current == production.index:
+                    row[terminal] = production.index
+                elif rule.greedy and not (self.productions[current].symbols and production.symbols):
+                    # opsional / pengulangan '!': alternatif yang tidak kosong menang
+                    if not production.symbols:
+                        continue
+                    row[terminal] = production.index
+                else:
+                    conflicts.setdefault((rule.index, terminal), {current}).add(production.index)
+
+        for rule in self.rules:
+            if rule.greedy:
+                empty = next(p for p in rule.productions if not p.symbols)
+                for terminal, chosen in enumerate(self.table[rule.index]):
+                    if chosen is not None and chosen != empty.index and terminal in self.follow[rule.name]:
+                        self.resolved.append((rule.name, self.terminals[terminal].name, self.productions[chosen]))
+
+        if conflicts:
+            lines = []
+            for (rule_index, terminal), productions in sorted(conflicts.items()):
+                lines.append(f"  {self.display_name(self.rules[rule_index])} pada "
+                             f"{self.terminals[terminal].name}:")
+                lines.extend(f"    {self.describe(self.productions[p])}" for p in sorted(productions))
+            raise GrammarError(f"{self.source}: {len(conflicts)} konflik LL(1)\n" + "\n".join(lines))
+
+    def display_name(self, rule: Rule) -> str:
+        """Nama aturan untuk manusia: aturan bantu ditulis 'aturan.N (di aturan)'."""
+        return rule.name if rule.owner is None else f"{rule.name} (di {rule.owner})"
+
+    def describe(self, production: Production) -> str:
+        parts = []
+        for sym in production.symbols:
+            if isinstance(sym, str):
+                parts.append(sym)
+            else:
+                parts.append(self.terminals[sym[0]].name + (f"@{sym[1]}" if sym[1] else ""))
+        text = f"{production.rule.name} ::= {' '.join(parts) or 'ε'}"
+        return text + (f" => {production.relabel}" if production.relabel else "")
+
+    # ====== KLASIFIKASI TOKEN ======
+
+    def _build_classifier(self):
+        # word -> terminal, kind -> terminal (atau dict lexeme -> terminal); lihat terminal_of
+        self.word_terminals = kind_table({t.word: t.index for t in self.terminals if t.word},
+                                         len(WORD_IDS))
+        kinds: dict[int, object] = {}
+        for t in self.terminals:
+            if t.kind < 0:
+                continue
+            if t.lexeme is None:
+                kinds[t.kind] = t.index
+            else:
+                kinds.setdefault(t.kind, {})[t.lexeme] = t.index
+        self.kind_terminals = kind_table(kinds)
+
+    def terminal_of(self, tok) -> int:
+        """Index terminal untuk token `tok` (None = EOF, token di luar grammar = `other`)."""
+        if tok is None:
+            return self.EOF
+        terminal = self.word_terminals[tok.word]
+        if terminal is not None:
+            return terminal
+        terminal = self.kind_terminals[tok.kind]
+        if type(terminal) is dict:
+            return terminal.get(tok.value, self.other)
+        return self.other if terminal is None else terminal
+
+
+def default_grammar_path() -> str:
+    return os.path.join(os.path.dirname(__file__), "pascal_s.grammar")
+
+
+_loaded: dict[str, Grammar] = {}
+
+
+def load_grammar(filepath: str | None = None) -> Grammar:
+    """
+    Membaca dan mengecek file grammar (sekali per proses untuk setiap path).
+
+    Args:
+        filepath (str | None): Path file grammar; default pascal_s.grammar.
+
+    Returns:
+        Grammar: Grammar beserta FIRST / FOLLOW dan tabel prediksinya.
+
+    Raises:
+        GrammarError: Grammar tidak valid atau bukan LL(1).
+    """
+    path = os.path.abspath(filepath or default_grammar_path())
+    grammar = _loaded.get(path)
+    if grammar is None:
+        with open(path, encoding="utf-8") as file:
+            grammar = _loaded[path] = Grammar(file.read(), os.path.basename(path))
+    return grammar
+
+
+def main(argv: list[str] | None = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("grammar", nargs="?", default=default_grammar_path())
+    arg_parser.add_argument("--sets", action="store_true", help="cetak FIRST / FOLLOW setiap aturan")
+    arg_parser.add_argument("--table", action="store_true", help="cetak tabel prediksi")
+    args = arg_parser.parse_args(argv)
+
+    try:
+        grammar = load_grammar(args.grammar)
+    except GrammarError as e:
+        print(e)
+        return 1
+
+    names = lambda terminals: " ".join(sorted(grammar.terminals[t].name for t in terminals))
+    print(f"{len(grammar.rules)} aturan ({sum(r.owner is None for r in grammar.rules)} ditulis), "
+          f"{len(grammar.productions)} produksi, {len(grammar.terminals) - 1} terminal: LL(1)")
+    for rule_name, terminal, production in grammar.resolved:
+        print(f"  '!' {rule_name} pada {terminal}: {grammar.describe(production)}")
+    if args.sets:
+        for rule in grammar.rules:
+            print(f"\n{grammar.display_name(rule)}{' (nullable)' if rule.name in grammar.nullable else ''}")
+            print(f"  FIRST : {names(grammar.first[rule.name])}")
+            print(f"  FOLLOW: {names(grammar.follow[rule.name])}")
+    if args.table:
+        for rule in grammar.rules:
+            print(f"\n{grammar.display_name(rule)}")
+            for terminal, production in enumerate(grammar.table[rule.index]):
+                if production is not None:
+                    print(f"  {grammar.terminals[terminal].name:<28} {grammar.describe(grammar.productions[production])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
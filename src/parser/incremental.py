@@ -0,0 +1,300 @@
+from bisect import bisect_right
+
+from src.common.node import Node
+from src.common.pascal_token import Token
+from src.common.trampoline import drive
+from src.lexer.lexer import Lexer
+from src.parser.parser import Parser
+
+
+class _Unit:
+    """
+    Satu bagian top-level program yang bisa di-parse ulang sendiri: deklarasi
+    prosedur / fungsi langsung di <declaration-part> program, atau blok utama
+    (<compound-statement> + DOT sampai akhir token).
+    """
+    __slots__ = ("start", "parse_end", "node", "main_size", "sites", "joined", "lead")
+
+    def __init__(self, start: int, lead: tuple[int, int] | None, joined: bool):
+        self.start = start              # index token pertama
+        self.parse_end = start          # index sesudah token terakhir yang dikonsumsi aturannya
+        self.node = None                # node subprogram (None untuk blok utama)
+        self.main_size = 0              # blok utama: jumlah anak <program> miliknya
+        self.sites: list[tuple[str, Token | None]] = []  # syntax error sejak unit ini dimulai
+        # True kalau parsing sebelum unit ini tidak bergantung pada token unit ini dan
+        # unit dimulai di luar panic, jadi parse ulang boleh dimulai dari sini
+        self.joined = joined
+        self.lead = lead                # (kind, word) token pertama, None kalau EOF
+
+    @property
+    def is_main(self) -> bool:
+        return self.node is None
+
+
+class IncrementalParser(Parser):
+    """
+    Parser dengan parse ulang inkremental setelah edit teks (lihat edit()).
+
+    Parse pertama (parse_program) mencatat unit top-level: tiap deklarasi
+    prosedur / fungsi di <declaration-part> program dan blok utama, beserta
+    rentang token dan syntax error-nya. Setelah edit, Lexer.relex mengganti
+    sebagian token; hanya unit yang menyentuh token yang berubah yang di-parse
+    ulang, mulai dari batas unit ('prosedur' / 'fungsi' / 'mulai') sebelum
+    perubahan sampai parser kembali tepat di awal unit lama setelah perubahan.
+    Unit lain (node dan error-nya) dipakai ulang; token-nya objek yang sama
+    sehingga line/column yang digeser relex ikut benar.
+
+    Subtree unit yang tergantikan disimpan di cache dengan kunci isi token
+    (kind, value) rentangnya. Unit di daerah edit yang isi tokennya sama
+    dengan isi cache (mis. edit spasi / komentar, atau undo) tidak di-parse
+    ulang: node lama dipasang lagi dengan token barunya.
+
+    Kalau perubahan tidak bisa dibatasi pada unit (header dan deklarasi global,
+    unit yang berakhir dalam panic, urutan deklarasi yang salah), seluruh
+    program di-parse ulang. Hasil edit() selalu sama dengan parse penuh atas
+    teks yang sama (diuji di test/test_incremental.py).
+    """
+    CACHE_SIZE = 64
+
+    def __init__(self, lexer: Lexer):
+        """
+        Args:
+            lexer (Lexer): Lexer dengan source_code berupa string (engine 'dfa');
+                token-nya di-tokenize di sini dan diperbarui lewat relex.
+        """
+        super().__init__(lexer.tokenize())
+        self.lexer = lexer
+        self.tree: Node | None = None
+        self.full_parses = 0
+        self._units: list[_Unit] = []
+        self._cache: dict[tuple, tuple[Node, list[Node]]] = {}
+        self._reset_recording()
+
+    def _reset_recording(self):
+        # unit yang dicatat aturan top-level (_parse_subprogram_declaration / _parse_main_block)
+        self._recorded: list[_Unit] = []
+        self._head_sites: list[tuple[str, Token | None]] = []
+        self._sites = self._head_sites
+        self._depth = 0
+        self._sync_end = -1
+
+    # ====== PENCATATAN UNIT ======
+
+    def error(self, expected: str, actual_token: Token | None):
+        if not self.panic:
+            self._sites.append((expected, actual_token))
+        super().error(expected, actual_token)
+
+    def _synchronize(self, sync: tuple[list, list], start: int | None = None):
+        node = super()._synchronize(sync, start)
+        self._sync_end = self.current_index
+        return node
+
+    def _begin_unit(self) -> _Unit:
+        start = self.current_index
+        tok = self.peek()
+        prev = self._recorded[-1] if self._recorded else None
+        joined = (not self.panic and self._sync_end != start
+                  and (prev is None or prev.parse_end == start))
+        unit = _Unit(start, None if tok is None else (tok.kind, tok.word), joined)
+        self._sites = unit.sites
+        self._recorded.append(unit)
+        return unit
+
+    def _parse_subprogram_declaration(self):
+        step = super()._parse_subprogram_declaration()
+        if self._depth or step is None:
+            return step
+        return self._parse_top_subprogram(step)
+
+    def _parse_top_subprogram(self, step):
+        unit = self._begin_unit()
+        self._depth += 1
+        node = yield step
+        self._depth -= 1
+        unit.node = node
+        unit.parse_end = self.current_index
+        return node
+
+    def _parse_main_block(self, program_node):
+        unit = self._begin_unit()
+        before = len(program_node.children)
+        super()._parse_main_block(program_node)
+        unit.main_size = len(program_node.children) - before
+        unit.parse_end = self.current_index
+
+    # ====== PARSE PENUH / INKREMENTAL ======
+
+    def parse_program(self):
+        self.current_index = 0
+        self.panic = False
+        self.errors = []
+        self._reset_recording()
+        self.tree = super().parse_program()
+        self._units = self._recorded
+        self.full_parses += 1
+        return self.tree
+
+    def edit(self, edit_offset: int, removed_len: int, inserted_text: str) -> Node:
+        """
+        Menerapkan satu edit teks (lihat Lexer.relex) lalu memperbarui parse tree.
+
+        Args:
+            edit_offset (int): Offset awal edit pada source_code lexer saat ini.
+            removed_len (int): Jumlah karakter yang dihapus mulai edit_offset.
+            inserted_text (str): Teks yang disisipkan di edit_offset.
+
+        Returns:
+            Node: Parse tree program setelah edit; `errors` ikut diperbarui.
+        """
+        if self.tree is None:
+            self.parse_program()
+        self.lexer.relex(self.tokens, edit_offset, removed_len, inserted_text)
+        if not self._reparse(*self.lexer.relexed_range):
+            self.parse_program()
+            return self.tree
+        sites = list(self._head_sites)
+        for unit in self._units:
+            sites.extend(unit.sites)
+        # pesan dibentuk ulang karena line/column token error bisa sudah digeser relex
+        self.errors = [self._error_message(expected, tok) for expected, tok in sites]
+        return self.tree
+
+    def _reparse(self, start: int, old_end: int, new_end: int) -> bool:
+        """
+        Parse ulang unit yang memuat token lama [start, old_end) (sekarang token
+        [start, new_end)) lalu sambungkan ke pohon. False kalau perlu parse penuh.
+        """
+        units = self._units
+        delta = new_end - old_end
+        first = bisect_right(units, start, key=lambda unit: unit.start) - 1
+        while first >= 0 and not units[first].joined:
+            first -= 1
+        if first < 0:
+            return False
+        if first == 0 and self._lead(units[0].start) != units[0].lead:
+            # aturan deklarasi global sebelumnya ikut membaca token ini
+            return False
+
+        # --- Parse unit demi unit sampai tiba di awal unit lama sesudah perubahan ---
+        self._recorded = units[:first]
+        self._sites = self._head_sites
+        self._depth = 0
+        self._sync_end = -1
+        self.current_index = units[first].start
+        self.panic = False
+        holder = self.new_node("<program>")
+        resume = first
+        while True:
+            pos = self.current_index
+            while resume < len(units) and units[resume].start + delta < pos:
+                resume += 1
+            if (pos >= new_end and resume < len(units) and units[resume].start + delta == pos
+                    and units[resume].start >= old_end and units[resume].joined):
+                break
+            tok = self.peek()
+            section = None if tok is None else self.DECLARATION_SECTIONS[tok.word]
+            if section == 3:
+                if not self._reuse_cached(pos):
+                    drive(self._parse_subprogram_declaration())
+                if self.panic:
+                    return False
+            elif section is None or section == 0:
+                # sama seperti _parse_declaration_part: bagian deklarasi selesai
+                self._parse_main_block(holder)
+                resume = len(units)
+                break
+            else:
+                return False    # urutan deklarasi salah: biarkan parse penuh yang melapor
+
+        new_units = self._recorded[first:]
+        old_units = units[first:resume]
+        following = units[resume] if resume < len(units) else None
+        if not self._splice(old_units, new_units, following, holder):
+            return False
+        if delta:
+            for unit in units[resume:]:
+                unit.start += delta
+                unit.parse_end += delta
+        units[first:resume] = new_units
+        self._recorded = []
+        for unit in old_units:
+            self._remember(unit)
+        return True
+
+    def _lead(self, index: int) -> tuple[int, int] | None:
+        tok = self.tokens[index] if index < len(self.tokens) else None
+        return None if tok is None else (tok.kind, tok.word)
+
+    def _splice(self, old_units: list[_Unit], new_units: list[_Unit], following: _Unit | None,
+                holder: Node) -> bool:
+        # ganti node unit lama (termasuk node sesudahnya sampai unit `following`, mis.
+        # <error> setelah unit yang berakhir dalam panic) dengan node unit baru
+        program = self.tree
+        old_subs = [unit.node for unit in old_units if not unit.is_main]
+        new_subs = [unit.node for unit in new_units if not unit.is_main]
+        if old_subs or new_subs:
+            decl = next((child for child in program.children if child.label == "<declaration-part>"), None)
+            if decl is None:
+                return False
+            end = len(decl.children)
+            if following is not None and not following.is_main:
+                end = decl.children.index(following.node)
+            at = decl.children.index(old_subs[0]) if old_subs else end
+            if len(decl.children) - (end - at) + len(new_subs) == 0:
+                return False    # <declaration-part> kosong tidak dipasang di pohon
+            decl.children[at:end] = new_subs
+        if old_units and old_units[-1].is_main:
+            children = program.children
+            children[len(children) - old_units[-1].main_size:] = holder.children
+        return True
+
+    # ====== CACHE SUBTREE ======
+
+    def _remember(self, unit: _Unit):
+        # simpan subtree subprogram yang tergantikan, kalau tokennya bisa dipasang ulang:
+        # tanpa error dan setiap token rentangnya jadi tepat satu daun, berurutan
+        if unit.is_main or unit.sites or not unit.joined:
+            return
+        leaves = []
+        stack = [unit.node]
+        while stack:
+            node = stack.pop()
+            if node.token is not None:
+                leaves.append(node)
+            stack.extend(reversed(node.children))
+        if len(leaves) != unit.parse_end - unit.start:
+            return
+        key = tuple((leaf.token.kind, leaf.token.value) for leaf in leaves)
+        self._cache.pop(key, None)
+        self._cache[key] = (unit.node, leaves)
+        if len(self._cache) > self.CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+
+    def _reuse_cached(self, pos: int) -> bool:
+        # subprogram mulai di pos yang isi tokennya sama dengan subtree di cache
+        if not self._cache:
+            return False
+        end = self._subprogram_end(pos)
+        if end is None:
+            return False
+        tokens = self.tokens[pos:end]
+        entry = self._cache.pop(tuple((tok.kind, tok.value) for tok in tokens), None)
+        if entry is None:
+            return False
+        node, leaves = entry
+        for leaf, tok in zip(leaves, tokens):
+            leaf.token = tok
+        unit = self._begin_unit()
+        unit.node = node
+        unit.parse_end = self.current_index = end
+        return True
+
+    def _subprogram_end(self, pos: int) -> int | None:
+        # index sesudah ';' penutup subprogram yang mulai di pos (None kalau nesting-nya tidak utuh)
+        for sub, end in self._iter_body_ends(pos, single=True):
+            if sub == pos:
+                if end < len(self.tokens) and self.tokens[end].value == ";":
+                    return end + 1
+                return None
+        return None
@@ -0,0 +1,234 @@
+from typing import Iterable
+
+from src.common.node import Node
+from src.common.pascal_token import Token
+from src.common.token_stream import TokenStream
+from src.parser.grammar import Grammar, load_grammar
+from src.parser.parser import Parser
+
+
+class _Tables:
+    """
+    Tabel LL(1) sebuah Grammar dalam bentuk yang dibaca loop LL1Parser.
+
+    Isi stack berupa int: [0, n_match) langkah cocokkan satu terminal (dengan
+    label daunnya), END / END_OMIT menutup node aturan berlabel (END_OMIT:
+    node dibuang kalau tidak punya anak), dan first_rule + index aturan untuk
+    setiap aturan yang belum diekspansi.
+    """
+
+    def __init__(self, grammar: Grammar):
+        self.grammar = grammar
+        matches: dict[tuple[int, str | None], int] = {}
+        for production in grammar.productions:
+            for sym in production.symbols:
+                if not isinstance(sym, str):
+                    matches.setdefault(sym, len(matches))
+        self.match_terminal = [terminal for terminal, _ in matches]
+        self.match_label = [label for _, label in matches]
+        self.n_match = len(matches)
+        self.END = self.n_match
+        self.END_OMIT = self.n_match + 1
+        self.first_rule = self.n_match + 2
+        self.start = self.first_rule
+
+        self.rule_label = [rule.label for rule in grammar.rules]
+        # per produksi: label node yang dibuka aturan berlabel (label => menggantikannya),
+        # label => aturan transparan (dipasang ke node terbuka terdekat), item stack yang di-push (terbalik,
+        # termasuk END node aturannya) dan terminal pertama yang langsung dicocokkan (-1 kalau
+        # produksi tidak dimulai terminal)
+        self.open_label: list[str | None] = []
+        self.relabel: list[str | None] = []
+        self.push: list[tuple[int, ...]] = []
+        self.lead: list[int] = []
+        for production in grammar.productions:
+            items = [self.first_rule + grammar.rule_map[sym].index if isinstance(sym, str) else matches[sym]
+                     for sym in production.symbols]
+            rule = production.rule
+            if rule.label is not None:
+                items.append(self.END_OMIT if rule.omit_empty else self.END)
+            lead = -1
+            if items and items[0] < self.n_match:
+                lead = items.pop(0)
+            if rule.label is not None:
+                self.open_label.append(production.relabel or rule.label)
+                self.relabel.append(None)
+            else:
+                self.open_label.append(None)
+                self.relabel.append(production.relabel)
+            self.push.append(tuple(reversed(items)))
+            self.lead.append(lead)
+        # aturan yang bisa kosong mengambil produksi kosongnya untuk token apa pun yang tidak ada
+        # di tabel, jadi error dilaporkan di terminal sesudahnya ("expected KEYWORD(mulai)")
+        # dan bukan di aturan opsional (mis. declaration-part)
+        self.table = []
+        for rule, row in zip(grammar.rules, grammar.table):
+            row = list(row)
+            if rule.name in grammar.nullable:
+                empty = next(p.index for p in rule.productions if grammar.first_of(p.symbols)[1])
+                row = [empty if production is None else production for production in row]
+            self.table.append(row)
+
+        # pemulihan error: FIRST dan FOLLOW per aturan sebagai tabel berindeks terminal
+        width = len(grammar.terminals) + 1
+        self.first = [self._flags(grammar.first[rule.name], width) for rule in grammar.rules]
+        self.follow = [self._flags(grammar.follow[rule.name] | {grammar.EOF}, width) for rule in grammar.rules]
+        self.expected = [self._expected(rule) for rule in grammar.rules]
+
+    @staticmethod
+    def _flags(terminals: set[int], width: int) -> list[bool]:
+        flags = [False] * width
+        for terminal in terminals:
+            flags[terminal] = True
+        return flags
+
+    def _expected(self, rule) -> str:
+        # teks "expected ..." untuk aturan yang tidak bisa dimulai token saat ini: terminal
+        # pembukanya kalau cuma satu, nama aturan, atau daftar terminal untuk aturan bantu
+        first = self.grammar.first[rule.name]
+        if rule.owner is None and len(first) != 1:
+            return rule.name
+        return " | ".join(sorted(self.grammar.terminals[t].name for t in first))
+
+
+class LL1Parser(Parser):
+    """
+    Parser table-driven untuk grammar deklaratif (default pascal_s.grammar, lihat
+    src.parser.grammar): satu loop dengan stack eksplisit, tanpa method per
+    aturan, sehingga nesting program hanya dibatasi memori dan grammar baru
+    (mis. 'kasus', 'ulangi' / 'sampai', 'rekaman') cukup ditulis di file grammar.
+
+    Parse tree yang dihasilkan untuk program valid sama dengan Parser (label,
+    bentuk, token), jadi bisa langsung dipakai ASTBuilder. Pemulihan error
+    berbeda: saat aturan tidak bisa dimulai token saat ini, token dibuang (jadi
+    anak node <error>) sampai token di FIRST aturan itu (aturan dicoba lagi)
+    atau di FOLLOW-nya (aturan dilewati); terminal yang tidak cocok dianggap
+    hilang. Error lanjutan ditahan sampai ada token yang cocok lagi.
+    """
+    # tabel prediksi cuma butuh token saat ini
+    LOOKAHEAD = 1
+    _tables_cache: dict[Grammar, _Tables] = {}
+
+    def __init__(self, tokens: list[Token] | TokenStream | Iterable[Token], raise_on_error: bool = False,
+                 grammar: Grammar | None = None):
+        """
+        Args:
+            tokens: Token program (list, TokenStream, atau iterator token).
+            raise_on_error (bool): Lempar TokenUnexpectedError pada syntax error pertama.
+            grammar (Grammar | None): Grammar yang dipakai; default load_grammar().
+        """
+        super().__init__(tokens, raise_on_error)
+        grammar = grammar or load_grammar()
+        tables = self._tables_cache.get(grammar)
+        if tables is None:
+            tables = self._tables_cache[grammar] = _Tables(grammar)
+        self.grammar = grammar
+        self._tables = tables
+
+    def parse_program(self):
+        """Mem-parse seluruh token mulai simbol awal grammar; mengembalikan node akarnya."""
+        tables = self._tables
+        grammar = self.grammar
+        word_terminals, kind_terminals, other = grammar.word_terminals, grammar.kind_terminals, grammar.other
+        match_terminal, match_label = tables.match_terminal, tables.match_label
+        table, push, lead = tables.table, tables.push, tables.lead
+        open_label, relabel = tables.open_label, tables.relabel
+        n_match, END, first_rule = tables.n_match, tables.END, tables.first_rule
+        tokens = self.tokens
+        index = self.current_index
+
+        root = Node("<root>")
+        nodes = [root]
+        stack = [tables.start]
+        tok = self.peek()
+        terminal = grammar.terminal_of(tok)
+        while stack:
+            item = stack.pop()
+            if item >= first_rule:
+                production = table[item - first_rule][terminal]
+                if production is None:
+                    self.current_index = index
+                    if self._recover(item - first_rule, nodes[-1]):
+                        stack.append(item)
+                    index = self.current_index
+                    tok = self.peek()
+                    terminal = grammar.terminal_of(tok)
+                    continue
+                label = open_label[production]
+                if label is not None:
+                    node = Node(label)
+                    nodes[-1].children.append(node)
+                    nodes.append(node)
+                elif relabel[production] is not None:
+                    nodes[-1].label = relabel[production]
+                stack.extend(push[production])
+                # terminal pertama produksi pasti token saat ini (dipilih lewat FIRST)
+                item = lead[production]
+                if item < 0:
+                    continue
+            elif item >= n_match:
+                node = nodes.pop()
+                if item != END and not node.children:
+                    nodes[-1].children.pop()
+                continue
+            elif match_terminal[item] != terminal:
+                # terminal hilang: laporkan lalu anggap sudah ada
+                self.current_index = index
+                self.error(grammar.terminals[match_terminal[item]].name, tok)
+                continue
+
+            nodes[-1].children.append(Node(match_label[item] or tok.token_type, tok))
+            index += 1
+            if self.panic:
+                self.panic = False
+            try:
+                tok = tokens[index]
+            except IndexError:
+                tok = None
+                terminal = grammar.EOF
+                continue
+            # klasifikasi token (sama dengan Grammar.terminal_of)
+            terminal = word_terminals[tok.word]
+            if terminal is None:
+                terminal = kind_terminals[tok.kind]
+                if terminal is None:
+                    terminal = other
+                elif type(terminal) is dict:
+                    terminal = terminal.get(tok.value, other)
+        self.current_index = index
+
+        # <error> dari token yang dibuang sebelum simbol awal bisa dimulai ikut jadi anak akar
+        children = root.children
+        start_label = tables.rule_label[0] or "<program>"
+        if children and children[-1].label == start_label:
+            tree = children.pop()
+            tree.children[:0] = children
+        else:
+            tree = Node(start_label)
+            tree.children = children
+        return tree
+
+    def _recover(self, rule: int, parent: Node) -> bool:
+        """
+        Aturan ke-`rule` tidak bisa dimulai token saat ini: laporkan, lalu buang token
+        (sebagai <error> di bawah `parent`) sampai token di FIRST atau FOLLOW aturan itu.
+
+        Returns:
+            bool: True kalau berhenti di FIRST (aturan dicoba lagi), False kalau
+                aturan dilewati.
+        """
+        tables = self._tables
+        terminal_of = self.grammar.terminal_of
+        first, follow = tables.first[rule], tables.follow[rule]
+        tok = self.peek()
+        self.error(tables.expected[rule], tok)
+        skipped = Node("<error>")
+        terminal = terminal_of(tok)
+        while not (first[terminal] or follow[terminal]):
+            skipped.children.append(Node(tok.token_type, tok))
+            self.current_index += 1
+            tok = self.peek()
+            terminal = terminal_of(tok)
+        if skipped.children:
+            parent.children.append(skipped)
+        return first[terminal]
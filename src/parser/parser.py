@@ -1,21 +1,64 @@
 import logging
+from types import GeneratorType
+from typing import Iterable
 from src.common.pascal_token import Token
-from src.common.node import Node
+from src.common.token_stream import TokenStream
+from src.common.token_lookahead import TokenLookahead
+from src.common.token_kinds import TokenKind, Word, kind_table
+from src.common.node import LazyNode, Node
+from src.common.parse_tree_arena import ParseTreeArena
 from src.common.errors import TokenUnexpectedError
+from src.common.trampoline import drive
 
 class Parser:
-    def __init__(self, tokens: list[Token], raise_on_error: bool = False):
+    # jumlah token yang perlu bisa dibaca sekaligus: token saat ini + satu token
+    # sesudahnya (peek_next, untuk IDENTIFIER di awal statement / factor)
+    LOOKAHEAD = 2
+
+    def __init__(self, tokens: list[Token] | TokenStream | Iterable[Token], raise_on_error: bool = False,
+                 arena: ParseTreeArena | None = None, lazy_bodies: bool = False):
+        # token boleh berupa iterator (mis. Lexer.iter_tokens()): dibaca lewat ring buffer
+        # LOOKAHEAD token, jadi lexing dan parsing jalan bersamaan tanpa list token
+        if not hasattr(tokens, "__getitem__"):
+            if arena is not None:
+                raise ValueError("ParseTreeArena membutuhkan token berupa list / TokenStream")
+            tokens = TokenLookahead(tokens, self.LOOKAHEAD)
+        if lazy_bodies and (arena is not None or not isinstance(tokens, list)):
+            raise ValueError("lazy_bodies membutuhkan token berupa list[Token] tanpa ParseTreeArena")
         self.tokens = tokens
         self.current_index = 0
         self.errors = []
         self.raise_on_error = raise_on_error
+        # panic mode: True sejak syntax error terakhir sampai parser sinkron lagi
+        # (lihat _synchronize); selama itu error lain dianggap buntut dan tidak dicatat
+        self.panic = False
+        # parse tree dibangun sebagai objek Node, atau di ParseTreeArena kalau diberikan
+        # (node-nya jadi ArenaNode, atributnya sama dengan Node)
+        self.arena = arena
+        self.new_node = Node if arena is None else self._new_arena_node
+        # lazy_bodies: <block> subprogram jadi LazyNode yang baru di-parse saat anaknya
+        # dibaca (lihat _parse_body). _body_ends: index 'prosedur' / 'fungsi' -> index
+        # sesudah 'selesai' penutup bloknya; _token_offset: index tokens[0] di list asal
+        # selama blok lazy sedang di-parse
+        self.lazy_bodies = lazy_bodies
+        self._body_ends = dict(self._iter_body_ends()) if lazy_bodies else None
+        self._token_offset = 0
 
     def peek(self) -> Token | None:
         # lihat token saat ini tanpa mengonsumsi
-        if self.current_index < len(self.tokens):
+        # (try/except lebih murah dari cek len() karena EOF cuma sekali)
+        try:
             return self.tokens[self.current_index]
-        return None
+        except IndexError:
+            return None
     
+    def peek_next(self) -> Token | None:
+        # lihat token sesudah token saat ini (lookahead kedua)
+        try:
+            return self.tokens[self.current_index + 1]
+        except IndexError:
+            return None
+
     def consume_token(self) -> Token | None:
         # ngambil token saat ini dan berpindah ke token berikutnya
         token = self.peek()
@@ -23,36 +66,108 @@ class Parser:
             self.current_index += 1
         return token
     
-    def match_token(self, expected_type: str, expected_value: str | None = None) -> Token | None:
+    def match_token(self, expected_kind: int, expected_value: str | None = None) -> Token | None:
         # mastiin token saat ini sesuai dengan yg diharapkan.
         # kalau ngga, muncul error syntax
         token = self.peek()
-        if token is None:
-            self.error(f"{expected_type}({expected_value})" if expected_value else expected_type, None)
-            return None
-        
-        if token.token_type == expected_type and (expected_value is None or token.value.lower() == expected_value.lower()):
-            return self.consume_token()
-        else:
-            self.error(
-                f"{expected_type}({expected_value})" if expected_value else expected_type,
-                token
-            )
-            return None
+        # cek kind (int) dulu; value cuma perlu dibandingin kalau kind-nya
+        # bisa punya lexeme lain (mis. RELATIONAL_OPERATOR '=' vs '<')
+        if token is not None and token.kind == expected_kind and (
+                expected_value is None
+                or self.FIXED_LEXEMES[expected_kind] == expected_value
+                or token.value == expected_value):
+            self.current_index += 1
+            return token
+        expected_type = TokenKind.NAMES[expected_kind]
+        self.error(f"{expected_type}({expected_value})" if expected_value else expected_type, token)
+        return None
+
+    def match_keyword(self, word: int) -> Token | None:
+        # sama kayak match_token("KEYWORD", ...), tapi keyword dicek lewat id Word
+        # yang udah diisi lexer (ejaan udah di-fold), jadi cukup bandingin int
+        token = self.peek()
+        if token is not None and token.word == word:
+            self.current_index += 1
+            return token
+        self.error(f"KEYWORD({Word.SPELLINGS[word]})", token)
+        return None
         
     def error(self, expected: str, actual_token: Token | None):
-        actual_desc = self._fmt_token(actual_token)
+        if self.panic:
+            return
+        self.panic = True
         line, col = (actual_token.line, actual_token.column) if actual_token else (None, None)
-        msg = f"Syntax error: expected {expected}, but got {actual_desc}"
+        msg = self._error_message(expected, actual_token)
         logging.error(msg)
         self.errors.append(msg)
         if self.raise_on_error:
-            raise TokenUnexpectedError(expected, actual_desc, line, col)
+            raise TokenUnexpectedError(expected, self._fmt_token(actual_token), line, col)
+
+    def _error_message(self, expected: str, actual_token: Token | None) -> str:
+        return f"Syntax error: expected {expected}, but got {self._fmt_token(actual_token)}"
+
+    # ====== PEMULIHAN ERROR ======
+    # Panic mode: error pertama dicatat, error berikutnya ditahan sampai titik pemulihan
+    # terdekat (antar statement, cabang then, antar entri / deklarasi, setelah header
+    # program / subprogram). Di situ token dibuang sampai token sinkronisasi produksi
+    # itu (*_SYNC di bawah), lalu parsing lanjut seperti biasa, jadi satu pass
+    # menghasilkan semua error dan pohon lengkap dengan node <error> di titik error.
+
+    def _at_sync(self, sync: tuple[list, list]) -> bool:
+        # token saat ini termasuk sync set (EOF selalu dianggap batas)
+        tok = self.peek()
+        return tok is None or bool(sync[0][tok.kind] or sync[1][tok.word])
+
+    def _synchronize(self, sync: tuple[list, list], start: int | None = None):
+        """
+        Buang token sampai token sinkronisasi `sync` (pasangan tabel TokenKind, Word)
+        atau EOF. Token yang dibuang jadi anak node <error> yang dikembalikan.
+        Panic selesai kalau berhenti di token sinkronisasi; di '.' / EOF panic
+        dibiarkan supaya aturan di atasnya tidak melaporkan buntut error yang sama.
+
+        start: index awal konstruksi yang gagal (mis. statement); token start sampai
+        current_index yang sudah dikonsumsinya ikut jadi anak <error>, sebelum token
+        yang dibuang. Token dari iterator (TokenLookahead) yang sudah lewat tidak
+        bisa dibaca lagi, jadi di situ hanya token yang dibuang yang masuk.
+        """
+        node = self.new_node("<error>")
+        if start is not None and not isinstance(self.tokens, TokenLookahead):
+            for index in range(start, self.current_index):
+                node.add_children(self._token_node(index, self.tokens[index]))
+        kinds, words = sync
+        tok = self.peek()
+        while tok is not None and not (kinds[tok.kind] or words[tok.word]):
+            self.current_index += 1
+            node.add_children(self.new_node(tok.token_type, tok))
+            tok = self.peek()
+        if tok is not None and tok.kind != TokenKind.DOT:
+            self.panic = False
+        return node
+
+    def _new_arena_node(self, label: str, token: Token | None = None):
+        # new_node selalu dipanggil dengan token yang baru saja dikonsumsi (atau None),
+        # jadi index-nya pasti current_index - 1. Token operator di ekspresi lewat _token_node.
+        return self.arena.add(label, -1 if token is None else self.current_index - 1)
+
+    def _token_node(self, index: int, tok: Token, label: str | None = None):
+        # node daun untuk token `tok` (token ke-index; label default: jenis tokennya)
+        label = label or tok.token_type
+        if self.arena is None:
+            return Node(label, tok)
+        return self.arena.add(label, index)
 
     def _fmt_token(self, tok: Token | None) -> str:
         if tok is None:
             return "EOF"
         return f"{tok.token_type}({tok.value}) @ {tok.line}:{tok.column}"
+
+    # ====== STACK EKSPLISIT ======
+    # Aturan yang bisa bersarang tanpa batas (statement, ekspresi/factor, tipe larik,
+    # subprogram di dalam subprogram) ditulis sebagai generator yang dijalankan drive():
+    # tiap kali butuh sub-aturan, generator-nya `yield` langkah sub-aturan itu lalu
+    # menerima node hasilnya. Jadi kedalaman nesting program cuma dibatasi memori.
+    # Konvensi: _parse_* boleh mengembalikan node langsung atau generator langkah,
+    # parse_* publik selalu mengembalikan node.
         
     def parse_program(self):
         # Aturan grammar:
@@ -60,61 +175,73 @@ class Parser:
         
         # print("\nSTART PARSING...\n")
 
-        program_node = Node("<program>")
+        program_node = self.new_node("<program>")
 
         program_header = self.parse_program_header()
         if program_header:
             program_node.add_children(program_header)
+        if self.panic:
+            program_node.add_children(self._synchronize(self.DECLARATION_SYNC))
 
         decl_part = self.parse_declaration_part()
         if decl_part:
             program_node.add_children(decl_part)
 
-        compound_stmt = self.parse_compound_statement()
-        if compound_stmt:
-            program_node.add_children(compound_stmt)
-
-        dot_token = self.match_token("DOT", ".")
-        if dot_token:
-            program_node.add_children(Node("DOT", dot_token))
+        self._parse_main_block(program_node)
             
         # program_node.print_tree()
 
         # print("\nFINISH PARSING...")
         return program_node
 
+    def _parse_main_block(self, program_node):
+        # <compound-statement> DOT penutup program, anaknya ditambahkan ke program_node
+        compound_stmt = self.parse_compound_statement()
+        if compound_stmt:
+            program_node.add_children(compound_stmt)
+
+        dot_token = self.match_token(TokenKind.DOT, ".")
+        if dot_token:
+            program_node.add_children(self.new_node("DOT", dot_token))
+
     def parse_program_header(self):
         """
         <program-header> ::= 'program' <identifier> ';'
         """
-        node = Node("<program-header>")
-        node.add_children(Node("KEYWORD", self.match_token("KEYWORD", "program")))
-        node.add_children(Node("IDENTIFIER", self.match_token("IDENTIFIER")))
-        node.add_children(Node("SEMICOLON", self.match_token("SEMICOLON", ";")))
+        node = self.new_node("<program-header>")
+        node.add_children(self.new_node("KEYWORD", self.match_keyword(Word.PROGRAM)))
+        node.add_children(self.new_node("IDENTIFIER", self.match_token(TokenKind.IDENTIFIER)))
+        node.add_children(self.new_node("SEMICOLON", self.match_token(TokenKind.SEMICOLON, ";")))
         return node
     
     def parse_block(self):
+        return drive(self._parse_block())
+
+    def _parse_block(self):
         """<block> ::= <declaration-part> <compound-statement>
 
         Dipakai oleh deklarasi procedure / function.
         """
-        node = Node("<block>")
-        decl = self.parse_declaration_part()
+        node = self.new_node("<block>")
+        decl = yield self._parse_declaration_part()
         if decl:
             node.add_children(decl)
-        comp = self.parse_compound_statement()
+        comp = yield self._parse_compound_statement()
         if comp:
             node.add_children(comp)
         return node
     
     def parse_declaration_part(self):
+        return drive(self._parse_declaration_part())
+
+    def _parse_declaration_part(self):
         """<declaration-part> ::=
             { <const-declaration> }
             { <type-declaration> }
             { <var-declaration> }
             { <subprogram-declaration> }
         """
-        node = Node("<declaration-part>")
+        node = self.new_node("<declaration-part>")
 
         # state machine:
         # 0 = konstanta
@@ -125,85 +252,86 @@ class Parser:
         state = 0
 
         while True:
+            if self.panic:
+                # deklarasi sebelumnya error: lompat ke awal deklarasi berikutnya / 'mulai'
+                node.add_children(self._synchronize(self.DECLARATION_SYNC))
             tok = self.peek()
-            if not tok or tok.token_type != "KEYWORD":
+            if not tok:
                 break
 
-            kw = tok.value.lower()
+            # section deklarasi yang dimulai token ini (None = bukan awal deklarasi)
+            section = self.DECLARATION_SECTIONS[tok.word]
+            if section is None:
+                break
 
-            if state == 0 and kw == "konstanta":
+            if section == 0:
+                if state != 0:
+                    break
                 const_node = self.parse_const_declaration()
                 if const_node:
                     node.add_children(const_node)
                 continue
 
-            if kw == "tipe":
+            if section == 1:
                 if state > 1:
                     self.error("Type declarations must appear before variable and subprogram declarations.", tok)
+                    self.panic = False  # urutan salah, tapi token-nya tetap sinkron
                 state = 1
                 type_decl = self.parse_type_declaration()
                 if type_decl:
                     node.add_children(type_decl)
                 continue
 
-            if kw == "variabel":
+            if section == 2:
                 if state > 2:
                     self.error("Variable declarations must appear before subprogram declarations.", tok)
+                    self.panic = False  # urutan salah, tapi token-nya tetap sinkron
                 state = 2
                 var_decl = self.parse_var_declaration()
                 if var_decl:
                     node.add_children(var_decl)
                 continue
 
-            if kw in ("prosedur", "fungsi"):
-                state = 3
-                sub_node = self.parse_subprogram_declaration()
-                if sub_node:
-                    node.add_children(sub_node)
-                continue
-
-            break
+            state = 3
+            sub_node = yield self._parse_subprogram_declaration()
+            if sub_node:
+                node.add_children(sub_node)
 
         return node if node.children else None
     
     # ====== CONST DECLARATION ======
     def parse_const_declaration(self):
         """<const-declaration> ::= 'konstanta' ( IDENTIFIER '=' <expression> ';' )+"""
-        node = Node("<const-declaration>")
-        node.add_children(Node("KEYWORD", self.match_token("KEYWORD", "konstanta")))
+        node = self.new_node("<const-declaration>")
+        node.add_children(self.new_node("KEYWORD", self.match_keyword(Word.KONSTANTA)))
 
         # Minimal satu definisi konstanta
         while True:
-            ident = self.match_token("IDENTIFIER")
+            ident = self.match_token(TokenKind.IDENTIFIER)
             if not ident:
                 break
-            node.add_children(Node("IDENTIFIER", ident))
+            node.add_children(self.new_node("IDENTIFIER", ident))
 
-            eq = self.match_token("RELATIONAL_OPERATOR", "=")
-            if not eq:
-                break
-            node.add_children(Node("RELATIONAL_OPERATOR", eq))
+            eq = self.match_token(TokenKind.RELATIONAL_OPERATOR, "=")
+            if eq:
+                node.add_children(self.new_node("RELATIONAL_OPERATOR", eq))
 
-            value_expr = self.parse_expression()
-            if value_expr:
-                node.add_children(value_expr)
-            else:
-                # fallback sederhana: kalau parse_expression belum diisi,
-                # setidaknya konsumsi literal / identifier.
-                lit = self.peek()
-                if lit and lit.token_type in ("NUMBER", "CHAR_LITERAL", "STRING_LITERAL", "IDENTIFIER"):
-                    node.add_children(Node(lit.token_type, self.consume_token()))
+                value_expr = self.parse_expression()
+                if value_expr:
+                    node.add_children(value_expr)
                 else:
-                    break
+                    # fallback sederhana: kalau parse_expression belum diisi,
+                    # setidaknya konsumsi literal / identifier.
+                    lit = self.peek()
+                    if lit and lit.kind in (TokenKind.NUMBER, TokenKind.CHAR_LITERAL, TokenKind.STRING_LITERAL, TokenKind.IDENTIFIER):
+                        node.add_children(self.new_node(lit.token_type, self.consume_token()))
 
-            semi = self.match_token("SEMICOLON", ";")
-            if not semi:
+            if not self._match_entry_semicolon(node):
                 break
-            node.add_children(Node("SEMICOLON", semi))
 
             # cek apakah masih ada IDENTIFIER lagi (definisi konstanta berikutnya)
             nxt = self.peek()
-            if not (nxt and nxt.token_type == "IDENTIFIER"):
+            if not (nxt and nxt.kind == TokenKind.IDENTIFIER):
                 break
 
         return node
@@ -211,77 +339,76 @@ class Parser:
     # ====== TYPE DECLARATION ======
     def parse_type_declaration(self):
         """<type-declaration> ::= 'tipe' ( IDENTIFIER '=' <type> ';' )+"""
-        node = Node("<type-declaration>")
-        node.add_children(Node("KEYWORD", self.match_token("KEYWORD", "tipe")))
+        node = self.new_node("<type-declaration>")
+        node.add_children(self.new_node("KEYWORD", self.match_keyword(Word.TIPE)))
 
         while True:
-            ident = self.match_token("IDENTIFIER")
+            ident = self.match_token(TokenKind.IDENTIFIER)
             if not ident:
                 break
-            node.add_children(Node("IDENTIFIER", ident))
+            node.add_children(self.new_node("IDENTIFIER", ident))
 
-            eq = self.match_token("RELATIONAL_OPERATOR", "=")
-            if not eq:
-                break
-            node.add_children(Node("RELATIONAL_OPERATOR", eq))
+            eq = self.match_token(TokenKind.RELATIONAL_OPERATOR, "=")
+            if eq:
+                node.add_children(self.new_node("RELATIONAL_OPERATOR", eq))
 
-            type_node = self.parse_type()
-            if type_node:
-                node.add_children(type_node)
+                type_node = self.parse_type()
+                if type_node:
+                    node.add_children(type_node)
 
-            semi = self.match_token("SEMICOLON", ";")
-            if not semi:
+            if not self._match_entry_semicolon(node):
                 break
-            node.add_children(Node("SEMICOLON", semi))
 
             nxt = self.peek()
-            if not (nxt and nxt.token_type == "IDENTIFIER"):
+            if not (nxt and nxt.kind == TokenKind.IDENTIFIER):
                 break
 
         return node
 
     def parse_type(self):
+        return drive(self._parse_type())
+
+    def _parse_type(self):
         """<type> ::= 'integer' | 'real' | 'boolean' | 'char' | <array-type> | IDENTIFIER"""
-        node = Node("<type>")
+        node = self.new_node("<type>")
         tok = self.peek()
 
         if not tok:
             self.error("type", None)
             return None
 
-        if tok.token_type == "KEYWORD":
-            kw = tok.value.lower()
-            if kw in ("integer", "real", "boolean", "char"):
-                node.add_children(Node("KEYWORD", self.consume_token()))
-                return node
-            if kw == "larik":
-                array_node = self.parse_array_type()
-                if array_node:
-                    node.add_children(array_node)
-                return node
-
-        if tok.token_type == "IDENTIFIER": # custom type
-            node.add_children(Node("IDENTIFIER", self.consume_token()))
+        word = tok.word
+        if self.SIMPLE_TYPES[word]:
+            node.add_children(self.new_node("KEYWORD", self.consume_token()))
+            return node
+        if word == Word.LARIK:
+            array_node = yield self._parse_array_type()
+            if array_node:
+                node.add_children(array_node)
+            return node
+
+        if tok.kind == TokenKind.IDENTIFIER: # custom type
+            node.add_children(self.new_node("IDENTIFIER", self.consume_token()))
             return node
 
         self.error("type", tok)
         return None
 
-    def parse_array_type(self):
+    def _parse_array_type(self):
         """<array-type> ::= 'larik' '[' <range> ']' 'dari' <type>"""
-        node = Node("<array-type>")
+        node = self.new_node("<array-type>")
 
-        node.add_children(Node("KEYWORD", self.match_token("KEYWORD", "larik")))
-        node.add_children(Node("LBRACKET", self.match_token("LBRACKET", "[")))
+        node.add_children(self.new_node("KEYWORD", self.match_keyword(Word.LARIK)))
+        node.add_children(self.new_node("LBRACKET", self.match_token(TokenKind.LBRACKET, "[")))
 
         range_node = self.parse_range()
         if range_node:
             node.add_children(range_node)
 
-        node.add_children(Node("RBRACKET", self.match_token("RBRACKET", "]")))
-        node.add_children(Node("KEYWORD", self.match_token("KEYWORD", "dari")))
+        node.add_children(self.new_node("RBRACKET", self.match_token(TokenKind.RBRACKET, "]")))
+        node.add_children(self.new_node("KEYWORD", self.match_keyword(Word.DARI)))
 
-        elem_type = self.parse_type()
+        elem_type = yield self._parse_type()
         if elem_type:
             node.add_children(elem_type)
 
@@ -289,13 +416,13 @@ class Parser:
 
     def parse_range(self):
         """<range> ::= <expression> RANGE_OPERATOR <expression>"""
-        node = Node("<range>")
+        node = self.new_node("<range>")
 
         left = self.parse_expression()
         if left:
             node.add_children(left)
 
-        node.add_children(Node("RANGE_OPERATOR", self.match_token("RANGE_OPERATOR", "..")))
+        node.add_children(self.new_node("RANGE_OPERATOR", self.match_token(TokenKind.RANGE_OPERATOR, "..")))
 
         right = self.parse_expression()
         if right:
@@ -306,8 +433,8 @@ class Parser:
     # ====== VAR DECLARATION ======
     def parse_var_declaration(self):
         """<var-declaration> ::= 'variabel' ( <identifier-list> ':' <type> ';' )+"""
-        node = Node("<var-declaration>")
-        node.add_children(Node("KEYWORD", self.match_token("KEYWORD", "variabel")))
+        node = self.new_node("<var-declaration>")
+        node.add_children(self.new_node("KEYWORD", self.match_keyword(Word.VARIABEL)))
 
         while True:
             ident_list = self.parse_identifier_list()
@@ -315,124 +442,205 @@ class Parser:
                 break
             node.add_children(ident_list)
 
-            node.add_children(Node("COLON", self.match_token("COLON", ":")))
+            node.add_children(self.new_node("COLON", self.match_token(TokenKind.COLON, ":")))
 
             type_node = self.parse_type()
             if type_node:
                 node.add_children(type_node)
 
-            semi = self.match_token("SEMICOLON", ";")
-            if not semi:
+            if not self._match_entry_semicolon(node):
                 break
-            node.add_children(Node("SEMICOLON", semi))
 
             nxt = self.peek()
             # kalau setelah ';' masih IDENTIFIER, berarti masih dalam blok var yang sama
-            if not (nxt and nxt.token_type == "IDENTIFIER"):
+            if not (nxt and nxt.kind == TokenKind.IDENTIFIER):
                 break
 
         return node
+
+    def _match_entry_semicolon(self, node) -> bool:
+        # ';' penutup satu entri konstanta / tipe / variabel. Kalau entrinya error, sisa
+        # entri dibuang sampai ';' supaya entri berikutnya tetap dicek; berhenti di awal
+        # deklarasi lain / 'mulai' berarti section ini selesai (False)
+        if self.panic:
+            node.add_children(self._synchronize(self.DECLARATION_ENTRY_SYNC))
+            tok = self.peek()
+            if tok is None or tok.kind != TokenKind.SEMICOLON:
+                return False
+        semi = self.match_token(TokenKind.SEMICOLON, ";")
+        if not semi:
+            return False
+        node.add_children(self.new_node("SEMICOLON", semi))
+        return True
     
     def parse_identifier_list(self):
         """<identifier-list> ::= IDENTIFIER (',' IDENTIFIER)*"""
-        node = Node("<identifier-list>")
+        node = self.new_node("<identifier-list>")
 
-        first = self.match_token("IDENTIFIER")
+        first = self.match_token(TokenKind.IDENTIFIER)
         if not first:
             return None
-        node.add_children(Node("IDENTIFIER", first))
+        node.add_children(self.new_node("IDENTIFIER", first))
 
         while True:
             tok = self.peek()
-            if not tok or tok.token_type != "COMMA":
+            if not tok or tok.kind != TokenKind.COMMA:
                 break
             comma_tok = self.consume_token()
-            node.add_children(Node("COMMA", comma_tok))
+            node.add_children(self.new_node("COMMA", comma_tok))
 
-            ident = self.match_token("IDENTIFIER")
+            ident = self.match_token(TokenKind.IDENTIFIER)
             if not ident:
                 break
-            node.add_children(Node("IDENTIFIER", ident))
+            node.add_children(self.new_node("IDENTIFIER", ident))
 
         return node
     
     # ====== SUBPROGRAM DECLARATION ======
-    def parse_subprogram_declaration(self):
+    def _parse_subprogram_declaration(self):
         """<subprogram-declaration> ::= <procedure-declaration> | <function-declaration>"""
         tok = self.peek()
-        if not tok or tok.token_type != "KEYWORD":
+        if not tok:
             return None
 
-        if tok.value.lower() == "prosedur":
-            return self.parse_procedure_declaration()
-        if tok.value.lower() == "fungsi":
-            return self.parse_function_declaration()
+        if tok.word == Word.PROSEDUR:
+            return self._parse_procedure_declaration()
+        if tok.word == Word.FUNGSI:
+            return self._parse_function_declaration()
         return None
 
-    def parse_procedure_declaration(self):
+    def _parse_procedure_declaration(self):
         """<procedure-declaration> ::
             'prosedur' IDENTIFIER [ <formal-parameter-list> ] ';' <block> ';'
         """
-        node = Node("<procedure-declaration>")
+        node = self.new_node("<procedure-declaration>")
+        decl_index = self.current_index
 
-        node.add_children(Node("KEYWORD", self.match_token("KEYWORD", "prosedur")))
-        node.add_children(Node("IDENTIFIER", self.match_token("IDENTIFIER")))
+        node.add_children(self.new_node("KEYWORD", self.match_keyword(Word.PROSEDUR)))
+        node.add_children(self.new_node("IDENTIFIER", self.match_token(TokenKind.IDENTIFIER)))
 
         # [ formal-parameter-list ]
         tok = self.peek()
-        if tok and tok.token_type == "LPARENTHESIS":
+        if tok and tok.kind == TokenKind.LPARENTHESIS:
             fp = self.parse_formal_parameter_list()
             if fp:
                 node.add_children(fp)
 
-        node.add_children(Node("SEMICOLON", self.match_token("SEMICOLON", ";")))
+        node.add_children(self.new_node("SEMICOLON", self.match_token(TokenKind.SEMICOLON, ";")))
+        if self.panic:
+            node.add_children(self._synchronize(self.DECLARATION_SYNC))
 
-        block = self.parse_block()
+        block = yield self._parse_body(decl_index)
         if block:
             node.add_children(block)
 
-        node.add_children(Node("SEMICOLON", self.match_token("SEMICOLON", ";")))
+        node.add_children(self.new_node("SEMICOLON", self.match_token(TokenKind.SEMICOLON, ";")))
 
         return node
 
-    def parse_function_declaration(self):
+    def _parse_function_declaration(self):
         """<function-declaration> ::
             'fungsi' IDENTIFIER [ <formal-parameter-list> ] ':' <type> ';' <block> ';'
         """
-        node = Node("<function-declaration>")
+        node = self.new_node("<function-declaration>")
+        decl_index = self.current_index
 
-        node.add_children(Node("KEYWORD", self.match_token("KEYWORD", "fungsi")))
-        node.add_children(Node("IDENTIFIER", self.match_token("IDENTIFIER")))
+        node.add_children(self.new_node("KEYWORD", self.match_keyword(Word.FUNGSI)))
+        node.add_children(self.new_node("IDENTIFIER", self.match_token(TokenKind.IDENTIFIER)))
 
         tok = self.peek()
-        if tok and tok.token_type == "LPARENTHESIS":
+        if tok and tok.kind == TokenKind.LPARENTHESIS:
             fp = self.parse_formal_parameter_list()
             if fp:
                 node.add_children(fp)
 
-        node.add_children(Node("COLON", self.match_token("COLON", ":")))
+        node.add_children(self.new_node("COLON", self.match_token(TokenKind.COLON, ":")))
 
         ret_type = self.parse_type()
         if ret_type:
             node.add_children(ret_type)
 
-        node.add_children(Node("SEMICOLON", self.match_token("SEMICOLON", ";")))
+        node.add_children(self.new_node("SEMICOLON", self.match_token(TokenKind.SEMICOLON, ";")))
+        if self.panic:
+            node.add_children(self._synchronize(self.DECLARATION_SYNC))
 
-        block = self.parse_block()
+        block = yield self._parse_body(decl_index)
         if block:
             node.add_children(block)
 
-        node.add_children(Node("SEMICOLON", self.match_token("SEMICOLON", ";")))
+        node.add_children(self.new_node("SEMICOLON", self.match_token(TokenKind.SEMICOLON, ";")))
 
         return node
 
+    def _parse_body(self, decl_index: int):
+        """
+        <block> subprogram yang deklarasinya mulai di token ke-decl_index.
+
+        Pada mode lazy_bodies blok tidak di-parse sekarang: parser langsung lompat
+        ke sesudah 'selesai' penutupnya (dicari dari nesting 'prosedur' / 'fungsi' /
+        'mulai' / 'selesai', lihat _iter_body_ends) dan mengembalikan LazyNode yang
+        mem-parse rentang itu saat anaknya pertama kali dibaca.
+        """
+        if not self.lazy_bodies or self.panic:
+            return self._parse_block()
+        offset = self._token_offset
+        end = self._body_ends.get(offset + decl_index)
+        if end is None:
+            return self._parse_block()
+        start = offset + self.current_index
+        self.current_index = end - offset
+        return LazyNode("<block>", lambda: self._parse_lazy_block(start, end))
+
+    def _parse_lazy_block(self, start: int, end: int) -> list:
+        # parse blok lazy token [start, end) dari list asal; parser dibatasi ke rentang itu
+        # (sesudah 'end' dianggap EOF), jadi blok yang rusak tidak memakan deklarasi lain.
+        # Syntax error-nya ditambahkan ke `errors` saat blok ini di-parse.
+        saved = self.tokens, self.current_index, self.panic, self._token_offset
+        self.tokens = saved[0][start - saved[3]:end - saved[3]]
+        self.current_index, self.panic, self._token_offset = 0, False, start
+        try:
+            block = drive(self._parse_block())
+            if self.peek() is not None:
+                # blok berhenti sebelum 'selesai' penutupnya: sisanya dibuang
+                self.error("KEYWORD(selesai)", self.peek())
+                block.add_children(self._synchronize(self.NO_SYNC))
+            return block.children
+        finally:
+            self.tokens, self.current_index, self.panic, self._token_offset = saved
+
+    def _iter_body_ends(self, start: int = 0, single: bool = False):
+        """
+        Pasangan (index 'prosedur' / 'fungsi', index sesudah 'selesai' penutup bloknya)
+        untuk subprogram mulai token ke-start, dicari dari nesting 'prosedur' / 'fungsi' /
+        'mulai' / 'selesai' saja tanpa parsing. Subprogram yang nesting-nya tidak utuh
+        (mis. 'selesai' tanpa 'mulai') tidak dihasilkan.
+
+        Args:
+            start (int): Index token awal pencarian.
+            single (bool): Berhenti begitu subprogram / blok di token ke-start tertutup.
+        """
+        tokens = self.tokens
+        # index subprogram yang menunggu blok 'mulai' miliknya, atau -1 untuk 'mulai' yang terbuka
+        open_rules: list[int] = []
+        for i in range(start, len(tokens)):
+            word = tokens[i].word
+            if word == Word.PROSEDUR or word == Word.FUNGSI:
+                open_rules.append(i)
+            elif word == Word.MULAI:
+                open_rules.append(-1)
+            elif word == Word.SELESAI and open_rules:
+                if open_rules.pop() < 0 and open_rules and open_rules[-1] >= 0:
+                    yield open_rules.pop(), i + 1
+            if single and not open_rules:
+                return
+
     def parse_formal_parameter_list(self):
         """<formal-parameter-list> ::=
             '(' <parameter-group> ( ';' <parameter-group> )* ')'
         """
-        node = Node("<formal-parameter-list>")
+        node = self.new_node("<formal-parameter-list>")
 
-        node.add_children(Node("LPARENTHESIS", self.match_token("LPARENTHESIS", "(")))
+        node.add_children(self.new_node("LPARENTHESIS", self.match_token(TokenKind.LPARENTHESIS, "(")))
 
         param_group = self.parse_parameter_group()
         if param_group:
@@ -440,29 +648,29 @@ class Parser:
 
         while True:
             tok = self.peek()
-            if not tok or tok.token_type != "SEMICOLON":
+            if not tok or tok.kind != TokenKind.SEMICOLON:
                 break
             semi = self.consume_token()
-            node.add_children(Node("SEMICOLON", semi))
+            node.add_children(self.new_node("SEMICOLON", semi))
 
             param_group = self.parse_parameter_group()
             if not param_group:
                 break
             node.add_children(param_group)
 
-        node.add_children(Node("RPARENTHESIS", self.match_token("RPARENTHESIS", ")")))
+        node.add_children(self.new_node("RPARENTHESIS", self.match_token(TokenKind.RPARENTHESIS, ")")))
         return node
 
     def parse_parameter_group(self):
         """<parameter-group> ::= <identifier-list> ':' <type>"""
-        node = Node("<parameter-group>")
+        node = self.new_node("<parameter-group>")
 
         ident_list = self.parse_identifier_list()
         if not ident_list:
             return None
         node.add_children(ident_list)
 
-        node.add_children(Node("COLON", self.match_token("COLON", ":")))
+        node.add_children(self.new_node("COLON", self.match_token(TokenKind.COLON, ":")))
 
         type_node = self.parse_type()
         if type_node:
@@ -472,158 +680,167 @@ class Parser:
     
     # ====== COMPOUND STATEMENT ======
     def parse_statement(self):
+        return drive(self._parse_statement())
+
+    def _parse_statement(self):
         tok = self.peek()
         if not tok:
             self.error("statement", None)
             return None
-        if tok.token_type == "KEYWORD":
-            kw = tok.value.lower()
-            if kw == "jika":
-                return self.parse_if_statement()
-            elif kw == "selama":
-                return self.parse_while_statement()
-            elif kw == "untuk":
-                return self.parse_for_statement()
-            elif kw == "mulai":
-                return self.parse_compound_statement()
-        if tok.token_type == "IDENTIFIER":
-            next_tok_index = self.current_index + 1 
-            if next_tok_index < len(self.tokens):
-                next_tok = self.tokens[next_tok_index]
-                if next_tok.token_type == "ASSIGN_OPERATOR":
+        # FIRST(statement): keyword jika/selama/untuk/mulai lewat tabel, sisanya IDENTIFIER
+        rule = self.STATEMENT_RULES[tok.word]
+        if rule is not None:
+            return rule(self)
+        if tok.kind == TokenKind.IDENTIFIER:
+            next_tok = self.peek_next()
+            if next_tok is not None:
+                next_kind = next_tok.kind
+                if next_kind == TokenKind.ASSIGN_OPERATOR:
                     return self.parse_assignment_statement()
-                elif next_tok.token_type == "LBRACKET":
+                elif next_kind == TokenKind.LBRACKET:
                     # arr[index] := value
                     return self.parse_assignment_statement()
-            return self.parse_procedure_function_call()
+            return self._parse_procedure_function_call()
         self.error("statement", tok)
         return None
         
-    def parse_if_statement(self):
+    def _parse_if_statement(self):
         # <if-statement> ::= 'if' <expression> 'then' <statement> [ 'else' <statement> ]
 
-        node = Node("<if-statement>")
-        node.add_children(Node("KEYWORD", self.match_token("KEYWORD", "jika")))
+        node = self.new_node("<if-statement>")
+        node.add_children(self.new_node("KEYWORD", self.match_keyword(Word.JIKA)))
 
-        node.add_children(self.parse_expression())
+        node.add_children((yield self._parse_expression()))
 
-        node.add_children(Node("KEYWORD", self.match_token("KEYWORD", "maka")))
-        node.add_children(self.parse_statement())
+        node.add_children(self.new_node("KEYWORD", self.match_keyword(Word.MAKA)))
+        start = self.current_index
+        statement_node = yield self._parse_statement()
+        if self.panic:
+            # cabang then error: token-nya jadi <error>, sinkron di 'selain_itu'
+            # supaya cabang else tetap dicek
+            node.add_children(self._synchronize(self.THEN_SYNC, start))
+        else:
+            node.add_children(statement_node)
 
         token = self.peek()
-        if token and token.token_type == "KEYWORD" and token.value.lower() in ("selain_itu"):
-            node.add_children(Node("KEYWORD", self.consume_token()))
-            node.add_children(self.parse_statement())
+        if token and token.word == Word.SELAIN_ITU:
+            node.add_children(self.new_node("KEYWORD", self.consume_token()))
+            node.add_children((yield self._parse_statement()))
 
         return node
 
-    def parse_while_statement(self):
+    def _parse_while_statement(self):
         # <while-statement> ::= 'while' <expression> 'do' <statement>
 
-        node = Node("<while-statement>")
-        node.add_children(Node("KEYWORD", self.match_token("KEYWORD", "selama")))
+        node = self.new_node("<while-statement>")
+        node.add_children(self.new_node("KEYWORD", self.match_keyword(Word.SELAMA)))
         
-        node.add_children(self.parse_expression())
+        node.add_children((yield self._parse_expression()))
 
-        node.add_children(Node("KEYWORD", self.match_token("KEYWORD", "lakukan")))
-        node.add_children(self.parse_statement())
+        node.add_children(self.new_node("KEYWORD", self.match_keyword(Word.LAKUKAN)))
+        node.add_children((yield self._parse_statement()))
 
         return node
     
-    def parse_for_statement(self):
+    def _parse_for_statement(self):
         # <for-statement> ::= 'untuk' IDENTIFIER ':=' <expression> ('ke'|'turun_ke') <expression> 'lakukan' <statement>
         
-        node = Node("<for-statement>")
-        node.add_children(Node("KEYWORD", self.match_token("KEYWORD", "untuk")))
-        node.add_children(Node("IDENTIFIER", self.match_token("IDENTIFIER")))
-        node.add_children(Node("ASSIGN_OPERATOR", self.match_token("ASSIGN_OPERATOR", ":=")))
-        node.add_children(self.parse_expression())
+        node = self.new_node("<for-statement>")
+        node.add_children(self.new_node("KEYWORD", self.match_keyword(Word.UNTUK)))
+        node.add_children(self.new_node("IDENTIFIER", self.match_token(TokenKind.IDENTIFIER)))
+        node.add_children(self.new_node("ASSIGN_OPERATOR", self.match_token(TokenKind.ASSIGN_OPERATOR, ":=")))
+        node.add_children((yield self._parse_expression()))
         dir_tok = self.peek()
-        if dir_tok and dir_tok.token_type == "KEYWORD" and dir_tok.value.lower() in ("ke", "turun_ke", "turun-ke"):
-            node.add_children(Node("KEYWORD", self.consume_token()))
+        if dir_tok and (dir_tok.word == Word.KE or dir_tok.word == Word.TURUN_KE):
+            node.add_children(self.new_node("KEYWORD", self.consume_token()))
         else:
             self.error("KEYWORD(ke|turun_ke)", dir_tok)
-        node.add_children(self.parse_expression())
-        node.add_children(Node("KEYWORD", self.match_token("KEYWORD", "lakukan")))
-        node.add_children(self.parse_statement())
+        node.add_children((yield self._parse_expression()))
+        node.add_children(self.new_node("KEYWORD", self.match_keyword(Word.LAKUKAN)))
+        node.add_children((yield self._parse_statement()))
 
         return node
     
     # remove duplicate earlier variant of parse_assignment_statement (kept the robust version below)
 
     def parse_compound_statement(self):
+        return drive(self._parse_compound_statement())
+
+    def _parse_compound_statement(self):
         """
         <compound-statement> ::= 'begin' <statement-list> 'end'
         """
-        node = Node("<compound-statement>")
+        node = self.new_node("<compound-statement>")
         
-        tok_begin = self.match_token("KEYWORD", "mulai")
+        tok_begin = self.match_keyword(Word.MULAI)
         if not tok_begin:
             # Tidak ada 'mulai', error fatal untuk compound statement
-            self.error("KEYWORD(mulai)", self.peek())
             return None 
         
-        node.add_children(Node("KEYWORD", tok_begin))
+        node.add_children(self.new_node("KEYWORD", tok_begin))
         
         # Cek apakah bloknya kosong (langsung 'selesai')
-        if self.peek() and self.peek().value.lower() == "selesai":
+        if self.peek() and self.peek().word == Word.SELESAI:
             pass
         else:
-            # Parse <statement> pertama
-            statement_node = self.parse_statement()
-            if not statement_node: # Gagal parse statement pertama, ini error
-                return node 
-            node.add_children(statement_node)
-
-            # Loop untuk { SEMICOLON <statement> }
-            while self.peek() and self.peek().token_type == "SEMICOLON":
-                semicolon_node = Node("SEMICOLON", self.consume_token())
+            # <statement> { SEMICOLON <statement> }
+            while True:
+                start = self.current_index
+                statement_node = self._parse_statement()
+                if type(statement_node) is GeneratorType:
+                    statement_node = yield statement_node
+                if self.panic:
+                    # statement gagal di tengah: node parsialnya dibuang, semua token
+                    # statement itu (yang sudah dikonsumsi dan sisanya sampai ';' /
+                    # 'selesai') jadi satu node <error>
+                    node.add_children(self._synchronize(self.STATEMENT_SYNC, start))
+                else:
+                    if statement_node:
+                        node.add_children(statement_node)
+                    if not self._at_sync(self.STATEMENT_SYNC):
+                        # statement diikuti token lain (mis. ';' hilang): laporkan seperti
+                        # 'selesai' yang hilang, sisanya dibuang sampai ';' / 'selesai'
+                        self.error("KEYWORD(selesai)", self.peek())
+                        node.add_children(self._synchronize(self.STATEMENT_SYNC))
+
+                if not (self.peek() and self.peek().kind == TokenKind.SEMICOLON):
+                    break
+                node.add_children(self.new_node("SEMICOLON", self.consume_token()))
 
                 # Handle trailing semicolon (valid): '...; selesai'
-                if self.peek() and self.peek().value.lower() == "selesai":
-                    node.add_children(semicolon_node) 
-                    break 
-
-                node.add_children(semicolon_node) # Tambahkan semicolon
-
-                # Wajib ada statement setelah semicolon (jika bukan 'selesai')
-                statement_node = self.parse_statement()
-                if not statement_node:
-                    return node
-                node.add_children(statement_node)
+                if self.peek() and self.peek().word == Word.SELESAI:
+                    break
         
-        end_tok = self.match_token("KEYWORD", "selesai")
-        if not end_tok:
-            self.error("KEYWORD(selesai)", self.peek())
-        else:
-            node.add_children(Node("KEYWORD", end_tok))
+        end_tok = self.match_keyword(Word.SELESAI)
+        if end_tok:
+            node.add_children(self.new_node("KEYWORD", end_tok))
         
         return node
     
     def parse_assignment_statement(self):
         # <assignment-statement> ::= IDENTIFIER [ '[' <expression> ']' ] ASSIGN_OPERATOR <expression>
-        node = Node("<assignment-statement>")
+        node = self.new_node("<assignment-statement>")
         
         # IDENTIFIER
-        ident = self.match_token("IDENTIFIER")
+        ident = self.match_token(TokenKind.IDENTIFIER)
         if not ident: return None
-        node.add_children(Node("IDENTIFIER", ident))
+        node.add_children(self.new_node("IDENTIFIER", ident))
         
         # Optional array index
         tok = self.peek()
-        if tok and tok.token_type == "LBRACKET":
-            node.add_children(Node("LBRACKET", self.consume_token()))
+        if tok and tok.kind == TokenKind.LBRACKET:
+            node.add_children(self.new_node("LBRACKET", self.consume_token()))
             index_expr = self.parse_expression()
             if index_expr:
                 node.add_children(index_expr)
-            rbracket = self.match_token("RBRACKET", "]")
+            rbracket = self.match_token(TokenKind.RBRACKET, "]")
             if rbracket:
-                node.add_children(Node("RBRACKET", rbracket))
+                node.add_children(self.new_node("RBRACKET", rbracket))
         
         # ASSIGN_OPERATOR
-        op = self.match_token("ASSIGN_OPERATOR", ":=")
+        op = self.match_token(TokenKind.ASSIGN_OPERATOR, ":=")
         if not op: return None
-        node.add_children(Node("ASSIGN_OPERATOR", op))
+        node.add_children(self.new_node("ASSIGN_OPERATOR", op))
         
         expr_node = self.parse_expression()
         if not expr_node:
@@ -634,40 +851,42 @@ class Parser:
         return node
 
     def parse_procedure_function_call(self):
+        return drive(self._parse_procedure_function_call())
+
+    def _parse_procedure_function_call(self):
         # <procedure/function-call> ::= IDENTIFIER LPARENTHESIS [ <parameter-list> ] RPARENTHESIS
-        node = Node("<procedure-function-call>")
+        node = self.new_node("<procedure-function-call>")
 
         tok = self.peek()
         if not tok:
             return None
-        if tok.token_type == "IDENTIFIER":
-            node.add_children(Node("IDENTIFIER", self.consume_token()))
+        if tok.kind == TokenKind.IDENTIFIER:
+            node.add_children(self.new_node("IDENTIFIER", self.consume_token()))
         else:
             return None
 
-        lparen = self.match_token("LPARENTHESIS", "(")
+        lparen = self.match_token(TokenKind.LPARENTHESIS, "(")
         if not lparen:
             return None
-        node.add_children(Node("LPARENTHESIS", lparen))
+        node.add_children(self.new_node("LPARENTHESIS", lparen))
 
-        param_list_node = self.parse_parameter_list()
+        param_list_node = yield self._parse_parameter_list()
         if param_list_node:
             node.add_children(param_list_node)
 
-        rparen = self.match_token("RPARENTHESIS", ")")
+        rparen = self.match_token(TokenKind.RPARENTHESIS, ")")
         if not rparen:
             return None
-        node.add_children(Node("RPARENTHESIS", rparen))
+        node.add_children(self.new_node("RPARENTHESIS", rparen))
 
         return node
 
-    
-    def parse_parameter_list(self):
+    def _parse_parameter_list(self):
         # <parameter-list> ::= <expression> { COMMA <expression> }
-        node = Node("<parameter-list>")
+        node = self.new_node("<parameter-list>")
         
         # <expression> pertama
-        expr_node = self.parse_expression()
+        expr_node = yield self._parse_expression()
         if not expr_node:
             # List parameter boleh kosong (misal: writeln())
             return None 
@@ -677,12 +896,12 @@ class Parser:
         # { COMMA <expression> }
         while True:
             tok = self.peek()
-            if not tok or tok.token_type != "COMMA":
+            if not tok or tok.kind != TokenKind.COMMA:
                 break
-            comma_node = Node("COMMA", self.consume_token())
+            comma_node = self.new_node("COMMA", self.consume_token())
             node.add_children(comma_node)
             
-            expr_node = self.parse_expression()
+            expr_node = yield self._parse_expression()
             if not expr_node:
                 self.error("expression", self.peek())
                 return None # Error, koma harus diikuti ekspresi
@@ -690,96 +909,138 @@ class Parser:
             
         return node
 
+    # ====== EXPRESSION ======
+    # Precedence climbing. Level operator biner (makin besar makin kuat mengikat):
+    #   1 = relasional (= <> < <= > >=), non-asosiatif
+    #   2 = aditif (+ - atau)
+    #   3 = multiplikatif (* / bagi mod dan)
+    # Sign (+/-) cuma boleh di awal <simple-expression> dan berlaku untuk satu <term>,
+    # 'tidak' diurus parse_factor.
     def parse_expression(self):
-        # <expression> ::= <simple-expression> [ <relational-operator> <simple-expression> ]
-        node = Node("<expression>")
-        
-        left_simple_expr = self.parse_simple_expression()
-        if not left_simple_expr:
-            self.error("simple-expression", self.peek())
-            return None
-        node.add_children(left_simple_expr)
-        
-        # [ <relational-operator> <simple-expression> ]
-        op_node = self.parse_relational_operator()
-        
-        if op_node:
-            # kalo ada operator relasional, parse <simple-expression> kedua
-            node.add_children(op_node)
-            
-            right_simple_expr = self.parse_simple_expression()
-            if not right_simple_expr:
-                self.error("simple-expression", self.peek())
+        """
+        <expression> ::= <simple-expression> [ <relational-operator> <simple-expression> ]
+        <simple-expression> ::= [ <sign> ] <term> { <additive-operator> <term> }
+        <term> ::= <factor> { <multiplicative-operator> <factor> }
+
+        Satu loop untuk seluruh ekspresi, bukan satu method per aturan: operand dan
+        operator yang belum direduksi disimpan di stack, operand tanpa operator langsung
+        jadi parse_factor. Node hasilnya dibentuk lewat hook _binary_node / _signed_node /
+        _expression_node.
+        """
+        return drive(self._parse_expression())
+
+    def _parse_expression(self):
+        operands = []
+        # operator yang belum direduksi: (level, index token, token, sign?). Sign direduksi
+        # bareng operator level 2 karena berlaku untuk satu <term> penuh.
+        ops = []
+        allow_sign = True   # awal <simple-expression>: awal ekspresi atau setelah operator relasional
+        relational = False
+        levels_by_word = self.BINARY_LEVELS_BY_WORD
+        levels_by_lexeme = self.BINARY_LEVELS_BY_LEXEME
+        while True:
+            tok = self.peek()
+            if allow_sign and tok is not None and tok.kind == TokenKind.ARITHMETIC_OPERATOR and tok.value in ('+', '-'):
+                ops.append((2, self.current_index, tok, True))
+                self.current_index += 1
+
+            # factor biasa (literal, IDENTIFIER) langsung jadi node, cuma yang bersarang lewat drive
+            operand = self._parse_factor()
+            if type(operand) is GeneratorType:
+                operand = yield operand
+            if operand is None:
+                # urutan error sama dengan rantai lama parse_term -> parse_simple_expression -> parse_expression
+                tok = self.peek()
+                self.error("factor", tok)
+                self.error("term", tok)
+                self.error("simple-expression", tok)
                 return None
-            node.add_children(right_simple_expr)
-            
+            operands.append(operand)
+
+            tok = self.peek()
+            level = None
+            if tok is not None:
+                level = levels_by_word[tok.word]
+                if level is None:
+                    lexemes = levels_by_lexeme[tok.kind]
+                    if lexemes is not None:
+                        level = lexemes.get(tok.value)
+            if level is None or (level == 1 and relational):
+                # akhir ekspresi (relasional kedua ditinggal untuk pemanggil)
+                if ops:
+                    self._reduce_operators(operands, ops, 0)
+                return self._expression_node(operands[0])
+
+            if ops:
+                self._reduce_operators(operands, ops, level)
+            ops.append((level, self.current_index, tok, False))
+            self.current_index += 1
+            allow_sign = level == 1
+            relational = relational or level == 1
+
+    def _reduce_operators(self, operands: list, ops: list, level: int):
+        # reduksi operator di puncak stack yang mengikat minimal sekuat `level` (asosiatif kiri)
+        while ops and ops[-1][0] >= level:
+            op_level, op_index, op_tok, is_sign = ops.pop()
+            if is_sign:
+                operands.append(self._signed_node(op_index, op_tok, operands.pop()))
+            else:
+                right = operands.pop()
+                operands.append(self._binary_node(op_index, op_tok, op_level, operands.pop(), right))
+
+    # Hook pembentuk node; operator/sign diberikan sebagai index dan token-nya (token
+    # yang sudah lewat belum tentu masih bisa dibaca lewat self.tokens). Versi parse tree:
+    # wrapper grammar (<term>, <simple-expression>, <expression>) cuma dibuat di titik
+    # yang memang dibutuhkan parse tree, anak-anaknya tetap flat seperti aturan grammar-nya.
+    def _binary_node(self, op_index: int, op_tok: Token, level: int, left, right):
+        if level == 3:
+            term = left if left.label == "<term>" else self._wrap("<term>", left)
+            term.add_children(self._operator_node("<multiplicative-operator>", op_index, op_tok))
+            term.add_children(right)
+            return term
+        if level == 2:
+            simple = left if left.label == "<simple-expression>" else self._wrap("<simple-expression>", self._as_term(left))
+            simple.add_children(self._operator_node("<additive-operator>", op_index, op_tok))
+            simple.add_children(self._as_term(right))
+            return simple
+        node = self._wrap("<expression>", self._as_simple_expression(left))
+        node.add_children(self._operator_node("<relational-operator>", op_index, op_tok))
+        node.add_children(self._as_simple_expression(right))
         return node
-    
-    def parse_simple_expression(self):
-        # <simple-expression> ::= [ <sign> ] <term> { <additive-operator> <term> }
-        node = Node("<simple-expression>")
-        
-        # opsional [ <sign> ] (+ atau -)
-        tok = self.peek()
-        if tok and tok.token_type == "ARITHMETIC_OPERATOR" and tok.value in ('+', '-'):
-            sign_node = Node("SIGN", self.consume_token())
-            node.add_children(sign_node)
-            
-        term_node = self.parse_term()
-        if not term_node:
-            self.error("term", self.peek())
-            return None
-        node.add_children(term_node)
-        
-        # loop untuk { <additive-operator> <term> }
-        while True:
-            op_node = self.parse_additive_operator()
-            
-            if not op_node:
-                break 
-                
-            node.add_children(op_node)
-            
-            # kalo ada operator, wajib ada <term> berikutnya
-            term_node = self.parse_term()
-            if not term_node:
-                self.error("term", self.peek())
-                return None 
-            node.add_children(term_node)
-            
+
+    def _signed_node(self, sign_index: int, sign_tok: Token, term):
+        node = self.new_node("<simple-expression>")
+        node.add_children(self._token_node(sign_index, sign_tok, "SIGN"))
+        node.add_children(self._as_term(term))
         return node
 
-    def parse_term(self):
-        """
-        <term> ::= <factor> ( <multiplicative-operator> <factor> )*
-        """
-        node = Node("<term>")
+    def _expression_node(self, expr):
+        if expr.label == "<expression>":
+            return expr
+        return self._wrap("<expression>", self._as_simple_expression(expr))
 
-        # first factor
-        first_factor = self.parse_factor()
-        if not first_factor:
-            _tok = self.peek()
-            self.error("factor", _tok)
-            return None
-        node.add_children(first_factor)
+    def _as_term(self, node):
+        return node if node.label == "<term>" else self._wrap("<term>", node)
 
-        # (* op factor)
-        while True:
-            op_node = self.parse_multiplicative_operator()
-            if not op_node:
-                break
-            node.add_children(op_node)
+    def _as_simple_expression(self, node):
+        if node.label == "<simple-expression>":
+            return node
+        return self._wrap("<simple-expression>", self._as_term(node))
 
-            rhs = self.parse_factor()
-            if not rhs:
-                _tok2 = self.peek()
-                self.error("factor", _tok2)
-                return None
-            node.add_children(rhs)
+    def _wrap(self, label: str, child):
+        node = self.new_node(label)
+        node.add_children(child)
+        return node
 
+    def _operator_node(self, label: str, op_index: int, op_tok: Token):
+        node = self.new_node(label)
+        node.add_children(self._token_node(op_index, op_tok))
         return node
 
     def parse_factor(self):
+        return drive(self._parse_factor())
+
+    def _parse_factor(self):
         """
         <factor> ::= IDENTIFIER
                    | <function-call>
@@ -791,122 +1052,156 @@ class Parser:
         Catatan: Pemanggilan fungsi/prosedur (IDENTIFIER (...)) akan ditangani di rule lain
         atau dapat diperluas kemudian; di sini fokus pada bentuk-bentuk dasar sesuai permintaan.
         """
-        node = Node("<factor>")
         tok = self.peek()
 
         if tok is None:
             self.error("factor", None)
             return None
 
+        # FIRST(factor): 'tidak'/true/false lewat id Word, sisanya lewat TokenKind
+        rule = self.FACTOR_RULES_BY_WORD[tok.word] or self.FACTOR_RULES[tok.kind]
+        if rule is None:
+            # if no form matched
+            self.error("factor", tok)
+            return None
+        return rule(self)
+
+    def _parse_not_factor(self):
         # unary logical NOT: 'tidak'
-        if tok.token_type == "LOGICAL_OPERATOR" and tok.value.lower() == "tidak":
-            not_tok = self.consume_token()
-            node.add_children(Node("LOGICAL_OPERATOR", not_tok))
-            sub = self.parse_factor()
-            if not sub:
-                _tok3 = self.peek()
-                self.error("factor", _tok3)
-                return None
-            node.add_children(sub)
-            return node
+        node = self.new_node("<factor>")
+        not_tok = self.consume_token()
+        node.add_children(self.new_node("LOGICAL_OPERATOR", not_tok))
+        sub = yield self._parse_factor()
+        if not sub:
+            _tok3 = self.peek()
+            self.error("factor", _tok3)
+            return None
+        node.add_children(sub)
+        return node
 
+    def _parse_parenthesized_factor(self):
         # parenthesized expression
-        if tok.token_type == "LPARENTHESIS" and tok.value == "(":
-            lpar = self.consume_token()
-            node.add_children(Node("LPARENTHESIS", lpar))
-
-            expr = self.parse_expression()
-            if not expr:
-                _tok4 = self.peek()
-                self.error("expression", _tok4)
-                return None
-            node.add_children(expr)
-
-            rpar = self.match_token("RPARENTHESIS", ")")
-            if not rpar:
-                return None
-            node.add_children(Node("RPARENTHESIS", rpar))
-            return node
-
-        # literals and identifier
-        if tok.token_type in ("NUMBER", "CHAR_LITERAL", "STRING_LITERAL"):
-            node.add_children(Node(tok.token_type, self.consume_token()))
-            return node
-        
-        # handle Boolean Literal (true/false) 
-        if tok.token_type == "KEYWORD" and tok.value.lower() in ("true", "false"):
-            node.add_children(Node("BOOLEAN_LITERAL", self.consume_token()))
-            return node
-
-        if tok.token_type == "IDENTIFIER":
-            # liat token kedua untuk memutuskan ini function call, array access, atau IDENTIFIER biasa
-            next_tok_index = self.current_index + 1
-            if next_tok_index < len(self.tokens) and self.tokens[next_tok_index].token_type == "LPARENTHESIS":
-                return self.parse_procedure_function_call()
-            elif next_tok_index < len(self.tokens) and self.tokens[next_tok_index].token_type == "LBRACKET":
-                # Array element access: IDENTIFIER '[' <expression> ']'
-                node.add_children(Node("IDENTIFIER", self.consume_token()))
-                node.add_children(Node("LBRACKET", self.consume_token()))
-                index_expr = self.parse_expression()
-                if index_expr:
-                    node.add_children(index_expr)
-                rbracket = self.match_token("RBRACKET", "]")
-                if rbracket:
-                    node.add_children(Node("RBRACKET", rbracket))
-                return node
-            else:
-                node.add_children(Node("IDENTIFIER", self.consume_token()))
-                return node
+        node = self.new_node("<factor>")
+        lpar = self.consume_token()
+        node.add_children(self.new_node("LPARENTHESIS", lpar))
+
+        expr = yield self._parse_expression()
+        if not expr:
+            _tok4 = self.peek()
+            self.error("expression", _tok4)
+            return None
+        node.add_children(expr)
 
-        # if no form matched
-        self.error("factor", tok)
-        return None
+        rpar = self.match_token(TokenKind.RPARENTHESIS, ")")
+        if not rpar:
+            return None
+        node.add_children(self.new_node("RPARENTHESIS", rpar))
+        return node
 
-    def parse_relational_operator(self):
-        """
-        <relational-operator> ::= '=' | '<>' | '<' | '<=' | '>' | '>='
-        """
-        tok = self.peek()
-        if tok and tok.token_type == "RELATIONAL_OPERATOR" and tok.value in ("=", "<>", "<", "<=", ">", ">="):
-            node = Node("<relational-operator>")
-            node.add_children(Node("RELATIONAL_OPERATOR", self.consume_token()))
-            return node
-        return None
+    def _parse_literal_factor(self):
+        # literals: NUMBER, CHAR_LITERAL, STRING_LITERAL
+        node = self.new_node("<factor>")
+        tok = self.consume_token()
+        node.add_children(self.new_node(tok.token_type, tok))
+        return node
 
-    def parse_additive_operator(self):
-        """
-        <additive-operator> ::= '+' | '-' | 'atau'
-        '+' | '-' bertipe ARITHMETIC_OPERATOR, 'atau' bertipe LOGICAL_OPERATOR
-        """
-        tok = self.peek()
-        if tok is None:
-            return None
+    def _parse_boolean_factor(self):
+        # handle Boolean Literal (true/false)
+        node = self.new_node("<factor>")
+        node.add_children(self.new_node("BOOLEAN_LITERAL", self.consume_token()))
+        return node
 
-        if tok.token_type == "ARITHMETIC_OPERATOR" and tok.value in ("+", "-"):
-            node = Node("<additive-operator>")
-            node.add_children(Node("ARITHMETIC_OPERATOR", self.consume_token()))
-            return node
-        if tok.token_type == "LOGICAL_OPERATOR" and tok.value.lower() == "atau":
-            node = Node("<additive-operator>")
-            node.add_children(Node("LOGICAL_OPERATOR", self.consume_token()))
-            return node
-        return None
+    def _parse_identifier_factor(self):
+        # liat token kedua untuk memutuskan ini function call, array access, atau IDENTIFIER biasa
+        next_tok = self.peek_next()
+        next_kind = next_tok.kind if next_tok is not None else TokenKind.UNKNOWN
+        if next_kind == TokenKind.LPARENTHESIS:
+            return self._parse_procedure_function_call()
+        if next_kind == TokenKind.LBRACKET:
+            return self._parse_array_access_factor()
+        node = self.new_node("<factor>")
+        node.add_children(self.new_node("IDENTIFIER", self.consume_token()))
+        return node
 
-    def parse_multiplicative_operator(self):
-        """
-        <multiplicative-operator> ::= '*' | '/' | 'bagi' | 'mod' | 'dan'
-        '*' '/' 'bagi' 'mod' bertipe ARITHMETIC_OPERATOR, 'dan' bertipe LOGICAL_OPERATOR
-        """
-        tok = self.peek()
-        if tok is None:
-            return None
+    def _parse_array_access_factor(self):
+        # Array element access: IDENTIFIER '[' <expression> ']'
+        node = self.new_node("<factor>")
+        node.add_children(self.new_node("IDENTIFIER", self.consume_token()))
+        node.add_children(self.new_node("LBRACKET", self.consume_token()))
+        index_expr = yield self._parse_expression()
+        if index_expr:
+            node.add_children(index_expr)
+        rbracket = self.match_token(TokenKind.RBRACKET, "]")
+        if rbracket:
+            node.add_children(self.new_node("RBRACKET", rbracket))
+        return node
 
-        if tok.token_type == "ARITHMETIC_OPERATOR" and tok.value in ("*", "/", "bagi", "mod"):
-            node = Node("<multiplicative-operator>")
-            node.add_children(Node("ARITHMETIC_OPERATOR", self.consume_token()))
-            return node
-        if tok.token_type == "LOGICAL_OPERATOR" and tok.value.lower() == "dan":
-            node = Node("<multiplicative-operator>")
-            node.add_children(Node("LOGICAL_OPERATOR", self.consume_token()))
-            return node
-        return None
\ No newline at end of file
+    # ====== TABEL DISPATCH ======
+    # Tabel berindeks TokenKind / Word (list biasa, bukan rantai if string):
+    # FIRST set tiap aturan yang bercabang, dipakai parse_* untuk memilih sub-aturan.
+
+    # kind yang lexeme-nya selalu sama; match_token ga perlu bandingin value-nya
+    FIXED_LEXEMES = kind_table({
+        TokenKind.ASSIGN_OPERATOR: ":=", TokenKind.SEMICOLON: ";", TokenKind.COLON: ":",
+        TokenKind.COMMA: ",", TokenKind.DOT: ".", TokenKind.RANGE_OPERATOR: "..",
+        TokenKind.LPARENTHESIS: "(", TokenKind.RPARENTHESIS: ")",
+        TokenKind.LBRACKET: "[", TokenKind.RBRACKET: "]",
+    })
+
+    # sync set pemulihan error (lihat _synchronize): pasangan tabel (TokenKind, Word).
+    # '.' ada di semua sync set sebagai batas akhir program.
+    STATEMENT_SYNC = (
+        kind_table({TokenKind.SEMICOLON: True, TokenKind.DOT: True}),
+        kind_table({Word.SELESAI: True}, len(Word.SPELLINGS)),
+    )
+    THEN_SYNC = (
+        STATEMENT_SYNC[0],
+        kind_table({Word.SELESAI: True, Word.SELAIN_ITU: True}, len(Word.SPELLINGS)),
+    )
+    DECLARATION_SYNC = (
+        kind_table({TokenKind.DOT: True}),
+        kind_table({
+            Word.KONSTANTA: True, Word.TIPE: True, Word.VARIABEL: True,
+            Word.PROSEDUR: True, Word.FUNGSI: True, Word.MULAI: True,
+        }, len(Word.SPELLINGS)),
+    )
+    DECLARATION_ENTRY_SYNC = (STATEMENT_SYNC[0], DECLARATION_SYNC[1])
+    # buang semua token sampai EOF
+    NO_SYNC = (kind_table({}), kind_table({}, len(Word.SPELLINGS)))
+
+    # 0 = konstanta, 1 = tipe, 2 = variabel, 3 = subprogram (lihat parse_declaration_part)
+    DECLARATION_SECTIONS = kind_table({
+        Word.KONSTANTA: 0, Word.TIPE: 1, Word.VARIABEL: 2, Word.PROSEDUR: 3, Word.FUNGSI: 3,
+    }, len(Word.SPELLINGS))
+
+    SIMPLE_TYPES = kind_table({
+        Word.INTEGER: True, Word.REAL: True, Word.BOOLEAN: True, Word.CHAR: True,
+    }, len(Word.SPELLINGS))
+
+    STATEMENT_RULES = kind_table({
+        Word.JIKA: _parse_if_statement, Word.SELAMA: _parse_while_statement,
+        Word.UNTUK: _parse_for_statement, Word.MULAI: _parse_compound_statement,
+    }, len(Word.SPELLINGS))
+
+    FACTOR_RULES_BY_WORD = kind_table({
+        Word.TIDAK: _parse_not_factor, Word.TRUE: _parse_boolean_factor, Word.FALSE: _parse_boolean_factor,
+    }, len(Word.SPELLINGS))
+
+    # level operator biner (lihat parse_expression): operator kata lewat id Word,
+    # operator simbol lewat lexeme per TokenKind
+    BINARY_LEVELS_BY_WORD = kind_table({
+        Word.ATAU: 2, Word.BAGI: 3, Word.MOD: 3, Word.DAN: 3,
+    }, len(Word.SPELLINGS))
+
+    BINARY_LEVELS_BY_LEXEME = kind_table({
+        TokenKind.RELATIONAL_OPERATOR: {"=": 1, "<>": 1, "<": 1, "<=": 1, ">": 1, ">=": 1},
+        TokenKind.ARITHMETIC_OPERATOR: {"+": 2, "-": 2, "*": 3, "/": 3},
+    })
+
+    FACTOR_RULES = kind_table({
+        TokenKind.LPARENTHESIS: _parse_parenthesized_factor,
+        TokenKind.NUMBER: _parse_literal_factor,
+        TokenKind.CHAR_LITERAL: _parse_literal_factor,
+        TokenKind.STRING_LITERAL: _parse_literal_factor,
+        TokenKind.IDENTIFIER: _parse_identifier_factor,
+    })
\ No newline at end of file
@@ -0,0 +1,316 @@
+"""
+Profiler per aturan grammar untuk Parser (dan subclass-nya).
+
+ParserProfiler membungkus method parse_* / _parse_* milik SATU instance parser
+(sebagai atribut instance, termasuk salinan tabel dispatch seperti
+STATEMENT_RULES), jadi Parser yang tidak diprofil tidak berubah sama sekali.
+Untuk setiap aturan dicatat jumlah panggilan, waktu inclusive / exclusive,
+token yang dikonsumsi, dan node yang dibuat (lewat new_node / _token_node).
+
+Aturan yang berupa generator (dijalankan drive()) diukur dari pemanggilan
+sampai generator-nya selesai; selama generator menunggu sub-aturan, waktu itu
+milik sub-aturan tersebut. Nilai inclusive aturan rekursif hanya dihitung pada
+pemanggilan terluar (seperti cProfile).
+
+Penggunaan:
+    python -m src.parser.profiler file.pas [--sort excl|incl|calls|tokens|nodes]
+                                           [--json out.json] [--collapsed out.folded]
+
+Seperti bench.parser, GC dimatikan selama parsing di CLI (pakai --gc untuk
+membiarkannya aktif): koleksi GC terjadi di aturan mana saja yang sedang
+berjalan dan mengacaukan waktu exclusive.
+
+File --collapsed berformat "aturan;aturan;... mikrodetik" per baris
+(waktu exclusive), bisa langsung dibaca flamegraph.pl / speedscope.
+"""
+import argparse
+import gc
+import json
+import logging
+import sys
+import time
+from types import GeneratorType
+
+from src.common.utils import read_source_code
+from src.lexer.dfa_cache import load_compiled_dfa
+from src.lexer.lexer import Lexer
+from src.parser.parser import Parser
+
+
+class RuleStats:
+    """Akumulasi statistik satu aturan (satu nama method)."""
+    __slots__ = ("name", "calls", "incl_ns", "excl_ns", "tokens_incl", "tokens_excl",
+                 "nodes_incl", "nodes_excl", "active")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.incl_ns = 0
+        self.excl_ns = 0
+        self.tokens_incl = 0
+        self.tokens_excl = 0
+        self.nodes_incl = 0
+        self.nodes_excl = 0
+        self.active = 0     # kedalaman rekursi yang sedang berjalan
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__ if name != "active"}
+
+
+class _Frame:
+    __slots__ = ("stats", "path", "start_ns", "start_pos", "start_nodes",
+                 "child_ns", "child_tokens", "child_nodes")
+
+    def __init__(self, stats: RuleStats, path: int, start_ns: int, start_pos: int, start_nodes: int):
+        self.stats = stats
+        self.path = path
+        self.start_ns = start_ns
+        self.start_pos = start_pos
+        self.start_nodes = start_nodes
+        self.child_ns = 0
+        self.child_tokens = 0
+        self.child_nodes = 0
+
+
+class ParserProfiler:
+    """
+    Instrumentasi per aturan untuk satu instance parser.
+
+    Contoh:
+        parser = Parser(tokens)
+        profiler = ParserProfiler(parser)
+        parser.parse_program()
+        print(profiler.table())
+    """
+    SORT_KEYS = {
+        "excl": "excl_ns", "incl": "incl_ns", "calls": "calls",
+        "tokens": "tokens_excl", "nodes": "nodes_excl",
+    }
+    # stack collapsed dipotong di kedalaman ini (frame yang lebih dalam digabung ke
+    # frame di kedalaman tersebut), supaya output nesting yang sangat dalam tidak kuadratik
+    COLLAPSED_DEPTH = 256
+
+    def __init__(self, parser: Parser):
+        """
+        Args:
+            parser (Parser): Parser yang diprofil; method-nya langsung dibungkus
+                sampai detach() dipanggil.
+        """
+        self.parser = parser
+        self.stats: dict[str, RuleStats] = {}
+        self.nodes = 0
+        self._stack: list[_Frame] = []
+        # trie stack aturan untuk output collapsed: id -> (id induk, nama), waktu exclusive
+        self._path_ids: dict[tuple[int, str], int] = {}
+        self._path_parent: list[int] = [-1]
+        self._path_name: list[str] = [""]
+        self._path_ns: list[int] = [0]
+        self._attached: list[str] = []
+        self._attach()
+
+    # ====== PEMBUNGKUSAN ======
+
+    def _attach(self):
+        parser = self.parser
+        cls = type(parser)
+        wrapped = {}
+        for name in dir(cls):
+            if not (name.startswith("parse_") or name.startswith("_parse_")):
+                continue
+            function = getattr(cls, name)
+            if callable(function):
+                wrapped[function] = self._wrap(name, getattr(parser, name))
+                self._set(name, wrapped[function])
+
+        # tabel dispatch berisi fungsi (dipanggil rule(self)): salinan per instance
+        for name in dir(cls):
+            table = getattr(cls, name)
+            if isinstance(table, list) and any(entry in wrapped for entry in table if callable(entry)):
+                self._set(name, [
+                    (lambda _parser, method=wrapped[entry]: method()) if entry in wrapped else entry
+                    for entry in table
+                ])
+
+        for name in ("new_node", "_token_node"):
+            self._set(name, self._count_nodes(getattr(parser, name)))
+
+    def _set(self, name: str, value):
+        setattr(self.parser, name, value)
+        self._attached.append(name)
+
+    def detach(self):
+        """Melepas semua pembungkus; parser kembali memakai method kelasnya."""
+        for name in self._attached:
+            if name == "new_node":
+                # new_node memang atribut instance Parser: kembalikan yang asli
+                self.parser.new_node = self.parser.new_node.__wrapped__
+            else:
+                delattr(self.parser, name)
+        self._attached = []
+
+    def _count_nodes(self, make):
+        def counted(*args):
+            self.nodes += 1
+            return make(*args)
+        counted.__wrapped__ = make
+        return counted
+
+    def _wrap(self, name: str, method):
+        stats = self.stats.setdefault(name, RuleStats(name))
+
+        def wrapped(*args):
+            frame = self._enter(stats)
+            try:
+                result = method(*args)
+            except BaseException:
+                self._leave(frame)
+                raise
+            if type(result) is GeneratorType:
+                # aturan (atau sub-aturan yang dipilihnya) berjalan di drive(): frame
+                # baru ditutup saat generator itu selesai
+                return self._steps(frame, result)
+            self._leave(frame)
+            return result
+        return wrapped
+
+    def _steps(self, frame: _Frame, gen):
+        value, error = None, None
+        try:
+            while True:
+                try:
+                    request = gen.send(value) if error is None else gen.throw(error)
+                except StopIteration as stop:
+                    return stop.value
+                error = None
+                try:
+                    value = yield request
+                except Exception as exc:
+                    value, error = None, exc
+        finally:
+            self._leave(frame)
+
+    # ====== PENCATATAN ======
+
+    def _position(self) -> int:
+        parser = self.parser
+        return parser.current_index + getattr(parser, "_token_offset", 0)
+
+    def _enter(self, stats: RuleStats) -> _Frame:
+        parent = self._stack[-1].path if self._stack else 0
+        key = (parent, stats.name)
+        path = self._path_ids.get(key)
+        if path is None and len(self._stack) >= self.COLLAPSED_DEPTH:
+            path = parent
+        elif path is None:
+            path = self._path_ids[key] = len(self._path_parent)
+            self._path_parent.append(parent)
+            self._path_name.append(stats.name)
+            self._path_ns.append(0)
+        stats.calls += 1
+        stats.active += 1
+        frame = _Frame(stats, path, 0, self._position(), self.nodes)
+        self._stack.append(frame)
+        frame.start_ns = time.perf_counter_ns()
+        return frame
+
+    def _leave(self, frame: _Frame):
+        now = time.perf_counter_ns()
+        stack = self._stack
+        while stack and stack.pop() is not frame:
+            pass
+        incl_ns = now - frame.start_ns
+        tokens = self._position() - frame.start_pos
+        nodes = self.nodes - frame.start_nodes
+        stats = frame.stats
+        stats.active -= 1
+        if not stats.active:
+            stats.incl_ns += incl_ns
+            stats.tokens_incl += tokens
+            stats.nodes_incl += nodes
+        excl_ns = incl_ns - frame.child_ns
+        stats.excl_ns += excl_ns
+        stats.tokens_excl += tokens - frame.child_tokens
+        stats.nodes_excl += nodes - frame.child_nodes
+        self._path_ns[frame.path] += excl_ns
+        if stack:
+            parent = stack[-1]
+            parent.child_ns += incl_ns
+            parent.child_tokens += tokens
+            parent.child_nodes += nodes
+
+    # ====== OUTPUT ======
+
+    def rules(self, sort: str = "excl") -> list[RuleStats]:
+        """Statistik aturan yang pernah dipanggil, diurutkan menurun menurut `sort`."""
+        key = self.SORT_KEYS[sort]
+        return sorted((s for s in self.stats.values() if s.calls),
+                      key=lambda s: getattr(s, key), reverse=True)
+
+    def table(self, sort: str = "excl") -> str:
+        """Tabel teks per aturan, diurutkan menurun menurut `sort` (lihat SORT_KEYS)."""
+        rules = self.rules(sort)
+        total = sum(s.excl_ns for s in rules) or 1
+        lines = [f"{'aturan':<32} {'panggilan':>10} {'incl ms':>9} {'excl ms':>9} {'excl%':>6} "
+                 f"{'token':>9} {'token ex':>9} {'node':>9} {'node ex':>9}"]
+        for s in rules:
+            lines.append(f"{s.name:<32} {s.calls:>10,} {s.incl_ns / 1e6:>9.2f} {s.excl_ns / 1e6:>9.2f} "
+                         f"{100 * s.excl_ns / total:>5.1f}% {s.tokens_incl:>9,} {s.tokens_excl:>9,} "
+                         f"{s.nodes_incl:>9,} {s.nodes_excl:>9,}")
+        return "\n".join(lines)
+
+    def to_json(self, sort: str = "excl") -> dict:
+        """Statistik dalam bentuk dict yang bisa di-json.dump (waktu dalam nanodetik)."""
+        rules = self.rules(sort)
+        return {"total_excl_ns": sum(s.excl_ns for s in rules), "nodes": self.nodes,
+                "rules": [s.as_dict() for s in rules]}
+
+    def collapsed(self) -> str:
+        """Stack aturan format collapsed ("a;b;c mikrodetik" per baris) untuk flamegraph."""
+        names, parents = self._path_name, self._path_parent
+        lines = []
+        for path, ns in enumerate(self._path_ns):
+            micros = ns // 1000
+            if path == 0 or micros <= 0:
+                continue
+            parts = []
+            while path > 0:
+                parts.append(names[path])
+                path = parents[path]
+            lines.append(f"{';'.join(reversed(parts))} {micros}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def main(argv: list[str] | None = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("source", help="file .pas yang di-parse")
+    arg_parser.add_argument("--sort", choices=sorted(ParserProfiler.SORT_KEYS), default="excl")
+    arg_parser.add_argument("--json", help="tulis statistik sebagai JSON ke file ini")
+    arg_parser.add_argument("--collapsed", help="tulis stack collapsed (flamegraph) ke file ini")
+    arg_parser.add_argument("--gc", action="store_true", help="biarkan GC aktif selama parsing")
+    args = arg_parser.parse_args(argv)
+
+    logging.disable(logging.ERROR)
+    tokens = Lexer(read_source_code(args.source), load_compiled_dfa()).tokenize()
+    parser = Parser(tokens)
+    profiler = ParserProfiler(parser)
+    if not args.gc:
+        gc.disable()
+    start = time.perf_counter()
+    parser.parse_program()
+    elapsed = time.perf_counter() - start
+    gc.enable()
+
+    print(f"{len(tokens):,} token, {profiler.nodes:,} node, {len(parser.errors)} syntax error, "
+          f"{elapsed:.3f} s (dengan instrumentasi)\n")
+    print(profiler.table(args.sort))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(profiler.to_json(args.sort), f, indent=2)
+    if args.collapsed:
+        with open(args.collapsed, "w", encoding="utf-8") as f:
+            f.write(profiler.collapsed())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
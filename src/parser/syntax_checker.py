@@ -0,0 +1,49 @@
+from typing import Iterable
+
+from src.common.pascal_token import Token
+from src.parser.parser import Parser
+
+
+class _DiscardedNode:
+    """
+    Pengganti Node untuk SyntaxChecker: label tetap ada (dipakai hook ekspresi
+    Parser), tapi anak dan token tidak disimpan.
+    """
+    __slots__ = ("label",)
+    token = None
+    children = ()
+
+    def __init__(self, label: str, token: Token | None = None):
+        self.label = label
+
+    def add_children(self, node):
+        return node
+
+
+class SyntaxChecker(Parser):
+    """
+    Parser yang hanya memeriksa sintaks: grammar, pemulihan error dan pesan
+    error sama dengan Parser, tetapi parse tree tidak dibangun.
+
+    Dengan token berupa iterator (mis. Lexer(file).iter_tokens()), lexing dan
+    parsing berjalan dalam satu pass streaming: Parser hanya menahan LOOKAHEAD
+    token terakhir dan node tidak disimpan, jadi memori tidak bergantung pada
+    ukuran file (hanya pada kedalaman nesting dan jumlah error).
+    """
+
+    def __init__(self, tokens: list[Token] | Iterable[Token]):
+        super().__init__(tokens)
+        self.new_node = _DiscardedNode
+
+    def _token_node(self, index: int, tok: Token, label: str | None = None):
+        return _DiscardedNode(label or tok.token_type)
+
+    def check(self) -> list[str]:
+        """
+        Memeriksa seluruh program.
+
+        Returns:
+            list[str]: Semua syntax error (kosong jika program valid).
+        """
+        self.parse_program()
+        return self.errors
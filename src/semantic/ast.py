@@ -4,34 +4,57 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
-from src.common.pascal_token import Token
+from src.common.token_stream import number_value
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTNode:
-	"""Base AST node carrying source token and semantic placeholders."""
-	token: Token | None = None
-	type_info: Any | None = None
-	symbol: Any | None = None
-	scope_level: int | None = None
+	"""Base AST node.
+
+	Nodes are slotted and keep their source position as the index of their
+	token in the parsed token sequence (-1 if none) instead of a Token
+	reference, so a large AST holds neither per-node dicts nor token objects.
+	Semantic annotations live outside the nodes, in ASTAnnotations.
+	"""
+	token_index: int = -1
 
 
 class Statement(ASTNode):
 	"""Marker base class for statement nodes."""
+	__slots__ = ()
 
 
 class Expression(ASTNode):
 	"""Marker base class for expression nodes."""
-	type:  None = None
-	is_constant: bool = False
+	__slots__ = ()
 
 
 class TypeExpr(ASTNode):
 	"""Marker base class for type expression nodes."""
+	__slots__ = ()
 
 
 class SubprogramDecl(ASTNode):
 	"""Base class for procedure/function declarations."""
+	__slots__ = ()
+
+
+class ASTAnnotations:
+	"""Side tables for semantic annotations, keyed by id(node).
+
+	Filled by SemanticAnalyzer: `type` maps expressions to their TypeKind,
+	`symbol` and `scope_level` map declarations and variable references to
+	their symbol table index and level, `constant` holds constant expressions.
+	Keys are object ids, so the tables are only meaningful while the AST they
+	were computed for is alive.
+	"""
+	__slots__ = ("type", "symbol", "scope_level", "constant")
+
+	def __init__(self):
+		self.type: dict[int, Any] = {}
+		self.symbol: dict[int, int] = {}
+		self.scope_level: dict[int, int] = {}
+		self.constant: set[int] = set()
 
 
 class ParamKind(Enum):
@@ -43,13 +66,13 @@ class ForDirection(Enum):
 	DOWNTO = "turun_ke"
 
 
-@dataclass
+@dataclass(slots=True)
 class Program(ASTNode):
 	name: str = ""
 	block: Block | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Block(ASTNode):
 	const_decls: list["ConstDecl"] = field(default_factory=list)
 	type_decls: list["TypeDecl"] = field(default_factory=list)
@@ -58,39 +81,39 @@ class Block(ASTNode):
 	body: CompoundStmt | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstDecl(ASTNode):
 	name: str = ""
 	value: Expression | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeDecl(ASTNode):
 	name: str = ""
 	type_expr: TypeExpr | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VarDecl(ASTNode):
 	names: list[str] = field(default_factory=list)
 	type_expr: TypeExpr | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Param(ASTNode):
 	name: str = ""
 	type_expr: TypeExpr | None = None
 	kind: ParamKind = ParamKind.VALUE
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcedureDecl(SubprogramDecl):
 	name: str = ""
 	params: list[Param] = field(default_factory=list)
 	block: Block | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionDecl(SubprogramDecl):
 	name: str = ""
 	params: list[Param] = field(default_factory=list)
@@ -98,53 +121,53 @@ class FunctionDecl(SubprogramDecl):
 	block: Block | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PrimitiveType(TypeExpr):
 	name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class NamedType(TypeExpr):
 	name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class RangeExpr(ASTNode):
 	lower: Expression | None = None
 	upper: Expression | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ArrayType(TypeExpr):
 	index_range: RangeExpr | None = None
 	element_type: TypeExpr | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CompoundStmt(Statement):
 	statements: list[Statement] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AssignStmt(Statement):
 	target: "VarRef | ArrayAccess | None" = None
 	value: Expression | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IfStmt(Statement):
 	condition: Expression | None = None
 	then_branch: Statement | None = None
 	else_branch: Statement | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WhileStmt(Statement):
 	condition: Expression | None = None
 	body: Statement | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ForStmt(Statement):
 	var: VarRef | None = None
 	start: Expression | None = None
@@ -153,67 +176,67 @@ class ForStmt(Statement):
 	body: Statement | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcCallStmt(Statement):
 	name: str = ""
 	args: list[Expression] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CallExpr(Expression):
 	name: str = ""
 	args: list[Expression] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class BinOp(Expression):
 	op: str = ""
 	left: Expression | None = None
 	right: Expression | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UnaryOp(Expression):
 	op: str = ""
 	operand: Expression | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VarRef(Expression):
 	name: str = ""
-	symbol: int = 0  # index di symbol table
 
 
-@dataclass
+@dataclass(slots=True)
 class ArrayAccess(Expression):
 	"""Array element access: arr[index]"""
 	array: VarRef | None = None
 	index: Expression | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NumberLiteral(Expression):
 	value: str = ""
 	evaluated_value: int | float | None = None
 	def __post_init__(self):
-		try :
-			if '.' in self.value:
-				self.evaluated_value = float(self.value)
-			else :
-				self.evaluated_value = int(self.value)
-		except ValueError :
-			self.evaluated_value = None
-	
-@dataclass
+		# Nilai biasanya sudah dihitung lexer (Token.number) dan diberikan pembuatnya;
+		# parse ulang hanya jika node dibuat tanpa nilai.
+		if self.evaluated_value is None:
+			self.evaluated_value = number_value(self.value)
+
+	@property
+	def is_real(self) -> bool:
+		return isinstance(self.evaluated_value, float)
+
+@dataclass(slots=True)
 class StringLiteral(Expression):
 	value: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class CharLiteral(Expression):
 	value: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class BooleanLiteral(Expression):
 	value: bool | str | None = None
 
@@ -1,9 +1,14 @@
 from __future__ import annotations
+from bisect import bisect_left
+from operator import attrgetter
 from typing import List
 
 from src.common import node
 from src.common.node import Node
+from src.common.parse_tree_arena import ArenaNode
 from src.common.pascal_token import Token
+from src.common.token_stream import TokenStream, TokenView
+from src.common.trampoline import drive
 from src.semantic.ast import (
 	ArrayAccess,
 	ArrayType,
@@ -38,37 +43,83 @@ from src.semantic.ast import (
 	NamedType,
 )
 
+_position = attrgetter("line", "column")
+
 
 class ASTBuilder:
-	"""Provides helpers to transform parser Nodes into semantic AST nodes."""
+	"""Provides helpers to transform parser Nodes into semantic AST nodes.
+
+	Works on Node trees as well as ArenaNode handles from ParseTreeArena,
+	which expose the same label/token/children interface.
+
+	Builders for constructs that nest (blocks, statements, expressions, array
+	types) are generators run by drive(): they yield the builder of a child and
+	receive its result, so nesting depth is not bounded by the recursion limit.
+	Use drive(self._build_x(node)) to call one from outside a builder; return
+	annotations name the node a builder produces.
+
+	AST nodes record their position as a token index (ASTNode.token_index),
+	resolved by _index() from the parse tree node that carries the token.
+	"""
 
-	def build(self, root: Node) -> Program:
-		"""Build a Program AST node from the parser root."""
+	def __init__(self):
+		self._tokens: list[Token] | None = None
+
+	def build(self, root: Node, tokens: list[Token] | TokenStream | None = None) -> Program:
+		"""Build a Program AST node from the parser root.
+
+		Token indices come from the arena for ArenaNode trees and from the
+		tokens themselves for a TokenStream. For Node trees over a list[Token],
+		pass that list as `tokens`; without it token_index stays -1.
+		"""
 		if root.label != "<program>":
 			raise ValueError("Root node must be <program> to build AST")
-		return self._build_program(root)
+		self._tokens = tokens if isinstance(tokens, list) else None
+		return drive(self._build_program(root))
+
+	def _index(self, node: Node | None) -> int:
+		"""Index of the token of parse tree `node` in the parsed tokens, or -1."""
+		if node is None:
+			return -1
+		if type(node) is ArenaNode:
+			return node.arena.token_indices[node.index]
+		token = node.token
+		if token is None:
+			return -1
+		if type(token) is TokenView:
+			return token.index
+		tokens = self._tokens
+		if tokens is None:
+			return -1
+		# tokens are in source order: find the position, then check it is the same token
+		i = bisect_left(tokens, (token.line, token.column), key=_position)
+		return i if i < len(tokens) and tokens[i] is token else -1
+
+	def _operator_index(self, op_node: Node) -> int:
+		"""Index of the operator token under an <...-operator> node, or -1."""
+		return self._index(op_node.children[0]) if op_node.children else -1
 
 	def _build_program(self, node: Node) -> Program:
 		program_name = ""
-		program_token = None
+		program_index = -1
 		for child in node.children:
 			if child.label == "<program-header>":
 				for header_child in child.children:
 					if header_child.label == "IDENTIFIER" and header_child.token:
 						program_name = header_child.token.value
-						program_token = header_child.token
+						program_index = self._index(header_child)
 						break
 				break
-		block = self._build_block(node)
-		return Program(name=program_name, block=block, token=program_token)
+		block = yield self._build_block(node)
+		return Program(name=program_name, block=block, token_index=program_index)
 
 	def _build_block(self, node: Node) -> Block:
-		block = Block(token=node.token)
+		block = Block(token_index=self._index(node))
 		for child in node.children:
 			if child.label == "<declaration-part>":
-				self._build_declaration_part(child, block)
+				yield self._build_declaration_part(child, block)
 			elif child.label == "<compound-statement>":
-				block.body = self._build_compound_statement(child)
+				block.body = yield self._build_compound_statement(child)
 		return block
 
 	def _build_declaration_part(self, node: Node, block: Block) -> None:
@@ -82,9 +133,9 @@ class ASTBuilder:
 				case "<var-declaration>":
 					block.var_decls.extend(self._build_var_declaration(child))
 				case "<procedure-declaration>":
-					block.subprogram_decls.append(self._build_procedure_declaration(child))
+					block.subprogram_decls.append((yield self._build_procedure_declaration(child)))
 				case "<function-declaration>":
-					block.subprogram_decls.append(self._build_function_declaration(child))
+					block.subprogram_decls.append((yield self._build_function_declaration(child)))
 
 	def _build_const_declaration(self, node: Node) -> list[ConstDecl]:
 		"""Build list[ConstDecl] from <const-declaration> node.
@@ -113,14 +164,14 @@ class ASTBuilder:
 			value_expr = None
 			if expr_node and expr_node.label == "<expression>":
 				try:
-					value_expr = self._build_expression(expr_node)
+					value_expr = drive(self._build_expression(expr_node))
 				except NotImplementedError:
 					value_expr = None
 				i += 1
 			# Trailing semicolon
 			if i < len(children) and children[i].label == "SEMICOLON":
 				i += 1
-			decls.append(ConstDecl(name=name, value=value_expr, token=ident_node.token))
+			decls.append(ConstDecl(name=name, value=value_expr, token_index=self._index(ident_node)))
 		return decls
 
 	def _build_type_declaration(self, node: Node) -> list[TypeDecl]:
@@ -147,14 +198,14 @@ class ASTBuilder:
 			built_type = None
 			if type_node and type_node.label == "<type>":
 				try:
-					built_type = self._build_type_expr(type_node)
+					built_type = drive(self._build_type_expr(type_node))
 				except NotImplementedError:
 					built_type = None
 				i += 1
 			# ';'
 			if i < len(children) and children[i].label == "SEMICOLON":
 				i += 1
-			decls.append(TypeDecl(name=name, type_expr=built_type, token=ident_node.token))
+			decls.append(TypeDecl(name=name, type_expr=built_type, token_index=self._index(ident_node)))
 		return decls
 
 	def _build_var_declaration(self, node: Node) -> list[VarDecl]:
@@ -186,14 +237,14 @@ class ASTBuilder:
 			built_type = None
 			if type_node and type_node.label == "<type>":
 				try:
-					built_type = self._build_type_expr(type_node)
+					built_type = drive(self._build_type_expr(type_node))
 				except NotImplementedError:
 					built_type = None
 				i += 1
 			# ';'
 			if i < len(children) and children[i].label == "SEMICOLON":
 				i += 1
-			decls.append(VarDecl(names=names, type_expr=built_type, token=id_list_node.token))
+			decls.append(VarDecl(names=names, type_expr=built_type, token_index=self._index(id_list_node)))
 		return decls
 
 	def _build_procedure_declaration(self, node: Node) -> ProcedureDecl:
@@ -205,11 +256,11 @@ class ASTBuilder:
 		name: str = ""
 		params: list[Param] = []
 		blk: Block | None = None
-		ident_token = None
+		ident_node = None
 		for child in node.children:
-			if child.label == "IDENTIFIER" and ident_token is None and child.token:
-				ident_token = child.token
-				name = ident_token.value
+			if child.label == "IDENTIFIER" and ident_node is None and child.token:
+				ident_node = child
+				name = child.token.value
 			elif child.label == "<formal-parameter-list>":
 				try:
 					params = self._build_formal_parameter_list(child)  # type: ignore[arg-type]
@@ -217,10 +268,10 @@ class ASTBuilder:
 					params = []
 			elif child.label == "<block>":
 				try:
-					blk = self._build_block(child)  # type: ignore[arg-type]
+					blk = yield self._build_block(child)  # type: ignore[arg-type]
 				except NotImplementedError:
 					blk = None
-		return ProcedureDecl(name=name, params=params, block=blk, token=ident_token)
+		return ProcedureDecl(name=name, params=params, block=blk, token_index=self._index(ident_node))
 
 	def _build_function_declaration(self, node: Node) -> FunctionDecl:
 		"""Build a FunctionDecl from <function-declaration> node.
@@ -232,12 +283,12 @@ class ASTBuilder:
 		params: list[Param] = []
 		ret_type: TypeExpr | None = None
 		blk: Block | None = None
-		ident_token = None
+		ident_node = None
 		after_colon = False
 		for child in node.children:
-			if child.label == "IDENTIFIER" and ident_token is None and child.token:
-				ident_token = child.token
-				name = ident_token.value
+			if child.label == "IDENTIFIER" and ident_node is None and child.token:
+				ident_node = child
+				name = child.token.value
 			elif child.label == "<formal-parameter-list>":
 				try:
 					params = self._build_formal_parameter_list(child)  # type: ignore[arg-type]
@@ -247,15 +298,16 @@ class ASTBuilder:
 				after_colon = True
 			elif child.label == "<type>" and after_colon:
 				try:
-					ret_type = self._build_type_expr(child)
+					ret_type = drive(self._build_type_expr(child))
 				except NotImplementedError:
 					ret_type = None
 			elif child.label == "<block>":
 				try:
-					blk = self._build_block(child)
+					blk = yield self._build_block(child)
 				except NotImplementedError:
 					blk = None
-		return FunctionDecl(name=name, params=params, return_type=ret_type, block=blk, token=ident_token)
+		return FunctionDecl(name=name, params=params, return_type=ret_type, block=blk,
+			token_index=self._index(ident_node))
 
 	def _build_formal_parameter_list(self, node: Node) -> list[Param]:
 		params: list[Param] = []
@@ -265,26 +317,27 @@ class ASTBuilder:
 		return params
 
 	def _build_parameter_group(self, node: Node) -> list[Param]:
-		ident_tokens: list[Token] = []
+		ident_nodes: list[Node] = []
 		type_expr: TypeExpr | None = None
 		for child in node.children:
 			if child.label == "<identifier-list>":
 				for ident_child in child.children:
 					if ident_child.label == "IDENTIFIER" and ident_child.token:
-						ident_tokens.append(ident_child.token)
+						ident_nodes.append(ident_child)
 			elif child.label == "<type>":
-				type_expr = self._build_type_expr(child)
-		params = [Param(name=tok.value, type_expr=type_expr, token=tok) for tok in ident_tokens]
+				type_expr = drive(self._build_type_expr(child))
+		params = [Param(name=ident.token.value, type_expr=type_expr, token_index=self._index(ident))
+			for ident in ident_nodes]
 		return params
 
 	def _build_type_expr(self, node: Node) -> TypeExpr:
 		for child in node.children:
 			if child.label == "KEYWORD" and child.token:
-				return PrimitiveType(name=child.token.value.lower(), token=child.token)
+				return PrimitiveType(name=child.token.keyword, token_index=self._index(child))
 			if child.label == "IDENTIFIER" and child.token:
-				return NamedType(name=child.token.value, token=child.token)
+				return NamedType(name=child.token.value, token_index=self._index(child))
 			if child.label == "<array-type>":
-				return self._build_array_type(child)
+				return (yield self._build_array_type(child))
 		raise NotImplementedError("Unsupported <type> node structure")
 
 	def _build_array_type(self, node: Node) -> ArrayType:
@@ -294,8 +347,9 @@ class ASTBuilder:
 			if child.label == "<range>":
 				range_expr = self._build_range_expr(child)
 			elif child.label == "<type>":
-				element_type = self._build_type_expr(child)
-		return ArrayType(index_range=range_expr, element_type=element_type, token=node.children[0].token if node.children else None)
+				element_type = yield self._build_type_expr(child)
+		return ArrayType(index_range=range_expr, element_type=element_type,
+			token_index=self._index(node.children[0]) if node.children else -1)
 
 	def _build_range_expr(self, node: Node) -> RangeExpr:
 		lower = None
@@ -303,10 +357,10 @@ class ASTBuilder:
 		for child in node.children:
 			if child.label == "<expression>":
 				if lower is None:
-					lower = self._build_expression(child)
+					lower = drive(self._build_expression(child))
 				else:
-					upper = self._build_expression(child)
-		return RangeExpr(lower=lower, upper=upper, token=node.token)
+					upper = drive(self._build_expression(child))
+		return RangeExpr(lower=lower, upper=upper, token_index=self._index(node))
 
 	def _build_statement(self, node: Node) -> Statement:
 		"""Dispatch to specific statement builders based on the node label.
@@ -318,6 +372,8 @@ class ASTBuilder:
 		- If statements
 		- While statements
 		- For statements
+
+		Returns the builder step of the matching statement, to be yielded or driven.
   		"""
 		if not node.children:
 			raise NotImplementedError("Empty statement node")
@@ -343,7 +399,7 @@ class ASTBuilder:
 		first_child = node.children[0]
 		if node.children:
 			if first_child.label == "KEYWORD" and first_child.token:
-				kw = first_child.token.value.lower()
+				kw = first_child.token.keyword
 				match kw:
 					case "mulai":
 						return self._build_compound_statement(node)
@@ -371,11 +427,12 @@ class ASTBuilder:
 		"""
 		stmts: list[Statement] = []
 		for child in node.children:
-			if child.label in ["KEYWORD", "SEMICOLON"]:
+			# <error>: tokens skipped by the parser's error recovery
+			if child.label in ["KEYWORD", "SEMICOLON", "<error>"]:
 				continue	
-			stmts.append(self._build_statement(child))
+			stmts.append((yield self._build_statement(child)))
 			
-		return CompoundStmt(statements=stmts, token=node.children[0].token)
+		return CompoundStmt(statements=stmts, token_index=self._index(node.children[0]))
 
 	def _build_assign_statement(self, node: Node) -> AssignStmt:
 		"""Build an AssignStmt from <assignment-statement> node.
@@ -387,33 +444,34 @@ class ASTBuilder:
 			raise NotImplementedError("Malformed assignment node")
 		
 		target_token = node.children[0].token
+		target_index = self._index(node.children[0])
 		i = 1
 		
 		index_expr = None
 		if i < len(node.children) and node.children[i].label == "LBRACKET":
 			i += 1
 			if i < len(node.children) and node.children[i].label == "<expression>":
-				index_expr = self._build_expression(node.children[i])
+				index_expr = yield self._build_expression(node.children[i])
 				i += 1
 			if i < len(node.children) and node.children[i].label == "RBRACKET":
 				i += 1
 		
 		if index_expr is not None:
-			array_var = VarRef(name=target_token.value, token=target_token)
-			target = ArrayAccess(array=array_var, index=index_expr, token=target_token)
+			array_var = VarRef(name=target_token.value, token_index=target_index)
+			target = ArrayAccess(array=array_var, index=index_expr, token_index=target_index)
 		else:
-			target = VarRef(name=target_token.value, token=target_token)
+			target = VarRef(name=target_token.value, token_index=target_index)
 		
 		if i < len(node.children) and node.children[i].label == "ASSIGN_OPERATOR":
-			assign_token = node.children[i].token
+			assign_index = self._index(node.children[i])
 			i += 1
 		else:
-			assign_token = None
+			assign_index = -1
 		
 		expr_node = node.children[i] if i < len(node.children) else None
-		value_expr = self._build_expression(expr_node) if expr_node else None
+		value_expr = (yield self._build_expression(expr_node)) if expr_node else None
 		
-		return AssignStmt(target=target, value=value_expr, token=assign_token)
+		return AssignStmt(target=target, value=value_expr, token_index=assign_index)
 
 	def _build_proc_call_stmt(self, node: Node) -> ProcCallStmt:
 		"""Build a ProcCallStmt from <procedure-function-call> node.
@@ -430,9 +488,9 @@ class ASTBuilder:
 			param_list_node = node.children[2]
 			for child in param_list_node.children:
 				if child.label == "<expression>":
-					args.append(self._build_expression(child))
+					args.append((yield self._build_expression(child)))
 					
-		return ProcCallStmt(name=name, args=args, token=ident_token)
+		return ProcCallStmt(name=name, args=args, token_index=self._index(node.children[0]))
 
 	def _build_if_statement(self, node: Node) -> IfStmt:
 		"""Build an IfStmt from <if-statement> node.
@@ -440,14 +498,14 @@ class ASTBuilder:
 		Structure:
 		  KEYWORD(jika) <expression> KEYWORD(maka) <statement> [KEYWORD(selain_itu) <statement>]
   		"""
-		if_token = node.children[0].token
-		condition = self._build_expression(node.children[1])
-		then_branch = self._build_statement(node.children[3])
+		condition = yield self._build_expression(node.children[1])
+		then_branch = yield self._build_statement(node.children[3])
 		else_branch = None
 		if len(node.children) > 4:
-			else_branch = self._build_statement(node.children[5])
+			else_branch = yield self._build_statement(node.children[5])
 			
-		return IfStmt(condition=condition, then_branch=then_branch, else_branch=else_branch, token=if_token)
+		return IfStmt(condition=condition, then_branch=then_branch, else_branch=else_branch,
+			token_index=self._index(node.children[0]))
 
 	def _build_for_statement(self, node: Node) -> ForStmt:
 		"""Build a ForStmt from <for-statement> node.
@@ -459,19 +517,19 @@ class ASTBuilder:
 			raise NotImplementedError("Malformed for-statement node")
 		if node.children[0].token is None or node.children[1].token is None:
 			raise NotImplementedError("For-statement missing tokens")
-		for_token = node.children[0].token
 		var_token = node.children[1].token
-		var_ref = VarRef(name=var_token.value, token=var_token)
-		start_expr = self._build_expression(node.children[3])
+		var_ref = VarRef(name=var_token.value, token_index=self._index(node.children[1]))
+		start_expr = yield self._build_expression(node.children[3])
 		dir_node = node.children[4]
 		direction = ForDirection.TO
-		if dir_node.token and dir_node.token.value == "turun_ke":
+		if dir_node.token and dir_node.token.keyword == "turun_ke":
 			direction = ForDirection.DOWNTO
 			
-		end_expr = self._build_expression(node.children[5])
-		body = self._build_statement(node.children[7])
+		end_expr = yield self._build_expression(node.children[5])
+		body = yield self._build_statement(node.children[7])
 		
-		return ForStmt(var=var_ref, start=start_expr, end=end_expr, direction=direction, body=body, token=for_token)
+		return ForStmt(var=var_ref, start=start_expr, end=end_expr, direction=direction, body=body,
+			token_index=self._index(node.children[0]))
 
 	def _build_while_statement(self, node: Node) -> WhileStmt:
 		"""Build a WhileStmt from <while-statement> node.
@@ -479,11 +537,10 @@ class ASTBuilder:
 		Structure: 
 		  KEYWORD(selama) <expression> KEYWORD(lakukan) <statement>
 		"""
-		while_token = node.children[0].token
-		condition = self._build_expression(node.children[1])
-		body = self._build_statement(node.children[3])
+		condition = yield self._build_expression(node.children[1])
+		body = yield self._build_statement(node.children[3])
 		
-		return WhileStmt(condition=condition, body=body, token=while_token)
+		return WhileStmt(condition=condition, body=body, token_index=self._index(node.children[0]))
   
 
 	def _build_expression(self, node: Node) -> Expression:
@@ -495,25 +552,33 @@ class ASTBuilder:
 		if not children or children[0].label != "<simple-expression>":
 			raise NotImplementedError("expression without simple-expression")
 		
-		left = self._build_simple_expression(children[0])
-		
 		if len(children) >= 3 and children[1].label == "<relational-operator>":
-			op_node = children[1]
-			if op_node.children and op_node.children[0].token:
-				op = op_node.children[0].token.value
-			else:
-				op = "="
-			
-			right = self._build_simple_expression(children[2])
-			return BinOp(op=op, left=left, right=right, token=node.token)
-		
-		return left
+			return self._build_relational_expression(children, self._operator_index(children[1]))
+		# Without a relational operator the expression is its simple-expression
+		return self._build_simple_expression(children[0])
+
+	def _build_relational_expression(self, children: list[Node], token_index: int) -> BinOp:
+		left = yield self._build_simple_expression(children[0])
+		op_node = children[1]
+		if op_node.children and op_node.children[0].token:
+			op = op_node.children[0].token.value
+		else:
+			op = "="
+
+		right = yield self._build_simple_expression(children[2])
+		return BinOp(op=op, left=left, right=right, token_index=token_index)
 
 	def _build_simple_expression(self, node: Node) -> Expression:
 		"""
 		simple-expression -> [ SIGN ] <term> { <additive-operator> <term> }
 		"""
 		children = node.children
+		if len(children) == 1 and children[0].label == "<term>":
+			# No sign and no additive operator: the simple-expression is its term
+			return self._build_term(children[0])
+		return self._build_additive_expression(children)
+
+	def _build_additive_expression(self, children: list[Node]) -> Expression:
 		i = 0
 		
 		unary_sign = None
@@ -525,10 +590,10 @@ class ASTBuilder:
 		if i >= len(children) or children[i].label != "<term>":
 			raise NotImplementedError("simple-expression without term")
 		
-		left = self._build_term(children[i])
+		left = yield self._build_term(children[i])
 		
 		if unary_sign:
-			left = UnaryOp(op=unary_sign, operand=left, token=children[0].token)
+			left = UnaryOp(op=unary_sign, operand=left, token_index=self._index(children[0]))
 		
 		i += 1
 		
@@ -547,8 +612,8 @@ class ASTBuilder:
 			if i >= len(children) or children[i].label != "<term>":
 				break
 			
-			right = self._build_term(children[i])
-			left = BinOp(op=op, left=left, right=right, token=op_node.token)
+			right = yield self._build_term(children[i])
+			left = BinOp(op=op, left=left, right=right, token_index=self._operator_index(op_node))
 			i += 1
 		
 		return left
@@ -559,8 +624,16 @@ class ASTBuilder:
 		if not children:
 			raise NotImplementedError("empty term")
 
-		if children[0].label == "<factor>":
-			left = self._build_factor(children[0])
+		if len(children) == 1 and children[0].label in ("<factor>", "<procedure-function-call>"):
+			# No multiplicative operator: the term is its factor
+			return self._build_factor(children[0])
+		return self._build_multiplicative_term(children)
+
+	def _build_multiplicative_term(self, children: list[Node]) -> Expression:
+
+		# a function call factor is emitted by the parser without a <factor> wrapper
+		if children[0].label in ("<factor>", "<procedure-function-call>"):
+			left = yield self._build_factor(children[0])
 			i = 1
 
 			while i < len(children):
@@ -569,8 +642,8 @@ class ASTBuilder:
 				op_node = children[i]
 				op = op_node.children[0].token.value if op_node.children else "*"
 				i += 1
-				right = self._build_factor(children[i])
-				left = BinOp(op=op, left=left, right=right, token=op_node.token)
+				right = yield self._build_factor(children[i])
+				left = BinOp(op=op, left=left, right=right, token_index=self._operator_index(op_node))
 				i += 1
 			return left
 
@@ -581,11 +654,11 @@ class ASTBuilder:
 			# treat whole <term> as a factor
 			fake_factor = Node("<factor>")
 			fake_factor.children = [first]
-			return self._build_factor(fake_factor)
+			return (yield self._build_factor(fake_factor))
 
 		for c in children:
 			if c.label == "<factor>":
-				return self._build_factor(c)
+				return (yield self._build_factor(c))
 
 		raise NotImplementedError("term without factor (parser shape not matched)")
 
@@ -607,24 +680,24 @@ class ASTBuilder:
 		first_child = children[0]
 		
 		if first_child.label == "NUMBER" and first_child.token:
-			return NumberLiteral(value=first_child.token.value, token=first_child.token)
+			tok = first_child.token
+			return NumberLiteral(value=tok.value, evaluated_value=tok.number, token_index=self._index(first_child))
 		
 		if first_child.label == "STRING_LITERAL" and first_child.token:
-			return StringLiteral(value=first_child.token.value, token=first_child.token)
+			return StringLiteral(value=first_child.token.value, token_index=self._index(first_child))
 		
 		if first_child.label == "CHAR_LITERAL" and first_child.token:
-			return CharLiteral(value=first_child.token.value, token=first_child.token)
+			return CharLiteral(value=first_child.token.value, token_index=self._index(first_child))
 		
 		if first_child.label == "BOOLEAN_LITERAL" and first_child.token:
-			val = first_child.token.value.lower() == "true"
-			return BooleanLiteral(value=val, token=first_child.token)
+			val = first_child.token.keyword == "true"
+			return BooleanLiteral(value=val, token_index=self._index(first_child))
 		
 		if first_child.label == "LOGICAL_OPERATOR" and first_child.token:
-			if first_child.token.value.lower() == "tidak":
-				if len(children) < 2 or children[1].label != "<factor>":
+			if first_child.token.keyword == "tidak":
+				if len(children) < 2 or children[1].label not in ("<factor>", "<procedure-function-call>"):
 					raise NotImplementedError("'tidak' without factor")
-				operand = self._build_factor(children[1])
-				return UnaryOp(op="tidak", operand=operand, token=first_child.token)
+				return self._build_not_factor(children[1], self._index(first_child))
 		
 		if first_child.label == "LPARENTHESIS":
 			expr_node = next((c for c in children if c.label == "<expression>"), None)
@@ -639,40 +712,49 @@ class ASTBuilder:
 			if len(children) >= 3 and children[1].label == "LPARENTHESIS":
 				return self._build_call_expr(node)
 			elif len(children) >= 4 and children[1].label == "LBRACKET":
-				# Array access: IDENTIFIER '[' <expression> ']'
-				array_var = VarRef(name=first_child.token.value, token=first_child.token)
-				index_expr = None
-				for child in children:
-					if child.label == "<expression>":
-						index_expr = self._build_expression(child)
-						break
-				return ArrayAccess(array=array_var, index=index_expr, token=first_child.token)
-			return VarRef(name=first_child.token.value, token=first_child.token)
+				return self._build_array_access(children)
+			return VarRef(name=first_child.token.value, token_index=self._index(first_child))
 		
 		raise NotImplementedError(f"unhandled factor type: {first_child.label}")
 
+	def _build_not_factor(self, operand_node: Node, not_index: int) -> UnaryOp:
+		operand = yield self._build_factor(operand_node)
+		return UnaryOp(op="tidak", operand=operand, token_index=not_index)
+
+	def _build_array_access(self, children: list[Node]) -> ArrayAccess:
+		# Array access: IDENTIFIER '[' <expression> ']'
+		ident_token = children[0].token
+		ident_index = self._index(children[0])
+		array_var = VarRef(name=ident_token.value, token_index=ident_index)
+		index_expr = None
+		for child in children:
+			if child.label == "<expression>":
+				index_expr = yield self._build_expression(child)
+				break
+		return ArrayAccess(array=array_var, index=index_expr, token_index=ident_index)
+
 	def _build_call_expr(self, node: Node) -> CallExpr:
 		"""
 		Build CallExpr from <procedure-function-call>
 		"""
 		name = ""
 		args: list[Expression] = []
-		ident_token = None
+		ident_index = -1
 		
 		for child in node.children:
 			if child.label == "IDENTIFIER" and child.token:
 				name = child.token.value
-				ident_token = child.token
+				ident_index = self._index(child)
 			elif child.label == "<parameter-list>":
 				for param_child in child.children:
 					if param_child.label == "<expression>":
 						try:
-							arg_expr = self._build_expression(param_child)
+							arg_expr = yield self._build_expression(param_child)
 							args.append(arg_expr)
 						except NotImplementedError:
 							pass
 		
-		return CallExpr(name=name, args=args, token=ident_token)
+		return CallExpr(name=name, args=args, token_index=ident_index)
 
 	def _collect_identifier_list(self, node: Node) -> List[str]:
 		"""
@@ -1,21 +1,22 @@
 from src.semantic.ast import *
 from src.semantic.symbol_table import SymbolTables, TypeKind, ObjectKind
+from src.semantic.traversal import ASTVisitor
 from src.common.errors import SemanticError
+from src.common.trampoline import drive
 
-class SemanticAnalyzer:
+class SemanticAnalyzer(ASTVisitor):
     def __init__(self):
         self.symtab = SymbolTables()
+        # tipe / symbol / level hasil analisis per node AST (node-nya sendiri tidak diubah)
+        self.annotations = ASTAnnotations()
         self._program_visited = False
 
     # ================== VISITOR DISPATCH ==================
-    def visit(self, node):
-        method = "visit_" + node.__class__.__name__
-        fn = getattr(self, method, self.generic_visit)
-        return fn(node)
-
-    # ================== GENERIC VISIT ==================
-    def generic_visit(self, node):
-        return
+    # visit / _visit / generic_visit diwarisi dari ASTVisitor (dispatch per kelas node
+    # di-cache). visit_* untuk node yang punya anak berupa statement / ekspresi / block
+    # ditulis sebagai generator: anak dikunjungi lewat `yield self._visit(anak)` dan
+    # hasilnya diterima dari yield, lalu drive() menjalankannya dengan stack eksplisit
+    # supaya program yang nesting-nya sangat dalam tidak kena recursion limit.
 
     # ================== PROGRAM ==================
     def visit_Program(self, node: Program):
@@ -23,32 +24,32 @@ class SemanticAnalyzer:
             return
         self._program_visited = True
 
-        node.scope_level = self.symtab.level
+        self.annotations.scope_level[id(node)] = self.symtab.level
 
-        self.visit(node.block)
+        yield self._visit(node.block)
 
 
     # ================== BLOCK ==================
     def visit_Block(self, node: Block):
         # Constants
         for c in node.const_decls:
-            self.visit(c)
+            yield self._visit(c)
 
         # Types
         for t in node.type_decls:
-            self.visit(t)
+            yield self._visit(t)
 
         # Variables
         for v in node.var_decls:
-            self.visit(v)
+            yield self._visit(v)
 
         # Subprograms
         for s in node.subprogram_decls:
-            self.visit(s)
+            yield self._visit(s)
 
         # Body
         if node.body:
-            self.visit(node.body)
+            yield self._visit(node.body)
 
     # ================== DECLARATIONS ==================
     def visit_VarDecl(self, node: VarDecl):
@@ -77,7 +78,7 @@ class SemanticAnalyzer:
             entry.adr = self.symtab.dx
             
             if isinstance(node.type_expr, ArrayType):
-                aref = self._build_array_type(node.type_expr)
+                aref = drive(self._build_array_type(node.type_expr))
                 entry.typ = TypeKind.ARRAYS
                 entry.ref = aref
                 self.symtab.dx += self.symtab.get_variable_size(TypeKind.ARRAYS, aref)
@@ -85,8 +86,8 @@ class SemanticAnalyzer:
                 entry.typ = var_type
                 self.symtab.dx += self.symtab.get_variable_size(var_type)
             
-            node.symbol = idx
-            node.scope_level = self.symtab.level
+            self.annotations.symbol[id(node)] = idx
+            self.annotations.scope_level[id(node)] = self.symtab.level
 
 
     def visit_ConstDecl(self, node: ConstDecl):
@@ -97,7 +98,7 @@ class SemanticAnalyzer:
             const_type = self.visit(node.value)    
             if hasattr(node.value, "value"):
                 const_value = node.value.value     
-            node.value.type = const_type
+            self.annotations.type[id(node.value)] = const_type
 
         idx = self.symtab.insert(
             node.name,
@@ -109,8 +110,8 @@ class SemanticAnalyzer:
         entry = self.symtab.tab[idx]
         entry.typ = const_type if const_type is not None else TypeKind.NOTYP
 
-        node.symbol = idx
-        node.scope_level = self.symtab.level
+        self.annotations.symbol[id(node)] = idx
+        self.annotations.scope_level[id(node)] = self.symtab.level
 
 
     def visit_TypeDecl(self, node: TypeDecl):
@@ -133,23 +134,23 @@ class SemanticAnalyzer:
             entry.ref = self.symtab.lookup(node.type_expr.name)
 
         elif isinstance(node.type_expr, ArrayType):
-            aref = self._build_array_type(node.type_expr)
+            aref = drive(self._build_array_type(node.type_expr))
             entry.typ = TypeKind.ARRAYS
             entry.ref = aref
 
-        node.symbol = idx
+        self.annotations.symbol[id(node)] = idx
 
     # ================== PROCEDURE ==================
     def visit_ProcedureDecl(self, node: ProcedureDecl):
         # Insert procedure ke current scope
         proc_idx = self.symtab.insert(node.name, "procedure", 0)
-        node.symbol = proc_idx
+        self.annotations.symbol[id(node)] = proc_idx
         proc_entry = self.symtab.tab[proc_idx]
 
         # Masuk block prosedur
         block_idx = self.symtab.begin_block()
         proc_entry.ref = block_idx  # Store block reference for parameter lookup
-        node.scope_level = self.symtab.level
+        self.annotations.scope_level[id(node)] = self.symtab.level
 
         # Visit parameter
         for p in node.params:
@@ -158,7 +159,7 @@ class SemanticAnalyzer:
 
         # Visit isi block
         if node.block:
-            self.visit(node.block)
+            yield self._visit(node.block)
 
         # Tutup block prosedur
         self.symtab.end_block()
@@ -172,8 +173,8 @@ class SemanticAnalyzer:
         
         entry.typ = TypeKind.NOTYP   
         entry.nrm = True
-        node.symbol = idx
-        node.scope_level = self.symtab.level
+        self.annotations.symbol[id(node)] = idx
+        self.annotations.scope_level[id(node)] = self.symtab.level
 
         if isinstance(node.type_expr, PrimitiveType):
             nm = node.type_expr.name.lower()
@@ -192,7 +193,7 @@ class SemanticAnalyzer:
     def visit_FunctionDecl(self, node: FunctionDecl):
         func_idx = self.symtab.insert(node.name, "function", 0)
         func_entry = self.symtab.tab[func_idx]
-        node.symbol = func_idx
+        self.annotations.symbol[id(node)] = func_idx
 
         ret_type: TypeKind = TypeKind.NOTYP
         if isinstance(node.return_type, PrimitiveType):
@@ -209,7 +210,7 @@ class SemanticAnalyzer:
         func_entry.typ = ret_type
 
         self.symtab.begin_block()
-        node.scope_level = self.symtab.level
+        self.annotations.scope_level[id(node)] = self.symtab.level
 
         implicit_idx = self.symtab.insert(node.name, "variable", 0)
         implicit_entry = self.symtab.tab[implicit_idx]
@@ -223,7 +224,7 @@ class SemanticAnalyzer:
         self.symtab.mark_parameter_section_end()
 
         if node.block:
-            self.visit(node.block)
+            yield self._visit(node.block)
 
         self.symtab.end_block()
 
@@ -284,7 +285,7 @@ class SemanticAnalyzer:
             elem_t = self._type_from_primitive(arr.element_type)
             elem_size = self.symtab.get_elem_size(elem_t)
         elif isinstance(arr.element_type, ArrayType):
-            elem_ref = self._build_array_type(arr.element_type)
+            elem_ref = yield self._build_array_type(arr.element_type)
             elem_t = TypeKind.ARRAYS
             elem_size = self.symtab.get_elem_size(elem_t, elem_ref)
         elif isinstance(arr.element_type, NamedType):
@@ -301,11 +302,11 @@ class SemanticAnalyzer:
     # ================== STATEMENTS ==================
     def visit_CompoundStmt(self, node: CompoundStmt):
         for stmt in node.statements:
-            self.visit(stmt)
+            yield self._visit(stmt)
 
     def visit_AssignStmt(self, node: AssignStmt):
         if isinstance(node.target, ArrayAccess):
-            return self._visit_array_assign(node)
+            return (yield self._visit_array_assign(node))
         
         var_name = node.target.name
         var_idx = self.symtab.lookup(var_name)
@@ -320,7 +321,7 @@ class SemanticAnalyzer:
                 f"Cannot assign to '{var_name}' because it is a {var_entry.obj}.",
             )
 
-        expr_type = self.visit(node.value)
+        expr_type = yield self._visit(node.value)
         
         if expr_type and var_entry.typ != expr_type:
            raise SemanticError(f"Type mismatch in assignment. Cannot assign {expr_type} to variable '{var_name}' of type {var_entry.typ}.")
@@ -338,7 +339,7 @@ class SemanticAnalyzer:
         if arr_entry.typ != TypeKind.ARRAYS:
             raise SemanticError(f"Variable '{array_name}' is not an array.")
         
-        index_type = self.visit(array_access.index)
+        index_type = yield self._visit(array_access.index)
         if index_type is not None and index_type != TypeKind.INTS:
             raise SemanticError(f"Array index must be of integer type, got {index_type}.")
         
@@ -348,27 +349,27 @@ class SemanticAnalyzer:
         
         elem_type = self.symtab.atab[aref].etyp
         
-        expr_type = self.visit(node.value)
+        expr_type = yield self._visit(node.value)
         if expr_type and elem_type != expr_type:
             raise SemanticError(
                 f"Type mismatch in array assignment. Cannot assign {expr_type} to array element of type {elem_type}."
             )
 
     def visit_IfStmt(self, node: IfStmt):
-        condition_type = self.visit(node.condition)
+        condition_type = yield self._visit(node.condition)
         if condition_type is not None and condition_type != TypeKind.BOOLS:
             raise SemanticError("If condition must be of boolean expression.")
             
-        self.visit(node.then_branch)
+        yield self._visit(node.then_branch)
         if node.else_branch:
-            self.visit(node.else_branch)
+            yield self._visit(node.else_branch)
 
     def visit_WhileStmt(self, node: WhileStmt):
-        condition_type = self.visit(node.condition)
+        condition_type = yield self._visit(node.condition)
         if condition_type is not None and condition_type != TypeKind.BOOLS:
             raise SemanticError("While condition must be of boolean expression.")
         
-        self.visit(node.body)
+        yield self._visit(node.body)
 
     def visit_ForStmt(self, node: ForStmt):
         var_name = node.var.name
@@ -381,8 +382,8 @@ class SemanticAnalyzer:
         if var_entry.typ != TypeKind.INTS:
             raise SemanticError(f"For loop variable '{var_name}' must be of type integer.")
         
-        start_type = self.visit(node.start)
-        end_type = self.visit(node.end)
+        start_type = yield self._visit(node.start)
+        end_type = yield self._visit(node.end)
 		
 		# Start dan End harus Integer
         if start_type is not None and start_type != TypeKind.INTS:
@@ -391,7 +392,7 @@ class SemanticAnalyzer:
         if end_type is not None and end_type != TypeKind.INTS:
             raise SemanticError("For loop end expression must be Integer.")
 			
-        self.visit(node.body)
+        yield self._visit(node.body)
 
     def visit_ProcCallStmt(self, node: ProcCallStmt):
         proc_name = node.name
@@ -407,7 +408,7 @@ class SemanticAnalyzer:
         
         arg_types = []
         for arg in node.args:
-            arg_type = self.visit(arg)
+            arg_type = yield self._visit(arg)
             arg_types.append(arg_type)
         
         if proc_entry.ref == 0 and proc_entry.adr in (1, 2, 3, 4):
@@ -455,10 +456,10 @@ class SemanticAnalyzer:
     # =============== EXPRESSIONS ===============
     def visit_BinOp(self, node: BinOp):
         if node.left:
-           left_type = self.visit(node.left)
+           left_type = yield self._visit(node.left)
         
         if node.right:
-            right_type = self.visit(node.right)
+            right_type = yield self._visit(node.right)
         
         op = node.op
         
@@ -469,19 +470,19 @@ class SemanticAnalyzer:
                 raise SemanticError(f"Operator '{op}' memerlukan operand numerik")
             
             result = TypeKind.REALS if is_real_op else TypeKind.INTS
-            node.type = result
+            self.annotations.type[id(node)] = result
             return result
             
         elif op in ['bagi', 'mod']:
             if left_type != TypeKind.INTS or right_type != TypeKind.INTS:
                 raise SemanticError(f"Operator '{op}' hanya berlaku untuk Integer")
-            node.type = TypeKind.INTS
+            self.annotations.type[id(node)] = TypeKind.INTS
             return TypeKind.INTS
         
         elif op in ['dan', 'atau'] :
             if left_type != TypeKind.BOOLS or right_type != TypeKind.BOOLS:
                 raise SemanticError(f"Operator '{op}' memerlukan operand Boolean")
-            node.type = TypeKind.BOOLS
+            self.annotations.type[id(node)] = TypeKind.BOOLS
             return TypeKind.BOOLS
         
         elif op in ['=', '<', '>', '<=', '>=', '<>', '!='] :
@@ -490,13 +491,13 @@ class SemanticAnalyzer:
                     pass
                 else:
                     raise SemanticError(f"Tipe operand tidak cocok untuk perbandingan '{op}'")
-            node.type = TypeKind.BOOLS
+            self.annotations.type[id(node)] = TypeKind.BOOLS
             return TypeKind.BOOLS
         
         
     def visit_UnaryOp(self, node: UnaryOp):
         if node.operand:
-            operand_type = self.visit(node.operand)
+            operand_type = yield self._visit(node.operand)
         op = node.op
         
         if op == 'tidak':
@@ -514,7 +515,7 @@ class SemanticAnalyzer:
         entry = self.symtab.lookup(node.name)
         if entry:
             for arg in node.args:
-                self.visit(arg)
+                yield self._visit(arg)
         
     def visit_VarRef(self, node: VarRef):
         idx = self.symtab.lookup(node.name)
@@ -523,9 +524,9 @@ class SemanticAnalyzer:
 
         entry = self.symtab.tab[idx]
 
-        node.symbol = idx
-        node.scope_level = entry.lev
-        node.type = entry.typ
+        self.annotations.symbol[id(node)] = idx
+        self.annotations.scope_level[id(node)] = entry.lev
+        self.annotations.type[id(node)] = entry.typ
 
         return entry.typ
     
@@ -541,7 +542,7 @@ class SemanticAnalyzer:
         if arr_entry.typ != TypeKind.ARRAYS:
             raise SemanticError(f"Variable '{array_name}' is not an array.")
         
-        index_type = self.visit(node.index)
+        index_type = yield self._visit(node.index)
         if index_type is not None and index_type != TypeKind.INTS:
             raise SemanticError(f"Array index must be of integer type, got {index_type}.")
         
@@ -550,30 +551,30 @@ class SemanticAnalyzer:
             raise SemanticError(f"Invalid array reference for '{array_name}'.")
         
         elem_type = self.symtab.atab[aref].etyp
-        node.type = elem_type
+        self.annotations.type[id(node)] = elem_type
         return elem_type
 
     # =============== LITERALS ===============
     def visit_NumberLiteral(self, node: NumberLiteral):
-        node.is_constant = True
-        if '.' in node.value:
-            node.type = TypeKind.REALS
+        self.annotations.constant.add(id(node))
+        if node.is_real:
+            self.annotations.type[id(node)] = TypeKind.REALS
             return TypeKind.REALS
         else:
-            node.type = TypeKind.INTS
+            self.annotations.type[id(node)] = TypeKind.INTS
             return TypeKind.INTS
 
     def visit_StringLiteral(self, node: StringLiteral):
-        node.is_constant = True
-        node.type = TypeKind.STRINGS
+        self.annotations.constant.add(id(node))
+        self.annotations.type[id(node)] = TypeKind.STRINGS
         return TypeKind.STRINGS
 
     def visit_CharLiteral(self, node: CharLiteral):
-        node.is_constant = True
-        node.type = TypeKind.CHARS
+        self.annotations.constant.add(id(node))
+        self.annotations.type[id(node)] = TypeKind.CHARS
         return TypeKind.CHARS
 
     def visit_BooleanLiteral(self, node: BooleanLiteral):
-        node.is_constant = True
-        node.type = TypeKind.BOOLS
+        self.annotations.constant.add(id(node))
+        self.annotations.type[id(node)] = TypeKind.BOOLS
         return TypeKind.BOOLS
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from dataclasses import fields
+from types import UnionType
+from typing import Iterator, Union, get_args, get_origin, get_type_hints
+
+from src.common.trampoline import drive
+from src.semantic.ast import ASTNode
+
+# node class -> ((field name, holds a list of nodes), ...) for the fields that hold child nodes
+_SCHEMAS: dict[type, tuple[tuple[str, bool], ...]] = {}
+
+
+def _is_node_hint(hint) -> bool:
+	"""Whether a field annotation admits an AST node (ASTNode subclass, possibly in a union)."""
+	options = get_args(hint) if get_origin(hint) in (Union, UnionType) else (hint,)
+	return any(isinstance(option, type) and issubclass(option, ASTNode) for option in options)
+
+
+def child_fields(cls: type) -> tuple[tuple[str, bool], ...]:
+	"""Child-field schema of an AST node class.
+
+	Computed once per class from its dataclass field annotations: a field holds
+	a child if its type admits an ASTNode, or a list of children if it is a
+	list of such a type. Fields keep their declaration order, which is the
+	order children are visited and printed in.
+
+	Returns:
+		tuple of (field name, is_list) pairs.
+	"""
+	schema = _SCHEMAS.get(cls)
+	if schema is None:
+		hints = get_type_hints(cls)
+		entries = []
+		for field in fields(cls):
+			hint = hints[field.name]
+			if get_origin(hint) is list:
+				if _is_node_hint(get_args(hint)[0]):
+					entries.append((field.name, True))
+			elif _is_node_hint(hint):
+				entries.append((field.name, False))
+		schema = _SCHEMAS[cls] = tuple(entries)
+	return schema
+
+
+def children(node: ASTNode) -> list[ASTNode]:
+	"""Direct children of `node`, in field order (None fields skipped)."""
+	result = []
+	for name, is_list in child_fields(node.__class__):
+		value = getattr(node, name)
+		if is_list:
+			result.extend(value)
+		elif value is not None:
+			result.append(value)
+	return result
+
+
+def walk_preorder(node: ASTNode) -> Iterator[ASTNode]:
+	"""Yield `node` and all its descendants, each parent before its children.
+
+	Iterative, so the depth of the AST is not bounded by the recursion limit.
+	"""
+	stack = [node]
+	while stack:
+		node = stack.pop()
+		yield node
+		stack.extend(reversed(children(node)))
+
+
+def walk_postorder(node: ASTNode) -> Iterator[ASTNode]:
+	"""Yield all descendants of `node` and then `node`, each child before its parent."""
+	stack = [(node, False)]
+	while stack:
+		node, expanded = stack.pop()
+		if expanded:
+			yield node
+			continue
+		stack.append((node, True))
+		stack.extend((child, False) for child in reversed(children(node)))
+
+
+class ASTVisitor:
+	"""Base class for passes over the AST.
+
+	visit(node) calls the visit_<ClassName> method for the node's class, or
+	for its nearest base class that has one, else generic_visit. The handler
+	is looked up once per (visitor class, node class) and cached, so dispatch
+	costs one dict lookup per node.
+
+	Handlers may be generators run by drive(): to visit a child they
+	`yield self._visit(child)` and receive its result, so AST depth is not
+	bounded by the recursion limit. Handlers that do not need child results
+	can be plain methods.
+	"""
+	_handlers: dict[type, object] = {}
+
+	def __init_subclass__(cls, **kwargs):
+		super().__init_subclass__(**kwargs)
+		cls._handlers = {}
+
+	def visit(self, node: ASTNode):
+		return drive(self._visit(node))
+
+	def _visit(self, node: ASTNode):
+		try:
+			handler = self._handlers[node.__class__]
+		except KeyError:
+			handler = self._resolve(node.__class__)
+		return handler(self, node)
+
+	@classmethod
+	def _resolve(cls, node_cls: type):
+		for klass in node_cls.__mro__:
+			handler = getattr(cls, "visit_" + klass.__name__, None)
+			if handler is not None:
+				break
+		else:
+			handler = cls.generic_visit
+		cls._handlers[node_cls] = handler
+		return handler
+
+	def generic_visit(self, node: ASTNode):
+		return None
+
+
+class ASTTransformer(ASTVisitor):
+	"""Visitor that rebuilds the AST in place from its handlers' results.
+
+	Every handler returns the node that replaces the visited one: the node
+	itself, a new node, or None to remove it (from a list field; a single
+	field becomes None). generic_visit transforms the children of a node and
+	returns the node, so handlers usually call `yield self.generic_visit(node)`
+	first and then inspect the transformed node.
+	"""
+
+	def generic_visit(self, node: ASTNode):
+		for name, is_list in child_fields(node.__class__):
+			value = getattr(node, name)
+			if is_list:
+				replaced = []
+				for child in value:
+					child = yield self._visit(child)
+					if child is not None:
+						replaced.append(child)
+				value[:] = replaced
+			elif value is not None:
+				setattr(node, name, (yield self._visit(value)))
+		return node
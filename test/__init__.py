@@ -0,0 +1,11 @@
+"""
+Uji diferensial compiler: setiap modul test_*.py membandingkan satu komponen
+alternatif dengan implementasi acuannya pada file input test/milestone-*/ dan
+variasi hasil edit acak (seed tetap, jadi hasilnya selalu sama).
+
+Penggunaan (dari root repo):
+    python -m unittest              # semua
+    python -m unittest test.test_ll1_parser
+
+Exit code bukan 0 jika ada hasil yang berbeda. Pengukuran waktunya ada di bench/.
+"""
@@ -0,0 +1,117 @@
+"""Data dan helper bersama untuk uji diferensial di test/."""
+import glob
+import logging
+import os
+import random
+import unittest
+
+from src.common.utils import read_source_code
+from src.lexer.dfa_cache import load_compiled_dfa
+
+# File input golden test, dipakai sebagai program awal yang diedit acak
+INPUTS = sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "milestone-*", "input", "*.pas")))
+
+# Seed edit acak: tetap, supaya kegagalan selalu bisa diulang
+SEED = 0
+
+# Jumlah edit acak per file
+EDITS = 100
+
+# Potongan teks yang sering mengubah batas token: kutip, komentar, angka, newline.
+FRAGMENTS = ["'", "''", "{", "}", "(*", "*)", "(", "*", ")", "\n", "\r\n", "\r", " ", "x", "1",
+             "1.5e3", ".", "..", ":=", "mulai", "selesai", ";", "_", "é"]
+
+# Selain potongan FRAGMENTS: potongan yang mengubah batas unit / deklarasi.
+UNIT_FRAGMENTS = ["prosedur p;\n", "fungsi f: integer;\n", "variabel v: integer;\n",
+                  "mulai selesai;\n", "jika", "maka", "selain_itu", ","]
+
+
+def tree_snapshot(tree, errors: list[str]) -> tuple:
+    """(depth, label, token) setiap node parse tree secara preorder, dan daftar syntax error."""
+    nodes = []
+    stack = [(tree, 0)]
+    while stack:
+        node, depth = stack.pop()
+        tok = node.token
+        nodes.append((depth, node.label, None if tok is None else (tok.value, tok.line, tok.column)))
+        stack.extend((child, depth + 1) for child in reversed(node.children))
+    return nodes, list(errors)
+
+
+def random_text_edit(rnd: random.Random, source: str) -> tuple[int, int, str]:
+    """Edit acak (offset, jumlah karakter dihapus, teks disisipkan) dari potongan FRAGMENTS."""
+    offset = rnd.randint(0, len(source))
+    removed = min(rnd.choice((0, 0, 1, 1, 2, 5, 20)), len(source) - offset)
+    inserted = "".join(rnd.choice(FRAGMENTS) for _ in range(rnd.choice((0, 1, 1, 2, 4))))
+    return offset, removed, inserted
+
+
+def random_unit_edit(rnd: random.Random, source: str) -> tuple[int, int, str]:
+    """Edit acak (offset, jumlah karakter dihapus, teks disisipkan) yang juga bisa mengubah batas unit."""
+    offset = rnd.randint(0, len(source))
+    removed = min(rnd.choice((0, 0, 1, 1, 2, 5, 20)), len(source) - offset)
+    pieces = (FRAGMENTS, FRAGMENTS, UNIT_FRAGMENTS)
+    inserted = "".join(rnd.choice(rnd.choice(pieces)) for _ in range(rnd.choice((0, 1, 1, 2))))
+    return offset, removed, inserted
+
+
+def on_original(run):
+    """
+    `make` untuk DifferentialTestCase.assert_edits_match bila tidak ada state
+    yang dibawa antar edit: setiap edit diterapkan pada source asli, lalu
+    run(teks hasil edit) mengembalikan (actual, expected).
+    """
+    def make(source: str):
+        def apply(offset: int, removed: int, inserted: str):
+            return (source, *run(source[:offset] + inserted + source[offset + removed:]))
+        return apply
+    return make
+
+
+class QuietTestCase(unittest.TestCase):
+    """
+    Dasar test: logging dimatikan selama test (lexer dan parser mencatat setiap
+    error lewat logging) dan DFA hasil kompilasi ada di `dfa`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        logging.disable(logging.ERROR)
+        cls.dfa = load_compiled_dfa()
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+        super().tearDownClass()
+
+
+class DifferentialTestCase(QuietTestCase):
+    """Dasar uji diferensial: dua hasil dibandingkan pada INPUTS dan edit acaknya."""
+
+    def assert_edits_match(self, make, edit_fn, snapshot, sources: list[tuple[str, str]] = (), edits: int = EDITS):
+        """
+        Membandingkan dua hasil pada setiap file INPUTS (ditambah `sources`,
+        pasangan (nama, source)) dan serangkaian edit acaknya.
+
+        Args:
+            make: make(source) -> apply; apply(offset, removed, inserted) menerapkan
+                satu edit dan mengembalikan (teks dasar edit berikutnya, actual, expected).
+                apply(0, 0, "") dipanggil dulu untuk source asli.
+            edit_fn: edit_fn(rnd, teks) -> (offset, removed, inserted), mis. random_text_edit.
+            snapshot: Ringkasan hasil yang dibandingkan; snapshot(actual) harus sama
+                dengan snapshot(expected).
+        """
+        rnd = random.Random(SEED)
+        named = [(path, read_source_code(path)) for path in INPUTS] + list(sources)
+        for name, source in named:
+            with self.subTest(name):
+                apply = make(source)
+                text, actual, expected = apply(0, 0, "")
+                self.assertEqual(snapshot(actual), snapshot(expected), "source asli")
+                for step in range(edits):
+                    offset, removed, inserted = edit_fn(rnd, text)
+                    before = text
+                    text, actual, expected = apply(offset, removed, inserted)
+                    self.assertEqual(snapshot(actual), snapshot(expected),
+                                     f"edit #{step}: offset={offset} removed={removed} "
+                                     f"inserted={inserted!r} pada {before!r}")
@@ -0,0 +1,11 @@
+program ExpressionError;
+variabel
+   a, b: integer;
+mulai
+   { Error: ')' hilang di dalam ekspresi }
+   a := (b + 1 * 2;
+   { Error: ':=' hilang di header for }
+   untuk a 1 ke 10 lakukan
+      b := b + a;
+   writeln(a, b)
+selesai.
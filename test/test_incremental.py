@@ -0,0 +1,32 @@
+"""
+Uji IncrementalParser: serangkaian edit acak diterapkan berturut-turut, dan
+setiap parse tree hasil edit() dibandingkan dengan parse penuh atas teks yang
+sama (label, token, line/column setiap node, dan daftar syntax error).
+"""
+import unittest
+
+from bench.corpus import program_source
+from src.lexer.lexer import Lexer
+from src.parser.incremental import IncrementalParser
+from src.parser.parser import Parser
+from test.common import DifferentialTestCase, random_unit_edit, tree_snapshot
+
+
+class IncrementalParserTest(DifferentialTestCase):
+    def test_edit_same_as_full_parse(self):
+        def make(source: str):
+            parser = IncrementalParser(Lexer(source, self.dfa))
+            parser.parse_program()
+
+            def apply(offset: int, removed: int, inserted: str):
+                tree = parser.edit(offset, removed, inserted)
+                full = Parser(Lexer(parser.lexer.source_code, self.dfa).tokenize())
+                return parser.lexer.source_code, (tree, parser.errors), (full.parse_program(), full.errors)
+            return apply
+
+        self.assert_edits_match(make, random_unit_edit, lambda result: tree_snapshot(*result),
+                                sources=[("<program 20 prosedur>", program_source(20))])
+
+
+if __name__ == "__main__":
+    unittest.main()
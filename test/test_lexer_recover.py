@@ -0,0 +1,72 @@
+"""
+Uji mode recover lexer (Lexer.tokenize_with_diagnostics): semua error
+leksikal dalam satu file dikumpulkan, lexing dilanjutkan dari titik sinkron
+setelah setiap error, dan waktunya tetap linear.
+"""
+import time
+import unittest
+
+from src.lexer.lexer import Lexer
+from test.common import QuietTestCase
+
+# Satu error per jenis: karakter tidak dikenal, string tidak ditutup, NUMBER bersufiks huruf
+SOURCE = """program p;
+mulai
+  a := 1 @ 2;
+  s := 'abc
+  b := 12abc + 3;
+selesai.
+"""
+
+
+def token_list(tokens) -> list[tuple]:
+    return [(t.token_type, t.value, t.line, t.column) for t in tokens]
+
+
+class LexerRecoverTest(QuietTestCase):
+    def test_collects_every_error(self):
+        tokens, errors = Lexer(SOURCE, self.dfa).tokenize_with_diagnostics()
+
+        self.assertEqual([(e.message, e.line, e.column) for e in errors], [
+            ("Invalid character '@'", 3, 10),
+            ("Unterminated string literal", 4, 8),
+            ("Invalid character 'a'", 5, 10),
+        ])
+        # Lexeme yang error tidak menghasilkan token: '@' dilewati satu karakter,
+        # string lanjut setelah newline-nya, dan 12abc dibuang utuh (termasuk
+        # NUMBER 12, disengaja: bukan bilangan yang valid) sampai akhir katanya.
+        self.assertEqual(token_list(tokens), [
+            ("KEYWORD", "program", 1, 1), ("IDENTIFIER", "p", 1, 9), ("SEMICOLON", ";", 1, 10),
+            ("KEYWORD", "mulai", 2, 1),
+            ("IDENTIFIER", "a", 3, 3), ("ASSIGN_OPERATOR", ":=", 3, 5), ("NUMBER", "1", 3, 8),
+            ("NUMBER", "2", 3, 12), ("SEMICOLON", ";", 3, 13),
+            ("IDENTIFIER", "s", 4, 3), ("ASSIGN_OPERATOR", ":=", 4, 5),
+            ("IDENTIFIER", "b", 5, 3), ("ASSIGN_OPERATOR", ":=", 5, 5),
+            ("ARITHMETIC_OPERATOR", "+", 5, 14), ("NUMBER", "3", 5, 16), ("SEMICOLON", ";", 5, 17),
+            ("KEYWORD", "selesai", 6, 1), ("DOT", ".", 6, 8),
+        ])
+
+    def test_without_recover_stops_at_fatal_error(self):
+        lexer = Lexer(SOURCE, self.dfa)
+        tokens = lexer.tokenize()
+        self.assertTrue(lexer.fatal_error)
+        self.assertEqual(token_list(tokens)[-1], ("ASSIGN_OPERATOR", ":=", 4, 5))
+        self.assertEqual(len(lexer.errors), 2)
+
+    def test_unclosed_comments_linear(self):
+        # setiap '(' memulai scan komentar yang tidak pernah ditutup; tanpa memo scan
+        # lexer mengulang scan sampai akhir source untuk setiap '(' (kuadratik).
+        # Pembanding: token yang sama dari '( *' yang tidak membuka komentar.
+        count = 5_000
+        times, results = [], []
+        for body in ("(* " * count, "( * " * count):
+            start = time.perf_counter()
+            tokens, errors = Lexer("program a; mulai " + body, self.dfa).tokenize_with_diagnostics()
+            times.append(time.perf_counter() - start)
+            results.append(([(t.token_type, t.value) for t in tokens], [str(e) for e in errors]))
+        self.assertEqual(results[0], results[1])
+        self.assertLess(times[0], 5 * times[1] + 0.05, f"'(*' {times[0]:.3f} s, '( *' {times[1]:.3f} s")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Uji LL1Parser terhadap Parser: untuk setiap file dan serangkaian variasinya
+(edit acak seperti test_incremental), keduanya harus sepakat apakah program
+valid, dan untuk program valid parse tree-nya harus sama (label, token,
+line/column setiap node).
+"""
+import unittest
+
+from bench.corpus import program_source
+from src.lexer.lexer import Lexer
+from src.parser.ll1_parser import LL1Parser
+from src.parser.parser import Parser
+from test.common import DifferentialTestCase, on_original, random_unit_edit, tree_snapshot
+
+
+def parse(parser) -> tuple:
+    tree = parser.parse_program()
+    return tree, parser.errors
+
+
+def snapshot(result) -> tuple:
+    """(program valid?, parse tree bila valid)."""
+    tree, errors = result
+    if errors:
+        return False, None
+    return True, tree_snapshot(tree, [])
+
+
+class LL1ParserTest(DifferentialTestCase):
+    def test_same_as_parser(self):
+        def run(text: str):
+            tokens = Lexer(text, self.dfa).tokenize()
+            return parse(LL1Parser(tokens)), parse(Parser(tokens))
+
+        self.assert_edits_match(on_original(run), random_unit_edit, snapshot,
+                                sources=[("<program 20 prosedur>", program_source(20))], edits=200)
+
+
+if __name__ == "__main__":
+    unittest.main()
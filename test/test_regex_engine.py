@@ -0,0 +1,40 @@
+"""
+Uji engine lexer "regex" terhadap engine "dfa": untuk setiap file dan
+serangkaian variasinya (edit acak), keduanya harus menghasilkan token, status
+fatal_error, dan pesan LexicalError yang sama.
+"""
+import time
+import unittest
+
+from src.lexer.lexer import Lexer
+from test.common import DifferentialTestCase, on_original, random_text_edit
+
+
+def snapshot(lexer: Lexer) -> tuple:
+    tokens = [(t.token_type, t.value, t.line, t.column, t.keyword, t.number) for t in lexer.tokenize()]
+    return tokens, lexer.fatal_error, [str(error) for error in lexer.errors]
+
+
+class RegexEngineTest(DifferentialTestCase):
+    def test_same_as_dfa(self):
+        def run(text: str):
+            return Lexer(text, self.dfa, engine="regex"), Lexer(text, self.dfa)
+
+        self.assert_edits_match(on_original(run), random_text_edit, snapshot)
+
+    def test_unclosed_comment_linear(self):
+        # setiap '(' / '{' memulai scan komentar yang tidak pernah ditutup; tanpa memo
+        # scan engine mengulang scan sampai akhir source untuk setiap token (kuadratik)
+        for opener in ("(* ", "{ "):
+            source = "program a; mulai " + opener * 10_000
+            times, snapshots = [], []
+            for engine in ("regex", "dfa"):
+                start = time.perf_counter()
+                snapshots.append(snapshot(Lexer(source, self.dfa, engine=engine)))
+                times.append(time.perf_counter() - start)
+            with self.subTest(opener):
+                self.assertEqual(snapshots[0], snapshots[1])
+                self.assertLess(times[0], 5 * times[1] + 0.05, f"regex {times[0]:.3f} s, dfa {times[1]:.3f} s")
+
+if __name__ == "__main__":
+    unittest.main()
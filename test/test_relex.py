@@ -0,0 +1,33 @@
+"""
+Uji Lexer.relex: serangkaian edit acak diterapkan berturut-turut pada satu
+lexer, dan setiap hasil relex dibandingkan dengan tokenize() penuh atas teks
+yang sama (token, line/column, keyword, nilai angka, dan fatal_error).
+"""
+import unittest
+
+from src.lexer.lexer import Lexer
+from test.common import DifferentialTestCase, random_text_edit
+
+
+def snapshot(result) -> tuple:
+    tokens, lexer = result
+    return [(t.token_type, t.value, t.line, t.column, t.keyword, t.number) for t in tokens], lexer.fatal_error
+
+
+class RelexTest(DifferentialTestCase):
+    def test_relex_same_as_tokenize(self):
+        def make(source: str):
+            lexer = Lexer(source, self.dfa)
+            tokens = lexer.tokenize()
+
+            def apply(offset: int, removed: int, inserted: str):
+                lexer.relex(tokens, offset, removed, inserted)
+                full = Lexer(lexer.source_code, self.dfa)
+                return lexer.source_code, (tokens, lexer), (full.tokenize(), full)
+            return apply
+
+        self.assert_edits_match(make, random_text_edit, snapshot, edits=200)
+
+
+if __name__ == "__main__":
+    unittest.main()
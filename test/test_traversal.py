@@ -0,0 +1,63 @@
+"""
+Uji ASTTransformer: handler yang mengganti node (BinOp dua literal jadi satu
+NumberLiteral) dan membuang node dari field list (compound statement kosong).
+"""
+import unittest
+
+from src.lexer.dfa_cache import load_compiled_dfa
+from src.lexer.lexer import Lexer
+from src.parser.ast_parser import ASTParser
+from src.semantic.ast import AssignStmt, BinOp, CompoundStmt, NumberLiteral, ProcCallStmt
+from src.semantic.traversal import ASTTransformer, walk_preorder
+
+SOURCE = """program Lipat;
+variabel a: integer;
+mulai
+  a := 1 + 2 * 3;
+  mulai selesai;
+  writeln(a + 4)
+selesai.
+"""
+
+
+class FoldAndPrune(ASTTransformer):
+    def visit_BinOp(self, node: BinOp):
+        node = yield self.generic_visit(node)
+        left, right = node.left, node.right
+        if node.op in ("+", "*") and isinstance(left, NumberLiteral) and isinstance(right, NumberLiteral):
+            a, b = left.evaluated_value, right.evaluated_value
+            value = a + b if node.op == "+" else a * b
+            return NumberLiteral(value=str(value), evaluated_value=value, token_index=node.token_index)
+        return node
+
+    def visit_CompoundStmt(self, node: CompoundStmt):
+        node = yield self.generic_visit(node)
+        return node if node.statements else None
+
+
+class ASTTransformerTest(unittest.TestCase):
+    def test_replace_and_remove(self):
+        tokens = Lexer(SOURCE, load_compiled_dfa()).tokenize()
+        program = ASTParser(tokens).parse_program()
+        body = program.block.body
+        plus_index = body.statements[0].value.token_index
+
+        self.assertIs(FoldAndPrune().visit(program), program)
+
+        # transformasi di tempat: node akar dan list statement yang sama
+        self.assertIs(program.block.body, body)
+        assign, call = body.statements
+        self.assertIsInstance(assign, AssignStmt)
+        self.assertIsInstance(assign.value, NumberLiteral)
+        self.assertEqual((assign.value.evaluated_value, assign.value.token_index), (7, plus_index))
+        self.assertEqual(tokens[plus_index].value, "+")
+
+        # a + 4 tidak dilipat karena a bukan literal
+        self.assertIsInstance(call, ProcCallStmt)
+        self.assertIsInstance(call.args[0], BinOp)
+        self.assertFalse(any(isinstance(node, CompoundStmt) and not node.statements
+                             for node in walk_preorder(program)))
+
+
+if __name__ == "__main__":
+    unittest.main()